@@ -0,0 +1,34 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from .models import normalize_website
+
+
+def deduplicate_companies(company_model, dry_run=False):
+    """
+    Normaliza el sitio web de todas las empresas y elimina las repetidas: de cada grupo de empresas
+    con el mismo sitio web normalizado se conserva la más antigua (menor id).
+
+    La usa el comando dedup_companies; la migración 0002 tiene su propia copia de esta lógica.
+
+    Retorna:
+        tuple[int, int]: (empresas cuyo sitio web se normalizó, empresas eliminadas por repetidas).
+    """
+    groups = defaultdict(list)
+    for company in company_model.objects.order_by("id").only("id", "website"):
+        groups[normalize_website(company.website)].append(company)
+
+    duplicates = [company.id for companies in groups.values() for company in companies[1:]]
+    to_normalize = [
+        companies[0] for website, companies in groups.items() if companies[0].website != website
+    ]
+    if dry_run:
+        return len(to_normalize), len(duplicates)
+
+    with transaction.atomic():
+        company_model.objects.filter(id__in=duplicates).delete()
+        for company in to_normalize:
+            company.website = normalize_website(company.website)
+        company_model.objects.bulk_update(to_normalize, ["website"], batch_size=500)
+    return len(to_normalize), len(duplicates)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from api.dedup import deduplicate_companies
+from api.models import Company
+
+
+class Command(BaseCommand):
+    help = (
+        "Normaliza el sitio web de las empresas y elimina las repetidas (se conserva la de menor id). "
+        "La migración 0002 lo hace automáticamente; use --dry-run para revisar los datos antes de migrar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo muestra cuántas empresas se normalizarían y cuántas se eliminarían.",
+        )
+
+    def handle(self, *args, **options):
+        normalized, deleted = deduplicate_companies(Company, dry_run=options["dry_run"])
+        prefix = "[dry-run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(
+            "{}Sitios web normalizados: {}. Empresas repetidas eliminadas: {}.".format(prefix, normalized, deleted)
+        ))
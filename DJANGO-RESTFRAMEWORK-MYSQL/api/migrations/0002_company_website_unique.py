@@ -0,0 +1,77 @@
+from collections import defaultdict
+from urllib.parse import urlsplit, urlunsplit
+
+from django.db import migrations, models
+
+# La normalización y la eliminación de repetidas se copian aquí (en lugar de importar api.models y
+# api.dedup) para que esta migración siga haciendo lo mismo aunque esos módulos cambien después.
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def normalize_website(url):
+    # Copia de api.models.normalize_website al crear esta migración
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    userinfo, at, host = parts.netloc.rpartition("@")
+    host = host.lower()
+    if ":" in host:
+        hostname, port = host.rsplit(":", 1)
+        if DEFAULT_PORTS.get(scheme) == port:
+            host = hostname
+    return urlunsplit((scheme, userinfo + at + host, parts.path.rstrip("/"), parts.query, ""))
+
+
+def deduplicate(apps, schema_editor):
+    # Las empresas repetidas impedirían crear el índice único sobre website: de cada grupo con el mismo
+    # sitio web normalizado se conserva la más antigua (menor id)
+    Company = apps.get_model("api", "Company")
+    groups = defaultdict(list)
+    for company in Company.objects.order_by("id").only("id", "website"):
+        groups[normalize_website(company.website)].append(company)
+
+    duplicates = [company.id for companies in groups.values() for company in companies[1:]]
+    Company.objects.filter(id__in=duplicates).delete()
+    to_normalize = []
+    for website, companies in groups.items():
+        if companies[0].website != website:
+            companies[0].website = website
+            to_normalize.append(companies[0])
+    Company.objects.bulk_update(to_normalize, ["website"], batch_size=500)
+
+
+def use_binary_collation(apps, schema_editor):
+    # La intercalación por defecto de MySQL no distingue mayúsculas ni acentos: dos sitios web que solo
+    # difieren en la ruta ("/Acerca" y "/acerca") chocarían en el índice único aunque normalize_website
+    # los considere distintos. Con la intercalación binaria la columna compara igual que Python.
+    # SQLite y PostgreSQL ya comparan byte a byte por defecto.
+    connection = schema_editor.connection
+    if connection.vendor != "mysql":
+        return
+    table = apps.get_model("api", "Company")._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT CHARACTER_SET_NAME FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'website'",
+            [table],
+        )
+        charset = cursor.fetchone()[0]
+    schema_editor.execute("ALTER TABLE {} MODIFY {} varchar(100) CHARACTER SET {} COLLATE {}_bin NOT NULL".format(
+        schema_editor.quote_name(table), schema_editor.quote_name("website"), charset, charset,
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='company',
+            name='website',
+            field=models.URLField(max_length=100, unique=True),
+        ),
+        migrations.RunPython(use_binary_collation, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,43 @@
+from urllib.parse import urlsplit, urlunsplit
+
 from django.db import models
 
 # Create your models here.
 
+# Puertos que se omiten en la forma canónica de un sitio web
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def normalize_website(url):
+    """
+    Retorna la forma canónica de la URL de un sitio web, la que se guarda en Company.website:
+    sin espacios alrededor, con el esquema y el dominio en minúsculas, sin el puerto por defecto,
+    sin fragmento (#...) y sin la barra final. Así "HTTPS://Ejemplo.com/" y "https://ejemplo.com"
+    se reconocen como la misma empresa. El usuario y la contraseña (usuario:clave@...) se conservan
+    tal como se escribieron.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    userinfo, at, host = parts.netloc.rpartition("@")
+    host = host.lower()
+    if ":" in host:
+        hostname, port = host.rsplit(":", 1)
+        if DEFAULT_PORTS.get(scheme) == port:
+            host = hostname
+    return urlunsplit((scheme, userinfo + at + host, parts.path.rstrip("/"), parts.query, ""))
+
+
 class Company(models.Model):
     name = models.CharField(max_length=50)
-    website = models.URLField(max_length=100)
+    # Único: es la clave con la que se identifican las empresas en /companies/upsert/. En MySQL la
+    # migración 0002 le asigna una intercalación binaria (distingue mayúsculas, como normalize_website);
+    # una migración que vuelva a alterar esta columna debe conservarla.
+    website = models.URLField(max_length=100, unique=True)
     foundation = models.PositiveIntegerField()
 
+    def save(self, *args, **kwargs):
+        self.website = normalize_website(self.website)
+        super().save(*args, **kwargs)
+
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
@@ -1,7 +1,22 @@
 from rest_framework import serializers
-from .models import Company
+from rest_framework.validators import UniqueValidator
+from .models import Company, normalize_website
+
+
+class WebsiteField(serializers.URLField):
+    # Normaliza la URL antes de validarla, para que la validación de unicidad compare la forma canónica
+    def to_internal_value(self, data):
+        return normalize_website(super().to_internal_value(data))
+
 
 class CompanySerializer(serializers.ModelSerializer):
+    website = WebsiteField(max_length=100, validators=[UniqueValidator(queryset=Company.objects.all())])
+
     class Meta:
         model = Company
         fields = "__all__"
+
+
+class CompanyUpsertSerializer(CompanySerializer):
+    # En /companies/upsert/ un sitio web existente no es un error: la empresa se actualiza
+    website = WebsiteField(max_length=100)
@@ -1,3 +1,114 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from .models import Company
+
+UPSERT_URL = '/api/v1/companies/upsert/'
+LIST_URL = '/api/v1/companies/'
+
+
+class CompanyUpsertTests(APITestCase):
+
+    def test_single_upsert_creates_then_updates(self):
+        data = {'name': 'Acme', 'website': 'https://Acme.com/', 'foundation': 1990}
+        response = self.client.put(UPSERT_URL, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['website'], 'https://acme.com')
+        company_id = response.data['id']
+
+        data = {'name': 'Acme Inc', 'website': 'https://acme.com', 'foundation': 1991}
+        response = self.client.put(UPSERT_URL, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], company_id)
+        self.assertEqual(Company.objects.get().name, 'Acme Inc')
+
+    def test_list_upsert_keeps_request_order(self):
+        Company.objects.create(name='A', website='https://a.com', foundation=2000)
+        response = self.client.put(UPSERT_URL, [
+            {'name': 'C', 'website': 'https://c.com', 'foundation': 2010},
+            {'name': 'A2', 'website': 'https://a.com', 'foundation': 2001},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([company['website'] for company in response.data], ['https://c.com', 'https://a.com'])
+        self.assertEqual(response.data[1]['name'], 'A2')
+        self.assertEqual(Company.objects.count(), 2)
+
+    def test_repeated_website_in_request_last_wins(self):
+        response = self.client.put(UPSERT_URL, [
+            {'name': 'First', 'website': 'https://B.com/', 'foundation': 2000},
+            {'name': 'Last', 'website': 'https://b.com:443', 'foundation': 2001},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        company = Company.objects.get()
+        self.assertEqual((company.name, company.website, company.foundation), ('Last', 'https://b.com', 2001))
+
+    def test_paths_differing_only_in_case_are_distinct(self):
+        response = self.client.put(UPSERT_URL, [
+            {'name': 'Upper', 'website': 'https://i.com/About', 'foundation': 2000},
+            {'name': 'Lower', 'website': 'https://i.com/about', 'foundation': 2001},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([(company['name'], company['website']) for company in response.data],
+                         [('Upper', 'https://i.com/About'), ('Lower', 'https://i.com/about')])
+        self.assertEqual(Company.objects.count(), 2)
+
+    def test_post_rejects_non_normalized_duplicate(self):
+        Company.objects.create(name='D', website='https://d.com', foundation=2000)
+        data = {'name': 'D2', 'website': 'HTTPS://D.com/', 'foundation': 2001}
+        response = self.client.post(LIST_URL, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('website', response.data)
+        self.assertEqual(Company.objects.count(), 1)
+
+
+class DedupCompaniesCommandTests(APITestCase):
+
+    def test_dry_run_only_counts(self):
+        # bulk_create no pasa por save(): guarda los sitios web tal como se escriben
+        Company.objects.bulk_create([
+            Company(name='E1', website='https://E.com/', foundation=2000),
+            Company(name='E2', website='https://e.com', foundation=2001),
+            Company(name='E3', website='https://e.com:443', foundation=2002),
+            Company(name='F', website='https://f.com', foundation=2003),
+        ])
+        out = StringIO()
+        call_command('dedup_companies', '--dry-run', stdout=out)
+        self.assertIn('Sitios web normalizados: 1. Empresas repetidas eliminadas: 2.', out.getvalue())
+        self.assertEqual(Company.objects.count(), 4)
+
+        call_command('dedup_companies', stdout=StringIO())
+        self.assertEqual(sorted(Company.objects.values_list('name', 'website')),
+                         [('E1', 'https://e.com'), ('F', 'https://f.com')])
+
+
+class WebsiteUniqueMigrationTests(APITransactionTestCase):
+    migrate_from = [('api', '0001_initial')]
+    migrate_to = [('api', '0002_company_website_unique')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        # Deja la base de datos con todas las migraciones aplicadas para las demás pruebas
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_dedup_keeps_lowest_id(self):
+        old_apps = self.migrate(self.migrate_from)
+        OldCompany = old_apps.get_model('api', 'Company')
+        first = OldCompany.objects.create(name='G1', website='https://G.com/', foundation=2000)
+        OldCompany.objects.create(name='G2', website='https://g.com', foundation=2001)
+        other = OldCompany.objects.create(name='H', website='https://h.com', foundation=2002)
+
+        new_apps = self.migrate(self.migrate_to)
+        NewCompany = new_apps.get_model('api', 'Company')
+        self.assertEqual(sorted(NewCompany.objects.values_list('id', 'name', 'website')),
+                         [(first.id, 'G1', 'https://g.com'), (other.id, 'H', 'https://h.com')])
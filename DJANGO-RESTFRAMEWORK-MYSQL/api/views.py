@@ -1,9 +1,61 @@
-from rest_framework import viewsets
+from django.db import connection, transaction
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from .models import Company
-from .serializer import CompanySerializer
+from .serializer import CompanySerializer, CompanyUpsertSerializer
 
 # Create your views here.
 
+# Filas por sentencia INSERT en /companies/upsert/ (limita el tamaño de cada sentencia enviada a MySQL)
+UPSERT_BATCH_SIZE = 1000
+
+
 class CompanyViewSet(viewsets.ModelViewSet):
     queryset = Company.objects.all()
-    serializer_class = CompanySerializer
\ No newline at end of file
+    serializer_class = CompanySerializer
+
+    @action(detail=False, methods=['put'], url_path='upsert', serializer_class=CompanyUpsertSerializer)
+    def upsert(self, request):
+        """
+        Crea o actualiza empresas identificándolas por su sitio web (normalizado), en una sola solicitud
+        y sin consultar antes si existen. Acepta un objeto o una lista de objetos y responde con las
+        empresas resultantes, en el mismo formato que el listado.
+
+        Cada lote de hasta UPSERT_BATCH_SIZE empresas se escribe con una sola sentencia
+        (INSERT ... ON DUPLICATE KEY UPDATE en MySQL, INSERT ... ON CONFLICT en PostgreSQL y SQLite),
+        de modo que dos clientes que envían la misma empresa a la vez no crean duplicados.
+        """
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
+        serializer.is_valid(raise_exception=True)
+        records = serializer.validated_data if many else [serializer.validated_data]
+
+        # Si un sitio web se repite dentro de la solicitud, prevalece el último registro
+        by_website = {record['website']: record for record in records}
+        companies = [Company(**record) for record in by_website.values()]
+
+        with transaction.atomic():
+            if connection.features.supports_update_conflicts:
+                # MySQL no admite indicar la restricción del conflicto: ON DUPLICATE KEY UPDATE usa
+                # cualquier índice único (aquí, el de website).
+                unique_fields = ['website'] if connection.features.supports_update_conflicts_with_target else None
+                Company.objects.bulk_create(
+                    companies,
+                    batch_size=UPSERT_BATCH_SIZE,
+                    update_conflicts=True,
+                    update_fields=['name', 'foundation'],
+                    unique_fields=unique_fields,
+                )
+            else:
+                for company in companies:
+                    Company.objects.update_or_create(
+                        website=company.website,
+                        defaults={'name': company.name, 'foundation': company.foundation},
+                    )
+
+        # bulk_create no asigna los id con ON DUPLICATE KEY UPDATE: se leen de vuelta y se retornan en el
+        # orden de la solicitud, para que el cliente pueda emparejar cada respuesta con su registro
+        saved = {company.website: company for company in Company.objects.filter(website__in=by_website)}
+        data = CompanySerializer([saved[website] for website in by_website], many=True).data
+        return Response(data if many else data[0], status=status.HTTP_200_OK)
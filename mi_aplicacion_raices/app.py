@@ -1,19 +1,174 @@
-from flask import Flask, render_template, request, redirect, url_for
-from methods.biseccion import biseccion
-from methods.falsa_posicion import falsa_posicion
-from methods.punto_fijo import punto_fijo
-from methods.newton_raphson import newton_raphson
-from methods.secante import secante
-from utils.parser import parse_function, parse_function_g, parse_derivative
-from utils.plot import generate_plot
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from contextlib import nullcontext
 
+from flask import (Flask, render_template, request, redirect, url_for, send_from_directory, abort, jsonify,
+                   Response, stream_with_context, g)
+from utils.cache import crear_cache, clave_problema
+from utils.ejecutor import PoolResolucion, ErrorPool
+from utils.metricas import Cronometro, Metricas, tasa_aciertos, iniciar_perfil, guardar_perfil
+from utils.resolver import (METODOS, resolver_problema, resolver_lote, resultado_json, iterar_problema,
+                            intervalo_grafica, a_json)
 
-# Funciones de ayuda para parsear la función ingresada
-from utils.parser import parse_function, parse_function_g, parse_derivative
-# Función para generar el gráfico (debes implementarla según tus necesidades)
-from utils.plot import generate_plot
+# utils.plot (NumPy y, para las imágenes PNG, Matplotlib) se importa dentro de las vistas que lo usan:
+# la página principal y cada proceso del servidor arrancan sin cargar las bibliotecas pesadas.
+# Para cargarlas de antemano (por ejemplo, con "gunicorn --preload", de modo que los workers compartan
+# esa memoria) se define la variable de entorno RAICES_PRECARGAR=1 o se llama a precargar().
 
 app = Flask(__name__)
+# Si es True la gráfica se genera como imagen PNG en el servidor; si es False (por defecto)
+# el navegador la dibuja a partir de los puntos que entrega /api/grafica.
+app.config.setdefault("GRAFICA_EN_SERVIDOR", False)
+# Número máximo de problemas aceptados en una sola llamada a /api/solve/batch
+app.config.setdefault("MAX_LOTE", 10000)
+# Ejecución aislada: los problemas se resuelven en un pool de procesos con límites de tiempo y memoria,
+# para que una función patológica no bloquee al servidor. Con False se resuelven en el propio proceso.
+app.config.setdefault("EJECUCION_AISLADA", True)
+app.config.setdefault("PROCESOS", None)  # None = un proceso por núcleo
+app.config.setdefault("TIEMPO_LIMITE", 10.0)  # Segundos por problema
+app.config.setdefault("LIMITE_MEMORIA", 1024 ** 3)  # Bytes por proceso
+app.config.setdefault("TIEMPO_LIMITE_TRANSMISION", 60.0)  # Segundos por problema transmitido en vivo
+app.config.setdefault("TIEMPO_ESPERA_POOL", None)  # Segundos de espera por un proceso libre (None = TIEMPO_LIMITE)
+# Caché de resultados: los problemas repetidos (mismo método, función, intervalo, tolerancia, ...) se
+# responden sin volver a resolverlos. "memoria" es por proceso; "sqlite" se comparte entre todos los
+# workers del servidor (por ejemplo, gunicorn) a través de un archivo local. None la desactiva.
+app.config.setdefault("CACHE_RESULTADOS", "memoria")
+app.config.setdefault("CACHE_MAX_BYTES", 64 * 1024 ** 2)
+app.config.setdefault("CACHE_TTL", 3600)  # Segundos
+app.config.setdefault("CACHE_RUTA", os.path.join(app.instance_path, "resultados.sqlite3"))
+# Instrumentación: con METRICAS cada respuesta lleva la cabecera Server-Timing con el tiempo de cada etapa
+# (parse, solve, plot, render, cache y, con ejecución aislada, pool: espera y comunicación con el pool) y
+# los acumulados del proceso se consultan en /metrics. PERFILADO_MUESTREO es la fracción de solicitudes
+# (entre 0 y 1) que se perfilan con cProfile; cada perfil se guarda en PERFILADO_DIRECTORIO.
+app.config.setdefault("METRICAS", False)
+app.config.setdefault("PERFILADO_MUESTREO", 0.0)
+app.config.setdefault("PERFILADO_DIRECTORIO", os.path.join(app.instance_path, "perfiles"))
+
+_pool = None
+_candado_pool = threading.Lock()
+_cache = None
+_candado_cache = threading.Lock()
+_metricas = Metricas()
+
+
+def precargar():
+    # Importa los módulos pesados y compila una expresión de prueba antes de la primera solicitud
+    from utils import plot, resolver as resolucion
+    resolucion.precargar()
+    if app.config["GRAFICA_EN_SERVIDOR"]:
+        plot.precargar()
+
+
+def obtener_pool():
+    # El pool se crea (y precalienta) una sola vez, en la primera solicitud que lo necesita
+    global _pool
+    with _candado_pool:
+        if _pool is None:
+            _pool = PoolResolucion(
+                procesos=app.config["PROCESOS"],
+                timeout=app.config["TIEMPO_LIMITE"],
+                limite_memoria=app.config["LIMITE_MEMORIA"],
+                espera=app.config["TIEMPO_ESPERA_POOL"],
+            )
+            atexit.register(_pool.cerrar)
+        return _pool
+
+
+def obtener_cache():
+    # La caché se crea con la configuración vigente en la primera solicitud que la usa
+    global _cache
+    with _candado_cache:
+        if _cache is None and app.config["CACHE_RESULTADOS"]:
+            _cache = crear_cache(
+                app.config["CACHE_RESULTADOS"],
+                max_bytes=app.config["CACHE_MAX_BYTES"],
+                ttl=app.config["CACHE_TTL"],
+                ruta=app.config["CACHE_RUTA"],
+            )
+        return _cache
+
+
+def etapa(nombre):
+    # Cronometra un bloque como la etapa 'nombre' de la solicitud actual (sin efecto si METRICAS es False)
+    cronometro = g.get("cronometro")
+    return cronometro.etapa(nombre) if cronometro is not None else nullcontext()
+
+
+@app.before_request
+def iniciar_instrumentacion():
+    if app.config["METRICAS"]:
+        g.cronometro = Cronometro()
+    muestreo = app.config["PERFILADO_MUESTREO"]
+    if muestreo and random.random() < muestreo:
+        g.perfil = iniciar_perfil()
+
+
+@app.after_request
+def terminar_instrumentacion(respuesta):
+    # En /resultados/stream la respuesta sale antes de calcular las iteraciones: sus tiempos y su perfil
+    # solo cubren la validación inicial.
+    perfil = g.pop("perfil", None)
+    if perfil is not None:
+        guardar_perfil(perfil, app.config["PERFILADO_DIRECTORIO"], request.endpoint or "desconocido")
+    cronometro = g.pop("cronometro", None)
+    if cronometro is not None and request.endpoint != "metricas":
+        respuesta.headers["Server-Timing"] = cronometro.server_timing()
+        if cronometro.evaluaciones:
+            respuesta.headers["X-Evaluaciones"] = str(cronometro.evaluaciones)
+        _metricas.registrar(request.endpoint or "desconocido", cronometro)
+    return respuesta
+
+
+def codigo_error(e):
+    # Código HTTP de un problema que no se pudo resolver: los límites de tiempo y los fallos del pool de
+    # procesos son errores del servidor; el resto (análisis, validación, método numérico) son del cliente
+    if isinstance(e, TimeoutError):
+        return 504
+    if isinstance(e, ErrorPool):
+        return 503
+    return 400
+
+
+def _contar_problema(cronometro, resultado):
+    # Suma las evaluaciones de un problema resuelto (no de un acierto de la caché) a las métricas
+    if cronometro is not None:
+        cronometro.evaluaciones += resultado.get("evaluaciones") or 0
+        _metricas.contar_problema(resultado.get("evaluaciones") or 0)
+
+
+def resolver(spec, incluir_iteraciones=True):
+    # Punto único de resolución: primero se consulta la caché; si no está, en el pool de procesos
+    # o, si está desactivado, en este proceso. Solo se guardan los resultados correctos.
+    cronometro = g.get("cronometro")
+    cache = obtener_cache()
+    clave = clave_problema(spec, incluir_iteraciones) if cache is not None else None
+    if clave is not None:
+        with etapa("cache"):
+            resultado = cache.obtener(clave)
+        if cronometro is not None:
+            cronometro.cache = "hit" if resultado is not None else "miss"
+        if resultado is not None:
+            return resultado
+    inicio = time.perf_counter()
+    if app.config["EJECUCION_AISLADA"]:
+        resultado = obtener_pool().resolver(spec, incluir_iteraciones)
+    else:
+        resultado = resolver_problema(spec, incluir_iteraciones)
+    # Tiempos de análisis y resolución medidos donde se resolvió el problema (no se guardan en la caché)
+    tiempos = resultado.pop("tiempos", {})
+    if cronometro is not None:
+        for nombre, segundos in tiempos.items():
+            cronometro.sumar(nombre, segundos)
+        if app.config["EJECUCION_AISLADA"]:
+            cronometro.sumar("pool", max(0.0, time.perf_counter() - inicio - sum(tiempos.values())))
+        _contar_problema(cronometro, resultado)
+    if clave is not None:
+        cache.guardar(clave, resultado)
+    return resultado
 
 
 @app.route("/")
@@ -26,75 +181,188 @@ def resultados():
     # Se extraen los datos del formulario
     metodo = request.form.get("metodo")
     funcion_input = request.form.get("funcion")
-    tol = float(request.form.get("tolerancia"))
-    max_iter = int(request.form.get("max_iter", 100))
 
-    # Se definirán variables para el intervalo o aproximaciones según el método
-    resultados_metodo = []
-    plot_path = None  # Ruta de la imagen generada para la gráfica
+    if metodo not in METODOS:
+        # En caso de que el método no sea reconocido, se redirige a la página principal.
+        return redirect(url_for("index"))
+
+    if request.form.get("en_vivo"):
+        # Modo en vivo: la página se muestra de inmediato y las iteraciones llegan por /resultados/stream
+        spec = {campo: valor for campo, valor in request.form.items() if campo != "en_vivo"}
+        with etapa("render"):
+            return render_template("resultados.html", datos=[], stream_url=url_for("resultados_stream", **spec))
 
     try:
-        if metodo == "biseccion":
-            # Se espera que el formulario tenga campos 'a' y 'b'
-            a = float(request.form.get("a"))
-            b = float(request.form.get("b"))
-            f = parse_function(funcion_input)
-            resultados_metodo = biseccion(f, a, b, tol, max_iter)
-            # Genera la gráfica en el intervalo [a, b] marcando la raíz final
-            plot_path = generate_plot(funcion_input, a, b, resultados_metodo[-1]["xr"])
-
-        elif metodo == "falsa_posicion":
-            a = float(request.form.get("a"))
-            b = float(request.form.get("b"))
-            f = parse_function(funcion_input)
-            resultados_metodo = falsa_posicion(f, a, b, tol, max_iter)
-            plot_path = generate_plot(funcion_input, a, b, resultados_metodo[-1]["xr"])
-
-        elif metodo == "punto_fijo":
-            # Para este método, se espera que el usuario ingrese el valor inicial 'x0'
-            # y que la función ingresada sea g(x) de la forma x = g(x)
-            x0 = float(request.form.get("x0"))
-            g = parse_function_g(funcion_input)
-            resultados_metodo = punto_fijo(g, x0, tol, max_iter)
-            # Para la gráfica, se puede definir un intervalo alrededor del resultado final
-            xr_final = resultados_metodo[-1]["x_new"]
-            a = xr_final - 5
-            b = xr_final + 5
-            plot_path = generate_plot(funcion_input, a, b, xr_final)
-
-        elif metodo == "newton_raphson":
-            # Se espera que el usuario ingrese el valor inicial 'x0'
-            # y también la derivada de la función en un campo 'derivada'
-            x0 = float(request.form.get("x0"))
-            f = parse_function(funcion_input)
-            df_input = request.form.get("derivada")
-            df = parse_derivative(df_input)
-            resultados_metodo = newton_raphson(f, df, x0, tol, max_iter)
-            xr_final = resultados_metodo[-1]["x_new"]
-            a = xr_final - 5
-            b = xr_final + 5
-            plot_path = generate_plot(funcion_input, a, b, xr_final)
-
-        elif metodo == "secante":
-            # Se esperan dos aproximaciones iniciales: 'x0' y 'x1'
-            x0 = float(request.form.get("x0"))
-            x1 = float(request.form.get("x1"))
-            f = parse_function(funcion_input)
-            resultados_metodo = secante(f, x0, x1, tol, max_iter)
-            xr_final = resultados_metodo[-1]["x_new"]
-            a = xr_final - 5
-            b = xr_final + 5
-            plot_path = generate_plot(funcion_input, a, b, xr_final)
+        # El formulario tiene los mismos campos que la especificación de un problema
+        # (metodo, funcion, tolerancia, max_iter, a, b, x0, x1, derivada, ...)
+        resultado = resolver(request.form)
+    except Exception as e:
+        # El error se muestra sobre el formulario, con el código HTTP que le corresponde
+        with etapa("render"):
+            return render_template("index.html", error=str(e)), codigo_error(e)
+    resultados_metodo = resultado["datos"]
 
-        else:
-            # En caso de que el método no sea reconocido, se redirige a la página principal.
-            return redirect(url_for("index"))
+    # Por defecto la gráfica se dibuja en el navegador con los puntos de /api/grafica;
+    # con GRAFICA_EN_SERVIDOR se genera en su lugar una imagen PNG en el servidor.
+    # Los sistemas de ecuaciones no tienen gráfica (resultado["grafica"] es None).
+    plot_path = plot_url = None
+    if resultado["grafica"] is not None:
+        a, b, raices = resultado["grafica"]  # Intervalo y raíces a graficar
+        with etapa("plot"):
+            if app.config["GRAFICA_EN_SERVIDOR"]:
+                from utils.plot import generate_plot
+                plot_path = generate_plot(funcion_input, a, b, raices)
+            else:
+                plot_url = url_for("datos_grafica", funcion=funcion_input, a=a, b=b, raiz=raices)
+
+    # Renderiza la plantilla de resultados pasando la tabla de iteraciones y la gráfica.
+    with etapa("render"):
+        return render_template("resultados.html", datos=resultados_metodo, plot_path=plot_path,
+                               plot_url=plot_url, orden=resultado.get("orden_convergencia"))
+
+
+@app.route("/resultados/stream")
+def resultados_stream():
+    # Server-Sent Events: cada iteración se envía al navegador en cuanto se calcula, sin esperar
+    # ni guardar la tabla completa. Al terminar se envía el evento "fin" con la raíz y la gráfica.
+    spec = request.args.to_dict()
+
+    def evento(datos, nombre=None):
+        cabecera = "event: {}\n".format(nombre) if nombre else ""
+        return "{}data: {}\n\n".format(cabecera, json.dumps(a_json(datos)))
+
+    def eventos():
+        ultima = None
+        raices = []  # Solo se acumulan en los métodos que retornan varias raíces (pocas filas)
+        filas = None
+        cancelado = threading.Event()
+        try:
+            if app.config["EJECUCION_AISLADA"]:
+                filas = obtener_pool().transmitir(spec, app.config["TIEMPO_LIMITE_TRANSMISION"], cancelado)
+            else:
+                filas = iterar_problema(spec)
+            for fila in filas:
+                ultima = fila
+                if spec.get("metodo") in ("buscar_raices", "polinomio"):
+                    raices.append(fila["xr"])
+                yield evento(fila)
+            if spec.get("metodo") in ("buscar_raices", "polinomio"):
+                raiz = raices
+            elif ultima is not None:
+                raiz = ultima["xr"] if "xr" in ultima else ultima["x_new"]
+            else:
+                raiz = None
+            plot_url = None
+            grafica = intervalo_grafica(spec, raiz) if raiz is not None else None
+            if grafica is not None:
+                a, b, reales = grafica
+                plot_url = url_for("datos_grafica", funcion=spec.get("funcion"), a=a, b=b, raiz=reales)
+        except Exception as e:
+            # La respuesta ya se envió con código 200: el código del error viaja en el evento
+            yield evento({"error": str(e), "codigo": codigo_error(e)}, "fallo")
+            return
+        finally:
+            # Si el cliente se desconecta, el servidor cierra este generador (GeneratorExit en el yield):
+            # el cálculo se cancela aquí mismo, sin esperar a que el recolector de basura cierre 'filas',
+            # y el proceso de cálculo vuelve al pool
+            cancelado.set()
+            if hasattr(filas, "close"):
+                filas.close()
+        yield evento({"raiz": raiz, "plot_url": plot_url}, "fin")
+
+    return Response(stream_with_context(eventos()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.route("/graficas/<nombre>")
+def grafica(nombre):
+    # La gráfica se genera en segundo plano; aquí se espera a que esté lista antes de servirla
+    from utils.plot import esperar_grafica, DIRECTORIO_GRAFICAS
+    try:
+        with etapa("plot"):
+            ruta = esperar_grafica(nombre)
+    except TimeoutError:
+        # La imagen aún se está dibujando: el navegador puede volver a pedirla
+        return "La gráfica aún se está generando.", 503, {"Retry-After": "2"}
+    except Exception:
+        # El dibujo falló, así que la imagen no existe; el error queda en el log del servidor
+        app.logger.exception("No se pudo generar la gráfica %s", nombre)
+        abort(404)
+    if ruta is None:
+        abort(404)
+    return send_from_directory(DIRECTORIO_GRAFICAS, nombre)
+
+
+@app.route("/api/grafica")
+def datos_grafica():
+    # Puntos (x, f(x)) para que el navegador dibuje la gráfica sin generar imágenes en el servidor
+    from utils.plot import muestrear_funcion
+    try:
+        funcion_input = request.args["funcion"]
+        a = float(request.args["a"])
+        b = float(request.args["b"])
+        raices = [float(r) for r in request.args.getlist("raiz")]
+        with etapa("plot"):
+            datos = muestrear_funcion(funcion_input, a, b, raices)
+    except Exception as e:
+        return jsonify(error=str(e)), codigo_error(e)
+    return jsonify(datos)
+
+
+@app.route("/api/solve", methods=["POST"])
+def api_solve():
+    # Resuelve un problema descrito en JSON y retorna un resultado compacto
+    # (raíz, iteraciones, residuo, evaluaciones); la tabla de iteraciones es opcional.
+    spec = request.get_json(silent=True)
+    if not isinstance(spec, dict):
+        return jsonify(error="El cuerpo de la solicitud debe ser un objeto JSON."), 400
+    try:
+        resultado = resolver(spec, bool(spec.get("incluir_iteraciones", False)))
     except Exception as e:
-        # En caso de error se podría enviar un mensaje al usuario o redirigir a una página de error.
-        return render_template("error.html", mensaje=str(e))
+        return jsonify(error=str(e)), codigo_error(e)
+    return jsonify(resultado_json(resultado))
+
+
+@app.route("/api/solve/batch", methods=["POST"])
+def api_solve_batch():
+    # Resuelve muchos problemas en una sola llamada. Acepta una lista de problemas o un objeto
+    # {"problemas": [...], "incluir_iteraciones": false}; los errores se reportan por problema.
+    cuerpo = request.get_json(silent=True)
+    if isinstance(cuerpo, dict):
+        problemas = cuerpo.get("problemas")
+        incluir_iteraciones = bool(cuerpo.get("incluir_iteraciones", False))
+    else:
+        problemas = cuerpo
+        incluir_iteraciones = False
+    if not isinstance(problemas, list):
+        return jsonify(error="Se esperaba una lista de problemas."), 400
+    if len(problemas) > app.config["MAX_LOTE"]:
+        return jsonify(error="El lote supera el máximo de {} problemas.".format(app.config["MAX_LOTE"])), 400
+    # En los lotes solo se mide el tiempo total de resolución (sin separar el análisis de cada función)
+    with etapa("solve"):
+        if app.config["EJECUCION_AISLADA"]:
+            resultados_lote = obtener_pool().resolver_lote(problemas, incluir_iteraciones)
+        else:
+            resultados_lote = resolver_lote(problemas, incluir_iteraciones)
+    for resultado in resultados_lote:
+        if "error" not in resultado:
+            _contar_problema(g.get("cronometro"), resultado)
+    return jsonify(resultados=resultados_lote)
+
+
+@app.route("/metrics")
+def metricas():
+    # Acumulados de este proceso: tiempos por etapa, evaluaciones y tasa de aciertos de la caché
+    if not app.config["METRICAS"]:
+        abort(404)
+    datos = _metricas.instantanea()
+    cache = obtener_cache()
+    datos["cache"] = tasa_aciertos(cache.estadisticas()) if cache is not None else None
+    return jsonify(datos)
+
 
-    # Renderiza la plantilla de resultados pasando la tabla de iteraciones y la ruta de la gráfica.
-    return render_template("resultados.html", datos=resultados_metodo, plot_path=plot_path)
+if os.environ.get("RAICES_PRECARGAR"):
+    precargar()
 
 
 if __name__ == "__main__":
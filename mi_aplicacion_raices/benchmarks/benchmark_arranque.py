@@ -0,0 +1,120 @@
+# benchmarks/benchmark_arranque.py
+#
+# Mide el arranque en frío de la aplicación:
+#   - tiempo de importación de app, desglosado por paquete con "python -X importtime",
+#   - tiempo hasta la primera respuesta (página principal, primera resolución y primera gráfica),
+#   - memoria residente máxima del proceso después de cada paso.
+# Cada medición se hace en un intérprete nuevo, con y sin el gancho de precarga (RAICES_PRECARGAR=1).
+#
+# Uso (desde la carpeta mi_aplicacion_raices):
+#     python benchmarks/benchmark_arranque.py
+#     python benchmarks/benchmark_arranque.py --salida arranque.json
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Programa que ejecuta cada intérprete nuevo; imprime los tiempos (ms) y la memoria (KiB) en JSON
+_PROGRAMA = """
+import json, resource, time
+inicio = time.perf_counter()
+import app
+medidas = {"importar_ms": (time.perf_counter() - inicio) * 1e3}
+app.app.config["EJECUCION_AISLADA"] = False
+app.app.config["CACHE_RESULTADOS"] = None
+cliente = app.app.test_client()
+
+def paso(nombre, solicitud):
+    t = time.perf_counter()
+    respuesta = solicitud()
+    assert respuesta.status_code == 200, respuesta.status_code
+    medidas[nombre + "_ms"] = (time.perf_counter() - t) * 1e3
+    medidas[nombre + "_rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+paso("indice", lambda: cliente.get("/"))
+paso("resolver", lambda: cliente.post("/api/solve", json={
+    "metodo": "biseccion", "funcion": "cos(x) - x", "a": 0, "b": 1, "tolerancia": 1e-8}))
+paso("grafica", lambda: cliente.get("/api/grafica?funcion=cos(x)-x&a=0&b=1&raiz=0.739"))
+medidas["total_ms"] = (time.perf_counter() - inicio) * 1e3
+print(json.dumps(medidas))
+"""
+
+
+def importtime(entorno):
+    """
+    Ejecuta "python -X importtime -c 'import app'" y retorna (tiempo total en ms, lista de
+    (paquete, ms acumulados) de los paquetes que importa app directamente, de mayor a menor).
+    """
+    salida = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app"], cwd=RAIZ, env=entorno,
+                            capture_output=True, text=True, check=True).stderr
+    paquetes = {}
+    total = 0.0
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        nivel = (len(nombre) - len(nombre.lstrip()) - 1) // 2
+        if nivel == 0:
+            # Los módulos anidados aparecen antes que el módulo que los importa
+            if nombre.strip() == "app":
+                total = int(acumulado) / 1e3
+                break
+            paquetes = {}
+        elif nivel == 1:
+            raiz = nombre.strip().split(".")[0]
+            paquetes[raiz] = paquetes.get(raiz, 0) + int(acumulado) / 1e3
+    return total, sorted(paquetes.items(), key=lambda p: -p[1])
+
+
+def primera_solicitud(entorno, repeticiones):
+    """Ejecuta _PROGRAMA 'repeticiones' veces y retorna la mediana de cada medida."""
+    corridas = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", _PROGRAMA], cwd=RAIZ, env=entorno,
+                                capture_output=True, text=True, check=True).stdout
+        corridas.append(json.loads(salida.strip().splitlines()[-1]))
+    return {clave: statistics.median(c[clave] for c in corridas) for clave in corridas[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del arranque en frío de la aplicación.")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--salida", help="Archivo donde guardar el informe en JSON.")
+    args = parser.parse_args()
+
+    informe = {}
+    for nombre, precarga in (("por_demanda", None), ("precarga", "1")):
+        entorno = dict(os.environ)
+        entorno.pop("RAICES_PRECARGAR", None)
+        if precarga:
+            entorno["RAICES_PRECARGAR"] = precarga
+        total, paquetes = importtime(entorno)
+        informe[nombre] = {
+            "importtime_ms": total,
+            "paquetes_ms": dict(paquetes[:8]),
+            "primera_solicitud": primera_solicitud(entorno, args.repeticiones),
+        }
+
+    for nombre, datos in informe.items():
+        medidas = datos["primera_solicitud"]
+        print("== {} ==".format(nombre))
+        print("importtime de app: {:.1f} ms".format(datos["importtime_ms"]))
+        print("  " + ", ".join("{} {:.1f} ms".format(p, ms) for p, ms in datos["paquetes_ms"].items()))
+        for paso in ("importar", "indice", "resolver", "grafica", "total"):
+            linea = "{:<10} {:>8.1f} ms".format(paso, medidas[paso + "_ms"])
+            if paso + "_rss_kib" in medidas:
+                linea += "   RSS máx. {:>8.1f} MiB".format(medidas[paso + "_rss_kib"] / 1024)
+            print(linea)
+        print()
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
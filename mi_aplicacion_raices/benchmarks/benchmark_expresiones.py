@@ -0,0 +1,111 @@
+# benchmarks/benchmark_expresiones.py
+#
+# Compara el compilador liviano de expresiones (utils.expresiones) con SymPy (sympify + lambdify):
+#   - tiempo de importación de utils.parser en un intérprete nuevo,
+#   - latencia de análisis y compilación de cada expresión (sin caché),
+#   - tiempo de evaluación de la función compilada (escalar con math y vectorizada con NumPy).
+#
+# Uso (desde la carpeta mi_aplicacion_raices):
+#     python benchmarks/benchmark_expresiones.py
+#     python benchmarks/benchmark_expresiones.py --salida expresiones.json
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+EXPRESIONES = [
+    "x**3 - x - 2",
+    "(x - 1)**5",
+    "cos(x) - x",
+    "exp(-x) - x",
+    "x*exp(x) - 1",
+    "atan(50*(x - 0.3))",
+    "sqrt(x**2 + 1) - 2*sin(x)",
+    "log(x) + x**2 - 3",
+]
+
+
+def tiempo_importacion(modulo, repeticiones):
+    """Mediana, en milisegundos, del tiempo de importar 'modulo' en un intérprete nuevo."""
+    codigo = ("import time; t = time.perf_counter(); import {}; "
+              "print(time.perf_counter() - t)").format(modulo)
+    tiempos = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+        tiempos.append(float(salida.stdout) * 1e3)
+    return statistics.median(tiempos)
+
+
+def _mejor(funcion, repeticiones):
+    """Mínimo, en microsegundos, de 'repeticiones' llamadas a funcion()."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1e6
+
+
+def compilar_sympy(texto, modulo):
+    import sympy
+    x = sympy.Symbol('x')
+    return sympy.lambdify(x, sympy.sympify(texto), modulo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del compilador de expresiones frente a SymPy.")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--salida", help="Archivo donde guardar el informe en JSON.")
+    args = parser.parse_args()
+
+    import numpy as np
+    from utils.parser import _compilar
+
+    informe = {
+        "importacion_ms": {
+            "utils.parser": tiempo_importacion("utils.parser", 5),
+            "sympy": tiempo_importacion("sympy", 5),
+        },
+        "expresiones": [],
+    }
+    xs = np.linspace(0.1, 3.0, 10000)
+    for texto in EXPRESIONES:
+        f_rapida = _compilar.__wrapped__(texto, "math")  # Sin la caché de _compilar
+        f_sympy = compilar_sympy(texto, "math")
+        v_rapida = _compilar.__wrapped__(texto, "numpy")
+        v_sympy = compilar_sympy(texto, "numpy")
+        informe["expresiones"].append({
+            "expresion": texto,
+            "analisis_us": _mejor(lambda: _compilar.__wrapped__(texto, "math"), args.repeticiones),
+            "analisis_sympy_us": _mejor(lambda: compilar_sympy(texto, "math"), args.repeticiones),
+            "evaluacion_ns": _mejor(lambda: [f_rapida(1.3) for _ in range(1000)], args.repeticiones),
+            "evaluacion_sympy_ns": _mejor(lambda: [f_sympy(1.3) for _ in range(1000)], args.repeticiones),
+            "vectorizada_us": _mejor(lambda: v_rapida(xs), args.repeticiones),
+            "vectorizada_sympy_us": _mejor(lambda: v_sympy(xs), args.repeticiones),
+        })
+
+    print("Importación de utils.parser: {:.1f} ms (SymPy solo: {:.1f} ms)".format(
+        informe["importacion_ms"]["utils.parser"], informe["importacion_ms"]["sympy"]))
+    print()
+    encabezado = "{:<28} {:>12} {:>12} {:>10} {:>10} {:>12} {:>12}".format(
+        "expresion", "analisis_us", "sympy_us", "eval_ns", "sympy_ns", "vector_us", "sympy_us")
+    print(encabezado)
+    print("-" * len(encabezado))
+    for r in informe["expresiones"]:
+        print("{:<28} {:>12.1f} {:>12.1f} {:>10.1f} {:>10.1f} {:>12.1f} {:>12.1f}".format(
+            r["expresion"], r["analisis_us"], r["analisis_sympy_us"], r["evaluacion_ns"],
+            r["evaluacion_sympy_ns"], r["vectorizada_us"], r["vectorizada_sympy_us"]))
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# benchmarks/benchmark_metodos.py
+#
+# Compara los métodos numéricos sobre un catálogo de funciones de prueba.
+# Para cada función y método reporta evaluaciones de f, iteraciones, tiempo y exactitud obtenida.
+#
+# Uso (desde la carpeta mi_aplicacion_raices):
+#     python benchmarks/benchmark_metodos.py
+#     python benchmarks/benchmark_metodos.py --salida base.json
+#     python benchmarks/benchmark_metodos.py --comparar base.json   # muestra mejoras y regresiones
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from methods.biseccion import biseccion
+from methods.falsa_posicion import falsa_posicion
+from methods.punto_fijo import punto_fijo
+from methods.newton_raphson import newton_raphson
+from methods.secante import secante
+from methods.newton_seguro import newton_seguro
+from methods.punto_fijo_seguro import punto_fijo_seguro
+from methods.punto_fijo_acelerado import punto_fijo_acelerado
+from utils.parser import parse_function, parse_function_g, parse_derivative
+from utils.resolver import ContadorEvaluaciones, orden_convergencia
+
+METODOS = ("biseccion", "falsa_posicion", "punto_fijo", "punto_fijo_aitken", "punto_fijo_steffensen",
+           "newton_raphson", "secante", "newton_seguro", "punto_fijo_seguro")
+# Variantes aceleradas que se comparan con el punto fijo sin acelerar
+ACELERADOS = ("punto_fijo_aitken", "punto_fijo_steffensen")
+
+# Catálogo de funciones de prueba. Cada entrada trae la raíz exacta (o calculada con precisión de máquina),
+# un intervalo con cambio de signo, los puntos iniciales y, para punto fijo, una forma x = g(x).
+CATALOGO = [
+    # Polinomios
+    {"nombre": "cubica", "categoria": "polinomio", "funcion": "x**3 - x - 2", "derivada": "3*x**2 - 1",
+     "g": "(x + 2)**(1/3)", "a": 1, "b": 2, "x0": 1.5, "x1": 2, "raiz": 1.5213797068045676},
+    {"nombre": "raiz_de_2", "categoria": "polinomio", "funcion": "x**2 - 2", "derivada": "2*x",
+     "g": "x - (x**2 - 2)/4", "a": 0, "b": 2, "x0": 1, "x1": 2, "raiz": math.sqrt(2)},
+    {"nombre": "wilkinson_5", "categoria": "polinomio",
+     "funcion": "(x - 1)*(x - 2)*(x - 3)*(x - 4)*(x - 5)",
+     "derivada": "5*x**4 - 60*x**3 + 255*x**2 - 450*x + 274",
+     "g": None, "a": 2.5, "b": 3.7, "x0": 3.3, "x1": 3.4, "raiz": 3.0},
+    # Trascendentes
+    {"nombre": "coseno", "categoria": "trascendente", "funcion": "cos(x) - x", "derivada": "-sin(x) - 1",
+     "g": "cos(x)", "a": 0, "b": 1, "x0": 0.5, "x1": 1, "raiz": 0.7390851332151607},
+    {"nombre": "exponencial", "categoria": "trascendente", "funcion": "exp(-x) - x", "derivada": "-exp(-x) - 1",
+     "g": "exp(-x)", "a": 0, "b": 1, "x0": 0.5, "x1": 1, "raiz": 0.5671432904097838},
+    {"nombre": "logaritmo", "categoria": "trascendente", "funcion": "log(x) + x", "derivada": "1/x + 1",
+     "g": "exp(-x)", "a": 0.1, "b": 1, "x0": 0.5, "x1": 1, "raiz": 0.5671432904097838},
+    # Rígidas: pendiente muy grande o muy pequeña lejos de la raíz
+    {"nombre": "arcotangente", "categoria": "rigida", "funcion": "atan(50*(x - 0.3))",
+     "derivada": "50/(1 + 2500*(x - 0.3)**2)", "g": "x - atan(50*(x - 0.3))/50",
+     "a": 0, "b": 1, "x0": 0.31, "x1": 0.32, "raiz": 0.3},
+    {"nombre": "exponencial_rigida", "categoria": "rigida", "funcion": "exp(20*x) - 20",
+     "derivada": "20*exp(20*x)", "g": "x - (exp(20*x) - 20)/400",
+     "a": 0, "b": 1, "x0": 0.5, "x1": 0.4, "raiz": math.log(20) / 20},
+    # Raíces múltiples (multiplicidad impar, para que exista cambio de signo)
+    {"nombre": "triple", "categoria": "multiple", "funcion": "(x - 1)**3*(x + 2)",
+     "derivada": "3*(x - 1)**2*(x + 2) + (x - 1)**3", "g": None,
+     "a": 0, "b": 1.7, "x0": 1.5, "x1": 1.4, "raiz": 1.0},
+    {"nombre": "quintuple", "categoria": "multiple", "funcion": "(x - 1)**5", "derivada": "5*(x - 1)**4",
+     "g": "x - (x - 1)**5", "a": 0, "b": 1.7, "x0": 1.5, "x1": 1.4, "raiz": 1.0},
+]
+
+
+def ejecutar(metodo, caso, tol, max_iter):
+    """
+    Ejecuta un método sobre un caso del catálogo.
+    Retorna (iteraciones, contadores de evaluaciones, raíz aproximada) o lanza la excepción del método.
+    """
+    if metodo.startswith("punto_fijo"):
+        if not caso["g"]:
+            raise ValueError("El caso no tiene una forma x = g(x).")
+        g = ContadorEvaluaciones(parse_function_g(caso["g"]))
+        if metodo == "punto_fijo":
+            datos = punto_fijo(g, caso["x0"], tol, max_iter)
+        elif metodo in ACELERADOS:
+            datos = punto_fijo_acelerado(g, caso["x0"], tol, max_iter, metodo[len("punto_fijo_"):])
+        else:
+            datos = punto_fijo_seguro(g, caso["a"], caso["b"], tol, max_iter, caso["x0"])
+        return datos, [g], datos[-1]["x_new"]
+    f = ContadorEvaluaciones(parse_function(caso["funcion"]))
+    if metodo == "biseccion":
+        datos = biseccion(f, caso["a"], caso["b"], tol, max_iter)
+        return datos, [f], datos[-1]["xr"]
+    if metodo == "falsa_posicion":
+        datos = falsa_posicion(f, caso["a"], caso["b"], tol, max_iter)
+        return datos, [f], datos[-1]["xr"]
+    if metodo == "newton_raphson":
+        df = ContadorEvaluaciones(parse_derivative(caso["derivada"]))
+        datos = newton_raphson(f, df, caso["x0"], tol, max_iter)
+        return datos, [f, df], datos[-1]["x_new"]
+    if metodo == "newton_seguro":
+        df = ContadorEvaluaciones(parse_derivative(caso["derivada"]))
+        datos = newton_seguro(f, caso["a"], caso["b"], tol, max_iter, df, caso["x0"])
+        return datos, [f, df], datos[-1]["x_new"]
+    datos = secante(f, caso["x0"], caso["x1"], tol, max_iter)
+    return datos, [f], datos[-1]["x_new"]
+
+
+def medir(metodo, caso, tol, max_iter, repeticiones):
+    """
+    Mide un método sobre un caso. El tiempo es el mínimo de 'repeticiones' ejecuciones
+    (las funciones ya están compiladas, así que solo se mide el método).
+    Retorna el registro del informe; si el método falla, el registro trae la clave "error".
+    """
+    registro = {"funcion": caso["nombre"], "categoria": caso["categoria"], "metodo": metodo}
+    try:
+        datos, contadores, xr = ejecutar(metodo, caso, tol, max_iter)
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            ejecutar(metodo, caso, tol, max_iter)
+            tiempos.append(time.perf_counter() - inicio)
+    except Exception as e:
+        registro["error"] = "{}: {}".format(type(e).__name__, e)
+        return registro
+
+    f = parse_function(caso["funcion"])
+    try:
+        residuo = abs(f(xr))
+    except (ValueError, OverflowError, ZeroDivisionError):
+        residuo = math.inf
+    ultima_ea = datos[-1]["ea"]
+    registro.update({
+        "iteraciones": len(datos),
+        "evaluaciones": sum(c.evaluaciones for c in contadores),
+        "tiempo_us": min(tiempos) * 1e6,
+        "raiz": xr,
+        "error_absoluto": abs(xr - caso["raiz"]),
+        "residuo": residuo,
+        "convergio": (ultima_ea is not None and ultima_ea < tol) or residuo == 0,
+        "orden": orden_convergencia(fila["xr" if "xr" in fila else "x_new"] for fila in datos[-8:]),
+    })
+    return registro
+
+
+def reduccion_aceleracion(resultados):
+    """
+    Compara las evaluaciones de g de cada variante acelerada con las del punto fijo sin acelerar.
+    Retorna una lista de {"funcion", "metodo", "evaluaciones", "evaluaciones_punto_fijo", "reduccion"},
+    donde "reduccion" es la fracción de evaluaciones ahorradas (solo si ambas convergieron).
+    """
+    por_caso = {(r["funcion"], r["metodo"]): r for r in resultados if "error" not in r and r["convergio"]}
+    reducciones = []
+    for (funcion, metodo), r in por_caso.items():
+        base = por_caso.get((funcion, "punto_fijo"))
+        if metodo in ACELERADOS and base is not None:
+            reducciones.append({
+                "funcion": funcion, "metodo": metodo, "evaluaciones": r["evaluaciones"],
+                "evaluaciones_punto_fijo": base["evaluaciones"],
+                "reduccion": 1 - r["evaluaciones"] / base["evaluaciones"],
+            })
+    return reducciones
+
+
+def ejecutar_benchmark(tol=1e-8, max_iter=500, repeticiones=20, metodos=METODOS):
+    """Ejecuta todo el catálogo con los métodos indicados y retorna el informe (dict serializable a JSON)."""
+    resultados = [medir(metodo, caso, tol, max_iter, repeticiones) for caso in CATALOGO for metodo in metodos]
+    return {
+        "configuracion": {"tolerancia": tol, "max_iter": max_iter, "repeticiones": repeticiones,
+                          "python": platform.python_version(), "plataforma": platform.platform()},
+        "resultados": resultados,
+        "aceleracion_punto_fijo": reduccion_aceleracion(resultados),
+    }
+
+
+def _formato(valor, patron):
+    return "-" if valor is None else format(valor, patron)
+
+
+def tabla(informe, base=None):
+    """
+    Retorna el informe como tabla de texto. Si se pasa 'base' (un informe anterior), se agrega la
+    razón de tiempos (actual / base; menor que 1 es una mejora) y la diferencia de evaluaciones.
+    """
+    anteriores = {}
+    if base is not None:
+        anteriores = {(r["funcion"], r["metodo"]): r for r in base["resultados"]}
+    encabezado = "{:<20} {:<21} {:>6} {:>6} {:>10} {:>10} {:>10} {:>4} {:>5}".format(
+        "funcion", "metodo", "iter", "evals", "tiempo_us", "error_abs", "residuo", "conv", "orden")
+    if base is not None:
+        encabezado += " {:>8} {:>7}".format("t/base", "Δevals")
+    lineas = [encabezado, "-" * len(encabezado)]
+    for r in informe["resultados"]:
+        if "error" in r:
+            lineas.append("{:<20} {:<21} {}".format(r["funcion"], r["metodo"], r["error"]))
+            continue
+        linea = "{:<20} {:<21} {:>6} {:>6} {:>10.1f} {:>10.2e} {:>10.2e} {:>4} {:>5}".format(
+            r["funcion"], r["metodo"], r["iteraciones"], r["evaluaciones"], r["tiempo_us"],
+            r["error_absoluto"], r["residuo"], "si" if r["convergio"] else "no", _formato(r.get("orden"), ".2f"))
+        anterior = anteriores.get((r["funcion"], r["metodo"]))
+        if base is not None:
+            if anterior is None or "error" in anterior:
+                linea += " {:>8} {:>7}".format("-", "-")
+            else:
+                razon = r["tiempo_us"] / anterior["tiempo_us"] if anterior["tiempo_us"] else None
+                linea += " {:>8} {:>+7d}".format(_formato(razon, ".2f"),
+                                                 r["evaluaciones"] - anterior["evaluaciones"])
+        lineas.append(linea)
+
+    if informe.get("aceleracion_punto_fijo"):
+        lineas += ["", "Evaluaciones de g ahorradas por la aceleración del punto fijo:"]
+        for r in informe["aceleracion_punto_fijo"]:
+            lineas.append("{:<20} {:<21} {:>4} -> {:>4}  ({:+.0%})".format(
+                r["funcion"], r["metodo"], r["evaluaciones_punto_fijo"], r["evaluaciones"], -r["reduccion"]))
+    return "\n".join(lineas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de los métodos de búsqueda de raíces.")
+    parser.add_argument("--tolerancia", type=float, default=1e-8, help="Tolerancia del error porcentual (Ea).")
+    parser.add_argument("--max-iter", type=int, default=500)
+    parser.add_argument("--repeticiones", type=int, default=20, help="Ejecuciones por medición (se toma la mínima).")
+    parser.add_argument("--metodos", nargs="+", choices=METODOS, default=list(METODOS))
+    parser.add_argument("--salida", help="Archivo donde guardar el informe en JSON.")
+    parser.add_argument("--comparar", help="Informe JSON anterior con el cual comparar.")
+    args = parser.parse_args()
+
+    informe = ejecutar_benchmark(args.tolerancia, args.max_iter, args.repeticiones, args.metodos)
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+    print(tabla(informe, base))
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# benchmarks/benchmark_sistemas.py
+#
+# Mide el costo por iteración de los métodos para sistemas de ecuaciones (methods/newton_sistemas.py)
+# en sistemas de 2 a varios cientos de incógnitas:
+#   - tiempo de análisis, derivación del jacobiano y compilación (parse_sistema, sin caché),
+#   - tiempo de una evaluación de F, de una evaluación conjunta de F y J, y de la resolución del
+#     sistema lineal con LAPACK,
+#   - iteraciones y tiempo por iteración de Newton y de Broyden hasta la tolerancia.
+# Los sistemas de prueba son el tridiagonal de Broyden (jacobiano disperso, 3 entradas por fila) y el
+# trigonométrico de Moré-Garbow-Hillstrom (jacobiano denso).
+#
+# Uso (desde la carpeta mi_aplicacion_raices):
+#     python benchmarks/benchmark_sistemas.py
+#     python benchmarks/benchmark_sistemas.py --tamanos 2 10 100 300 --salida sistemas.json
+
+import argparse
+import json
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+
+def tridiagonal(n):
+    """Sistema tridiagonal de Broyden: (3 - 2x_i) x_i - x_{i-1} - 2x_{i+1} + 1 = 0, con x0 = -1."""
+    ecuaciones = []
+    for i in range(1, n + 1):
+        termino = "(3 - 2*x{0})*x{0} + 1".format(i)
+        if i > 1:
+            termino += " - x{}".format(i - 1)
+        if i < n:
+            termino += " - 2*x{}".format(i + 1)
+        ecuaciones.append(termino)
+    return ecuaciones, [-1.0] * n
+
+
+def trigonometrico(n):
+    """Sistema trigonométrico: n - Σ cos x_j + i (1 - cos x_i) - sin x_i = 0, con x0 = 1/n."""
+    suma = " + ".join("cos(x{})".format(j) for j in range(1, n + 1))
+    ecuaciones = ["{} - ({}) + {}*(1 - cos(x{i})) - sin(x{i})".format(n, suma, i, i=i) for i in range(1, n + 1)]
+    return ecuaciones, [1.0 / n] * n
+
+
+SISTEMAS = {"tridiagonal": tridiagonal, "trigonometrico": trigonometrico}
+
+
+def _mejor(funcion, repeticiones):
+    """Mínimo, en microsegundos, de 'repeticiones' llamadas a funcion()."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor * 1e6
+
+
+def medir(nombre, n, tol, max_iter, repeticiones):
+    """Mide un sistema de tamaño n y retorna un registro con los tiempos en microsegundos."""
+    import numpy as np
+    from methods.newton_sistemas import newton_sistemas, broyden
+    from utils.parser import parse_sistema, _compilar_sistema
+
+    ecuaciones, x0 = SISTEMAS[nombre](n)
+    inicio = time.perf_counter()
+    F, FJ, _ = parse_sistema(ecuaciones)
+    compilacion = time.perf_counter() - inicio
+    _compilar_sistema.cache_clear()
+
+    x = np.array(x0)
+    f_x, jacobiano = FJ(x)
+    registro = {
+        "sistema": nombre,
+        "n": n,
+        "no_ceros_jacobiano": int(np.count_nonzero(jacobiano)),
+        "compilacion_ms": compilacion * 1e3,
+        "eval_f_us": _mejor(lambda: F(x), repeticiones),
+        "eval_fj_us": _mejor(lambda: FJ(x), repeticiones),
+        "solve_us": _mejor(lambda: np.linalg.solve(jacobiano, -f_x), repeticiones),
+    }
+    for metodo, resolver in (("newton", lambda: newton_sistemas(FJ, x0, tol, max_iter, F)),
+                             ("broyden", lambda: broyden(F, x0, tol, max_iter, FJ))):
+        try:
+            filas = resolver()
+        except Exception as e:
+            registro[metodo] = {"error": str(e)}
+            continue
+        total = _mejor(resolver, max(1, repeticiones // 5))
+        registro[metodo] = {
+            "iteraciones": len(filas),
+            "norma_f": filas[-1]["norma_f"],
+            "total_us": total,
+            "por_iteracion_us": total / len(filas),
+        }
+    return registro
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de Newton y Broyden para sistemas de ecuaciones.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[2, 5, 10, 25, 50, 100, 200, 300])
+    parser.add_argument("--max-denso", type=int, default=100,
+                        help="Tamaño máximo del sistema trigonométrico (su jacobiano tiene n² entradas).")
+    parser.add_argument("--tol", type=float, default=1e-8)
+    parser.add_argument("--max-iter", type=int, default=200)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--salida", help="Archivo donde guardar el informe en JSON.")
+    args = parser.parse_args()
+
+    # La primera compilación incluye la importación de SymPy y NumPy; no se cuenta en el primer sistema
+    from utils.parser import parse_sistema
+    parse_sistema("x - 1")
+
+    informe = []
+    for nombre in SISTEMAS:
+        for n in args.tamanos:
+            if nombre == "trigonometrico" and n > args.max_denso:
+                continue
+            informe.append(medir(nombre, n, args.tol, args.max_iter, args.repeticiones))
+
+    encabezado = "{:<15} {:>4} {:>7} {:>10} {:>9} {:>9} {:>9} {:>13} {:>13}".format(
+        "sistema", "n", "no_cero", "compilar", "F_us", "FJ_us", "solve_us", "newton", "broyden")
+    print(encabezado)
+    print("{:>83}{:>14}".format("iter us/iter", "iter us/iter"))
+    print("-" * len(encabezado))
+    for r in informe:
+        columnas = []
+        for metodo in ("newton", "broyden"):
+            datos = r[metodo]
+            columnas.append("error" if "error" in datos else "{:>3} {:>9.1f}".format(
+                datos["iteraciones"], datos["por_iteracion_us"]))
+        print("{:<15} {:>4} {:>7} {:>8.0f}ms {:>9.1f} {:>9.1f} {:>9.1f} {:>13} {:>13}".format(
+            r["sistema"], r["n"], r["no_ceros_jacobiano"], r["compilacion_ms"], r["eval_f_us"],
+            r["eval_fj_us"], r["solve_us"], *columnas))
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
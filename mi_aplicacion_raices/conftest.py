@@ -0,0 +1,4 @@
+# conftest.py
+#
+# Permite ejecutar las pruebas desde esta carpeta ("python -m pytest"): pytest agrega la carpeta del
+# conftest a sys.path, así que los módulos se importan igual que en app.py (utils..., methods...).
@@ -26,6 +26,11 @@ def biseccion(f, a, b, tol, max_iter=100):
         ValueError: Si tol o max_iter no son positivos, o si el intervalo [a, b] no presenta cambio de signo.
         Exception: Para otros errores que surjan durante la evaluación de la función o la actualización del intervalo.
     """
+    return list(biseccion_iter(f, a, b, tol, max_iter))
+
+
+def biseccion_iter(f, a, b, tol, max_iter=100):
+    """Igual que biseccion, pero retorna un generador que produce las iteraciones una a una."""
     # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero
     if tol <= 0:
         raise ValueError("La tolerancia debe ser un número positivo.")
@@ -43,7 +48,11 @@ def biseccion(f, a, b, tol, max_iter=100):
     if fa * fb >= 0:
         raise ValueError("La función no cambia de signo en el intervalo [a, b]. Ingrese un intervalo válido.")
 
-    iteraciones = []  # Lista para almacenar los resultados de cada iteración
+    return _generar_biseccion(f, a, b, tol, max_iter)
+
+
+def _generar_biseccion(f, a, b, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en biseccion_iter.
     xr_old = None    # Variable para guardar el xr de la iteración anterior (para el cálculo del error)
 
     # Bucle de iteración hasta alcanzar el máximo de iteraciones
@@ -65,13 +74,13 @@ def biseccion(f, a, b, tol, max_iter=100):
             ea = None  # No se puede calcular el error en la primera iteración
 
         # Registrar la iteración actual
-        iteraciones.append({
+        yield {
             "a": a,
             "b": b,
             "xr": xr,
             "fx": fxr,
             "ea": ea
-        })
+        }
 
         # Si el error es menor que la tolerancia o f(xr) es cero, finalizamos el proceso
         if (ea is not None and ea < tol) or fxr == 0:
@@ -87,5 +96,3 @@ def biseccion(f, a, b, tol, max_iter=100):
             raise Exception("Error al actualizar el intervalo en la iteración {}: {}".format(i + 1, e))
 
         xr_old = xr  # Actualizar xr_old para la próxima iteración
-
-    return iteraciones
@@ -0,0 +1,236 @@
+import numpy as np
+
+# Razón áurea usada en la búsqueda de mínimos de |f| (raíces de multiplicidad par).
+_RAZON_AUREA = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _evaluar(f, x):
+    """
+    Evalúa la función vectorizada f sobre el arreglo x y retorna siempre un arreglo de floats
+    con la misma forma que x (las funciones constantes devuelven un escalar al usar lambdify).
+    """
+    with np.errstate(all='ignore'):
+        y = np.asarray(f(x), dtype=float)
+    if y.shape != np.shape(x):
+        y = np.broadcast_to(y, np.shape(x)).astype(float)
+    return y
+
+
+def buscar_intervalos(f, a, b, n_muestras=1000, tol_cero=1e-10):
+    """
+    Muestrea la función f sobre [a, b] y localiza los intervalos que contienen raíces.
+
+    La función se evalúa de forma vectorizada sobre n_muestras subintervalos de igual tamaño. Se detectan:
+        - Los puntos de muestreo donde f vale exactamente cero.
+        - Los subintervalos donde f cambia de signo.
+        - Los mínimos locales de |f| sin cambio de signo cuyo valor es menor que tol_cero tras refinarlos
+          (raíces de multiplicidad par, como en f(x) = (x - 1)**2, que los métodos cerrados no detectan).
+
+    Parámetros:
+        f (function): Función vectorizada (acepta y retorna arreglos de NumPy).
+        a (float): Límite inferior del intervalo de búsqueda.
+        b (float): Límite superior del intervalo de búsqueda.
+        n_muestras (int, opcional): Número de subintervalos del muestreo. Por defecto es 1000.
+        tol_cero (float, opcional): Valor de |f| por debajo del cual un mínimo se acepta como raíz.
+
+    Retorna:
+        tuple: (ceros, cambios, minimos) donde
+            - ceros: arreglo con los puntos de muestreo donde f(x) == 0.
+            - cambios: arreglo de forma (n, 2) con los subintervalos [xi, xd] que presentan cambio de signo.
+            - minimos: arreglo con las abscisas de los mínimos de |f| aceptados como raíces.
+
+    Excepciones:
+        ValueError: Si a >= b o n_muestras es menor que 2.
+    """
+    if a >= b:
+        raise ValueError("El límite inferior a debe ser menor que el límite superior b.")
+    if n_muestras < 2:
+        raise ValueError("El número de muestras debe ser al menos 2.")
+
+    x = np.linspace(a, b, int(n_muestras) + 1)
+    y = _evaluar(f, x)
+    finito = np.isfinite(y)
+    signo = np.sign(y)
+
+    ceros = x[finito & (y == 0)]
+
+    # Cambios de signo entre muestras consecutivas (ambas finitas y no nulas)
+    validos = finito[:-1] & finito[1:]
+    idx = np.nonzero(validos & (signo[:-1] * signo[1:] < 0))[0]
+    cambios = np.column_stack((x[idx], x[idx + 1]))
+
+    # Mínimos locales de |f| sin cambio de signo alrededor
+    abs_y = np.where(finito, np.abs(y), np.inf)
+    centro = abs_y[1:-1]
+    mismo_signo = (signo[:-2] == signo[1:-1]) & (signo[1:-1] == signo[2:]) & (signo[1:-1] != 0)
+    es_minimo = mismo_signo & (centro <= abs_y[:-2]) & (centro <= abs_y[2:]) & np.isfinite(centro)
+    idx_min = np.nonzero(es_minimo)[0] + 1
+    minimos = _refinar_minimos(f, x[idx_min - 1], x[idx_min + 1], tol_cero)
+
+    return ceros, cambios, minimos
+
+
+def _refinar_minimos(f, izq, der, tol_cero, max_iter=100):
+    """
+    Refina simultáneamente (búsqueda de sección áurea vectorizada) los mínimos de |f| contenidos
+    en los intervalos [izq[i], der[i]] y retorna solo aquellos donde |f| <= tol_cero.
+    """
+    if izq.size == 0:
+        return izq
+    izq = izq.copy()
+    der = der.copy()
+    c = der - _RAZON_AUREA * (der - izq)
+    d = izq + _RAZON_AUREA * (der - izq)
+    fc = np.abs(_evaluar(f, c))
+    fd = np.abs(_evaluar(f, d))
+    for _ in range(max_iter):
+        if np.all(der - izq <= 1e-15 * np.maximum(1.0, np.abs(izq))):
+            break
+        mover_der = fc < fd
+        # Si |f(c)| < |f(d)| el mínimo está en [izq, d]; en caso contrario en [c, der]
+        der = np.where(mover_der, d, der)
+        izq = np.where(mover_der, izq, c)
+        nuevo = np.where(mover_der, der - _RAZON_AUREA * (der - izq), izq + _RAZON_AUREA * (der - izq))
+        f_nuevo = np.abs(_evaluar(f, nuevo))
+        c, d = np.where(mover_der, nuevo, d), np.where(mover_der, c, nuevo)
+        fc, fd = np.where(mover_der, f_nuevo, fd), np.where(mover_der, fc, f_nuevo)
+    x_min = (izq + der) / 2.0
+    f_min = np.abs(_evaluar(f, x_min))
+    return x_min[f_min <= tol_cero]
+
+
+def _refinar_intervalos(f, a, b, tol, max_iter, metodo):
+    """
+    Refina simultáneamente todos los intervalos [a[i], b[i]] con cambio de signo usando bisección
+    o falsa posición vectorizadas. Cada intervalo deja de actualizarse cuando su error porcentual
+    aproximado es menor que tol (o f(xr) es cero), igual que en los métodos escalares.
+
+    Retorna:
+        tuple: (xr, fxr, ea, iteraciones) como arreglos de NumPy.
+    """
+    fa = _evaluar(f, a)
+    fb = _evaluar(f, b)
+    n = a.size
+    xr = np.full(n, np.nan)
+    fxr = np.full(n, np.nan)
+    ea = np.full(n, np.nan)
+    iteraciones = np.zeros(n, dtype=int)
+    activo = np.ones(n, dtype=bool)
+
+    for i in range(max_iter):
+        if not activo.any():
+            break
+        if metodo == "biseccion":
+            xr_nuevo = (a + b) / 2.0
+        else:
+            with np.errstate(all='ignore'):
+                xr_nuevo = b - (fb * (a - b)) / (fa - fb)
+        fxr_nuevo = _evaluar(f, xr_nuevo)
+
+        with np.errstate(all='ignore'):
+            ea_nuevo = np.where(xr_nuevo != 0, np.abs((xr_nuevo - xr) / xr_nuevo) * 100, np.inf)
+        if i == 0:
+            ea_nuevo = np.full(n, np.nan)
+
+        xr = np.where(activo, xr_nuevo, xr)
+        fxr = np.where(activo, fxr_nuevo, fxr)
+        ea = np.where(activo, ea_nuevo, ea)
+        iteraciones = iteraciones + activo
+
+        # Se detienen los intervalos que alcanzaron la tolerancia o encontraron f(xr) = 0
+        terminado = activo & (((i > 0) & (ea < tol)) | (fxr == 0))
+        activo = activo & ~terminado
+
+        # Actualizar los intervalos activos según el signo de f(a) * f(xr)
+        izquierda = activo & (fa * fxr < 0)
+        derecha = activo & ~izquierda
+        b = np.where(izquierda, xr, b)
+        fb = np.where(izquierda, fxr, fb)
+        a = np.where(derecha, xr, a)
+        fa = np.where(derecha, fxr, fa)
+
+    return xr, fxr, ea, iteraciones
+
+
+def buscar_raices(f, a, b, tol, max_iter=100, metodo="biseccion", n_muestras=1000, tol_cero=1e-10):
+    """
+    Encuentra todas las raíces de f en el intervalo [a, b] sin que el usuario tenga que proponer intervalos.
+
+    Primero se muestrea f de forma vectorizada para localizar los cambios de signo y los mínimos de |f|
+    cercanos a cero (ver buscar_intervalos). Luego todos los intervalos con cambio de signo se refinan
+    a la vez con el método cerrado elegido (bisección o falsa posición) usando operaciones de NumPy.
+    Los cambios de signo causados por discontinuidades (por ejemplo, polos de tan(x) o 1/x) se descartan
+    porque |f(xr)| crece en lugar de disminuir al refinarlos.
+
+    Parámetros:
+        f (function): Función vectorizada (acepta y retorna arreglos de NumPy).
+        a (float): Límite inferior del intervalo de búsqueda (ingresado por el usuario).
+        b (float): Límite superior del intervalo de búsqueda (ingresado por el usuario).
+        tol (float): Tolerancia para el error porcentual aproximado (ingresado por el usuario).
+        max_iter (int, opcional): Número máximo de iteraciones por intervalo. Por defecto es 100.
+        metodo (str, opcional): "biseccion" o "falsa_posicion". Por defecto es "biseccion".
+        n_muestras (int, opcional): Número de subintervalos del muestreo inicial. Por defecto es 1000.
+        tol_cero (float, opcional): Valor de |f| por debajo del cual un mínimo se acepta como raíz.
+
+    Retorna:
+        list[dict]: Lista ordenada de raíces, cada una con las claves:
+            - "a": Límite inferior del intervalo donde se localizó la raíz.
+            - "b": Límite superior del intervalo donde se localizó la raíz.
+            - "xr": Raíz aproximada.
+            - "fx": Valor de la función evaluado en xr.
+            - "ea": Error porcentual aproximado final (None si no se iteró).
+            - "iteraciones": Número de iteraciones empleadas en el refinamiento.
+
+    Excepciones:
+        ValueError: Si tol o max_iter no son positivos, si el método no es un método cerrado soportado
+            o si el intervalo de búsqueda no es válido.
+    """
+    if tol <= 0:
+        raise ValueError("La tolerancia debe ser un número positivo.")
+    if max_iter <= 0:
+        raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
+    if metodo not in ("biseccion", "falsa_posicion"):
+        raise ValueError("El método de refinamiento debe ser 'biseccion' o 'falsa_posicion'.")
+
+    ceros, cambios, minimos = buscar_intervalos(f, a, b, n_muestras, tol_cero)
+
+    raices = []
+    for x0 in ceros:
+        raices.append({"a": float(x0), "b": float(x0), "xr": float(x0), "fx": 0.0, "ea": None, "iteraciones": 0})
+    for x0 in minimos:
+        fx0 = float(_evaluar(f, np.array([x0]))[0])
+        raices.append({"a": float(x0), "b": float(x0), "xr": float(x0), "fx": fx0, "ea": None, "iteraciones": 0})
+
+    if len(cambios):
+        izq = cambios[:, 0].copy()
+        der = cambios[:, 1].copy()
+        cota = np.minimum(np.abs(_evaluar(f, izq)), np.abs(_evaluar(f, der)))
+        xr, fxr, ea, iteraciones = _refinar_intervalos(f, izq, der, tol, max_iter, metodo)
+        for i in range(len(xr)):
+            # Un polo también produce cambio de signo, pero allí |f(xr)| crece al acercarse
+            if not np.isfinite(fxr[i]) or abs(fxr[i]) > cota[i]:
+                continue
+            raices.append({
+                "a": float(izq[i]),
+                "b": float(der[i]),
+                "xr": float(xr[i]),
+                "fx": float(fxr[i]),
+                "ea": None if np.isnan(ea[i]) else float(ea[i]),
+                "iteraciones": int(iteraciones[i])
+            })
+
+    raices.sort(key=lambda r: r["xr"])
+    return raices
+
+
+# Ejemplo de uso (modo standalone, para pruebas)
+if __name__ == "__main__":
+    # f(x) = (x**2 - 4) * (x - 1)**2 tiene raíces simples en -2 y 2 y una raíz doble en 1
+    f = lambda x: (x ** 2 - 4) * (x - 1) ** 2
+
+    try:
+        for raiz in buscar_raices(f, -5, 5, 0.0001):
+            print("Raíz en [{}, {}]: xr = {}, f(xr) = {}, iteraciones = {}".format(
+                raiz["a"], raiz["b"], raiz["xr"], raiz["fx"], raiz["iteraciones"]))
+    except Exception as error:
+        print("Se produjo un error:", error)
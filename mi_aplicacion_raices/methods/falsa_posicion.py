@@ -26,6 +26,11 @@ def falsa_posicion(f, a, b, tol, max_iter=100):
         ZeroDivisionError: Si se produce una división por cero (por ejemplo, cuando f(a) y f(b) son iguales).
         Exception: Para otros errores que surjan durante la evaluación de la función o la actualización del intervalo.
     """
+    return list(falsa_posicion_iter(f, a, b, tol, max_iter))
+
+
+def falsa_posicion_iter(f, a, b, tol, max_iter=100):
+    """Igual que falsa_posicion, pero retorna un generador que produce las iteraciones una a una."""
     # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero
     if tol <= 0:
         raise ValueError("La tolerancia debe ser un número positivo.")
@@ -43,7 +48,11 @@ def falsa_posicion(f, a, b, tol, max_iter=100):
     if fa * fb >= 0:
         raise ValueError("La función no cambia de signo en el intervalo [a, b]. Ingrese un intervalo válido.")
 
-    iteraciones = []  # Lista para almacenar los datos de cada iteración
+    return _generar_falsa_posicion(f, a, b, tol, max_iter)
+
+
+def _generar_falsa_posicion(f, a, b, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en falsa_posicion_iter.
     xr_old = None  # Variable para almacenar el xr de la iteración anterior (para calcular el error)
 
     # Iterar hasta alcanzar el máximo de iteraciones
@@ -72,13 +81,13 @@ def falsa_posicion(f, a, b, tol, max_iter=100):
             ea = None  # No se puede calcular el error en la primera iteración
 
         # Registrar los valores de la iteración en la lista
-        iteraciones.append({
+        yield {
             "a": a,
             "b": b,
             "xr": xr,
             "fx": fxr,
             "ea": ea
-        })
+        }
 
         # Si el error calculado es menor que la tolerancia, se finaliza el proceso
         if ea is not None and ea < tol:
@@ -96,5 +105,3 @@ def falsa_posicion(f, a, b, tol, max_iter=100):
             raise Exception("Error al actualizar el intervalo en la iteración {}: ".format(i + 1) + str(e))
 
         xr_old = xr  # Guardar el valor actual para la próxima iteración
-
-    return iteraciones
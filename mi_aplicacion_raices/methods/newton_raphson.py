@@ -26,13 +26,22 @@ def newton_raphson(f, df, x0, tol, max_iter=100):
         ZeroDivisionError: Si se produce división por cero al evaluar df(x) (es decir, si df(x) = 0).
         Exception: Para otros errores que surjan durante la evaluación de f o df.
     """
+    return list(newton_raphson_iter(f, df, x0, tol, max_iter))
+
+
+def newton_raphson_iter(f, df, x0, tol, max_iter=100):
+    """Igual que newton_raphson, pero retorna un generador que produce las iteraciones una a una."""
     # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero.
     if tol <= 0:
         raise ValueError("La tolerancia debe ser un número positivo.")
     if max_iter <= 0:
         raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
 
-    iteraciones = []  # Lista para almacenar los resultados de cada iteración.
+    return _generar_newton_raphson(f, df, x0, tol, max_iter)
+
+
+def _generar_newton_raphson(f, df, x0, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en newton_raphson_iter.
     x_old = x0  # Valor inicial proporcionado por el usuario.
 
     # Iterar hasta alcanzar el máximo de iteraciones
@@ -70,12 +79,12 @@ def newton_raphson(f, df, x0, tol, max_iter=100):
                 ea = float('inf')
 
         # Registrar la iteración actual.
-        iteraciones.append({
+        yield {
             "x_old": x_old,
             "x_new": x_new,
             "f_x": f(x_new),
             "ea": ea
-        })
+        }
 
         # Si ya se calculó el error y es menor que la tolerancia, finaliza el proceso.
         if ea is not None and ea < tol:
@@ -84,8 +93,6 @@ def newton_raphson(f, df, x0, tol, max_iter=100):
         # Actualizar x_old para la siguiente iteración.
         x_old = x_new
 
-    return iteraciones
-
 
 # Ejemplo de uso (modo standalone, para pruebas, no se ejecuta en la integración con el front-end):
 if __name__ == "__main__":
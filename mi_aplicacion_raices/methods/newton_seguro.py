@@ -0,0 +1,149 @@
+import math
+
+
+def newton_seguro(f, a, b, tol, max_iter=100, df=None, x0=None):
+    """
+    Implementa un método híbrido con salvaguarda: Newton-Raphson (o secante, si no se da la derivada)
+    protegido por bisección dentro del intervalo [a, b].
+
+    En cada iteración se intenta primero el paso rápido (Newton si se conoce df, secante en caso contrario)
+    y se vigila su progreso. Se cambia automáticamente a un paso de bisección cuando:
+        - la derivada (o la pendiente de la secante) es cero o no es finita,
+        - el nuevo punto cae fuera del intervalo que contiene la raíz,
+        - el paso no se reduce al menos a la mitad respecto del penúltimo (convergencia lenta u oscilación),
+        - el residuo |f(x)| creció en el paso rápido anterior.
+    Con cada nueva evaluación el intervalo [a, b] se actualiza según el signo de f, de modo que la raíz
+    siempre queda encerrada: el método converge como Newton (o secante) cerca de la raíz y nunca diverge.
+
+    Parámetros:
+        f (function): Función a evaluar. Debe aceptar un número real y retornar un número real.
+        a (float): Límite inferior del intervalo (ingresado por el usuario).
+        b (float): Límite superior del intervalo (ingresado por el usuario).
+        tol (float): Tolerancia para el error porcentual aproximado (ingresado por el usuario).
+        max_iter (int, opcional): Número máximo de iteraciones permitidas. Por defecto es 100.
+        df (function, opcional): Derivada de f. Si no se indica, el paso rápido es el de la secante.
+        x0 (float, opcional): Valor inicial dentro de [a, b]. Por defecto, el punto medio del intervalo.
+
+    Retorna:
+        list[dict]: Lista de diccionarios, cada uno representando una iteración, con las siguientes claves:
+            - "a": Límite inferior del intervalo después de la iteración.
+            - "b": Límite superior del intervalo después de la iteración.
+            - "x_old": Aproximación anterior.
+            - "x_new": Nueva aproximación calculada.
+            - "f_x": Valor de f evaluado en x_new.
+            - "ea": Error porcentual aproximado entre x_old y x_new (None en la primera iteración).
+            - "estrategia": Paso utilizado en la iteración: "newton", "secante" o "biseccion".
+
+    Excepciones:
+        ValueError: Si tol o max_iter no son positivos, si el intervalo [a, b] no presenta cambio de signo
+            o si x0 está fuera del intervalo.
+        Exception: Para otros errores que surjan durante la evaluación de f o df.
+    """
+    return list(newton_seguro_iter(f, a, b, tol, max_iter, df, x0))
+
+
+def newton_seguro_iter(f, a, b, tol, max_iter=100, df=None, x0=None):
+    """
+    Versión por generador del método híbrido con salvaguarda: valida los datos de inmediato (lanza las
+    mismas excepciones que newton_seguro) y retorna un generador que produce las iteraciones una a una.
+    """
+    # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero.
+    if tol <= 0:
+        raise ValueError("La tolerancia debe ser un número positivo.")
+    if max_iter <= 0:
+        raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
+    if a > b:
+        a, b = b, a
+    if x0 is None:
+        x0 = (a + b) / 2.0
+    elif not a <= x0 <= b:
+        raise ValueError("El valor inicial x0 debe estar dentro del intervalo [a, b].")
+
+    # La salvaguarda necesita un intervalo con cambio de signo
+    try:
+        fa = f(a)
+        fb = f(b)
+        fx0 = f(x0)
+    except Exception as e:
+        raise ValueError("Error al evaluar la función en los extremos del intervalo: " + str(e))
+    if fa * fb >= 0:
+        raise ValueError("La función no cambia de signo en el intervalo [a, b]. Ingrese un intervalo válido.")
+
+    return _generar_newton_seguro(f, df, a, b, fa, fb, x0, fx0, tol, max_iter)
+
+
+def _generar_newton_seguro(f, df, a, b, fa, fb, x, fx, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en newton_seguro_iter.
+    # Punto anterior para la secante: el extremo con menor residuo
+    x_ant, fx_ant = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+    paso = paso_anterior = b - a  # Últimos dos pasos, para vigilar que se reduzcan
+    forzar_biseccion = False      # El residuo creció en el paso rápido anterior
+
+    for i in range(max_iter):
+        if fx == 0:
+            # x ya es una raíz exacta
+            yield {"a": a, "b": b, "x_old": x, "x_new": x, "f_x": fx, "ea": 0.0 if i else None,
+                   "estrategia": "newton" if df is not None else "secante"}
+            break
+
+        # Paso rápido: Newton si se conoce la derivada, secante en caso contrario
+        estrategia = "newton" if df is not None else "secante"
+        try:
+            pendiente = df(x) if df is not None else (fx - fx_ant) / (x - x_ant)
+            x_new = x - fx / pendiente
+        except (ZeroDivisionError, OverflowError, ValueError):
+            x_new = math.nan  # Derivada nula o no evaluable: se recurre a bisección
+        except Exception as e:
+            raise Exception("Error al evaluar la derivada en la iteración {}: {}".format(i + 1, e))
+
+        # Salvaguarda: bisección si el paso rápido no es confiable
+        if (forzar_biseccion or not math.isfinite(x_new) or not a < x_new < b
+                or abs(x_new - x) > 0.5 * abs(paso_anterior)):
+            estrategia = "biseccion"
+            x_new = (a + b) / 2.0
+
+        try:
+            fx_new = f(x_new)
+        except Exception as e:
+            raise Exception("Error al evaluar la función en la iteración {}: {}".format(i + 1, e))
+
+        # Si el paso rápido aumentó el residuo, el siguiente paso será de bisección
+        forzar_biseccion = estrategia != "biseccion" and abs(fx_new) > abs(fx)
+
+        # Actualizar el intervalo para que siga conteniendo la raíz
+        if fa * fx_new < 0:
+            b, fb = x_new, fx_new
+        else:
+            a, fa = x_new, fx_new
+
+        # Calcular el error porcentual aproximado (ea) si no es la primera iteración.
+        if i == 0:
+            ea = None
+        elif x_new == 0:
+            ea = abs(x_new - x)
+        else:
+            ea = abs((x_new - x) / x_new) * 100
+
+        yield {"a": a, "b": b, "x_old": x, "x_new": x_new, "f_x": fx_new, "ea": ea, "estrategia": estrategia}
+
+        if (ea is not None and ea < tol) or fx_new == 0:
+            break
+
+        paso_anterior, paso = paso, x_new - x
+        x_ant, fx_ant = x, fx
+        x, fx = x_new, fx_new
+
+
+# Ejemplo de uso (modo standalone, para pruebas, no se ejecuta en la integración con el front-end):
+if __name__ == "__main__":
+    # atan(x) hace diverger a Newton-Raphson desde x0 = 2; la salvaguarda lo lleva a la raíz x = 0
+    f = math.atan
+    df = lambda x: 1 / (1 + x ** 2)
+
+    try:
+        resultados = newton_seguro(f, -1, 3, 1e-8, 100, df, x0=2)
+        for idx, iteracion in enumerate(resultados, start=1):
+            print("Iteración {}: [{}] x_new = {}, f(x_new) = {}, ea = {}".format(
+                idx, iteracion["estrategia"], iteracion["x_new"], iteracion["f_x"], iteracion["ea"]))
+    except Exception as error:
+        print("Se produjo un error:", error)
@@ -0,0 +1,230 @@
+import numpy as np
+
+# Número máximo de veces que Broyden reduce a la mitad un paso que no disminuye el residuo
+MAX_REDUCCIONES = 8
+
+
+def newton_sistemas(fj, x0, tol, max_iter=100, f=None):
+    """
+    Implementa el método de Newton-Raphson para sistemas de ecuaciones no lineales F(x) = 0.
+
+    En cada iteración se evalúan F y su jacobiano J en el punto actual y se resuelve el sistema lineal
+        J(x_old) · Δx = -F(x_old),    x_new = x_old + Δx
+    con numpy.linalg.solve (factorización LU de LAPACK), sin invertir J. Cerca de la raíz la convergencia
+    es cuadrática, igual que en una variable.
+
+    Parámetros:
+        fj (function): Función que recibe un arreglo x de tamaño n y retorna la tupla (F(x), J(x)),
+            con F(x) de tamaño n y J(x) de tamaño (n, n) (ver utils.parser.parse_sistema).
+        x0 (list[float]): Aproximación inicial (una componente por incógnita).
+        tol (float): Tolerancia para el error porcentual aproximado (ingresado por el usuario).
+        max_iter (int, opcional): Número máximo de iteraciones permitidas. Por defecto es 100.
+        f (function, opcional): Función que retorna solo F(x). Si se indica, en la última iteración (cuando
+            ya se cumple la tolerancia o se alcanza max_iter) se evalúa solo F, sin el jacobiano que ya no se usa.
+
+    Retorna:
+        list[dict]: Lista de diccionarios, cada uno representando una iteración, con las siguientes claves:
+            - "x_old": Aproximación anterior (lista).
+            - "x_new": Nueva aproximación calculada (lista).
+            - "norma_f": Norma infinito de F(x_new), el mayor residuo de las ecuaciones.
+            - "ea": Error porcentual aproximado entre x_old y x_new en norma infinito
+              (None en la primera iteración).
+
+    Excepciones:
+        ValueError: Si tol o max_iter no son positivos, o si x0 está vacío.
+        ZeroDivisionError: Si el jacobiano es singular en alguna iteración.
+        Exception: Para otros errores que surjan durante la evaluación de F o J.
+    """
+    return list(newton_sistemas_iter(fj, x0, tol, max_iter, f))
+
+
+def newton_sistemas_iter(fj, x0, tol, max_iter=100, f=None):
+    """
+    Versión por generador del método de Newton-Raphson para sistemas: valida los datos de inmediato (lanza
+    las mismas excepciones que newton_sistemas) y retorna un generador que produce las iteraciones una a una.
+    """
+    x0 = _validar(x0, tol, max_iter)
+    return _generar_newton_sistemas(fj, f, x0, tol, max_iter)
+
+
+def broyden(f, x0, tol, max_iter=100, fj=None):
+    """
+    Implementa el método cuasi-Newton de Broyden para sistemas de ecuaciones no lineales F(x) = 0.
+
+    El jacobiano solo se calcula una vez, en x0 (con fj o, si no se indica, por diferencias finitas), y se
+    invierte con LAPACK. Después cada iteración evalúa únicamente F y corrige la inversa H ≈ J⁻¹ con la
+    actualización de Broyden escrita con la fórmula de Sherman-Morrison:
+        s = x_new - x_old,    y = F(x_new) - F(x_old)
+        H = H + (s - H·y) (sᵀ·H) / (sᵀ·H·y)
+    de modo que cada iteración cuesta O(n²) operaciones en lugar de evaluar J y factorizarlo (O(n³)).
+    La convergencia es superlineal: necesita más iteraciones que Newton, pero cada una es más barata.
+
+    Para que el método no diverja lejos de la solución, el paso se reduce a la mitad mientras no disminuya
+    el residuo ||F|| (hasta MAX_REDUCCIONES veces); si aun así no disminuye y se dio fj, la aproximación
+    del jacobiano se descarta y se recalcula el jacobiano exacto en el punto actual.
+
+    Parámetros:
+        f (function): Función que recibe un arreglo x de tamaño n y retorna el arreglo F(x) de tamaño n.
+        x0 (list[float]): Aproximación inicial (una componente por incógnita).
+        tol (float): Tolerancia para el error porcentual aproximado (ingresado por el usuario).
+        max_iter (int, opcional): Número máximo de iteraciones permitidas. Por defecto es 100.
+        fj (function, opcional): Función que retorna (F(x), J(x)), usada solo para el jacobiano inicial.
+
+    Retorna:
+        list[dict]: Lista de diccionarios con las mismas claves que newton_sistemas.
+
+    Excepciones:
+        ValueError: Si tol o max_iter no son positivos, o si x0 está vacío.
+        ZeroDivisionError: Si el jacobiano inicial es singular o la actualización no está definida.
+        Exception: Para otros errores que surjan durante la evaluación de F o J.
+    """
+    return list(broyden_iter(f, x0, tol, max_iter, fj))
+
+
+def broyden_iter(f, x0, tol, max_iter=100, fj=None):
+    """
+    Versión por generador del método de Broyden: valida los datos de inmediato (lanza las mismas
+    excepciones que broyden) y retorna un generador que produce las iteraciones una a una.
+    """
+    x0 = _validar(x0, tol, max_iter)
+    return _generar_broyden(f, fj, x0, tol, max_iter)
+
+
+def _validar(x0, tol, max_iter):
+    # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero.
+    if tol <= 0:
+        raise ValueError("La tolerancia debe ser un número positivo.")
+    if max_iter <= 0:
+        raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
+    x0 = np.array(x0, dtype=float).ravel()
+    if x0.size == 0:
+        raise ValueError("La aproximación inicial x0 no puede estar vacía.")
+    return x0
+
+
+def _evaluar(funcion, x, i):
+    # Evalúa F (o F y J) y verifica que el resultado sea finito
+    try:
+        resultado = funcion(x)
+    except Exception as e:
+        raise Exception("Error al evaluar el sistema en la iteración {}: {}".format(i + 1, e))
+    valores = resultado if isinstance(resultado, tuple) else (resultado,)
+    if not all(np.all(np.isfinite(v)) for v in valores):
+        raise Exception("El sistema no es finito en la iteración {}: el método diverge.".format(i + 1))
+    return resultado
+
+
+def _error(x_new, x_old):
+    # Error porcentual aproximado en norma infinito; si x_new es 0 se usa la diferencia absoluta.
+    diferencia = float(np.max(np.abs(x_new - x_old)))
+    norma = float(np.max(np.abs(x_new)))
+    return diferencia if norma == 0 else diferencia / norma * 100
+
+
+def _generar_newton_sistemas(fj, f, x_old, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en newton_sistemas_iter.
+    f_x, jacobiano = _evaluar(fj, x_old, 0)
+
+    for i in range(max_iter):
+        try:
+            # Resolver J · Δx = -F con LAPACK (gesv), sin formar la inversa
+            delta = np.linalg.solve(jacobiano, -f_x)
+        except np.linalg.LinAlgError:
+            raise ZeroDivisionError("Jacobiano singular en la iteración {}: no se puede continuar.".format(i + 1))
+        x_new = x_old + delta
+        ea = _error(x_new, x_old) if i > 0 else None
+
+        if f is not None and ((ea is not None and ea < tol) or i == max_iter - 1):
+            # Última iteración: solo hace falta F para el residuo, el jacobiano ya no se usa
+            f_x = _evaluar(f, x_new, i)
+        else:
+            # F y J se evalúan juntos: el jacobiano en x_new se usa en la siguiente iteración
+            f_x, jacobiano = _evaluar(fj, x_new, i)
+
+        yield {"x_old": x_old.tolist(), "x_new": x_new.tolist(), "norma_f": float(np.max(np.abs(f_x))), "ea": ea}
+
+        if (ea is not None and ea < tol) or not np.any(f_x):
+            break
+
+        x_old = x_new
+
+
+def _jacobiano_diferencias(f, x, f_x):
+    # Jacobiano por diferencias finitas hacia adelante (n evaluaciones adicionales de F)
+    jacobiano = np.empty((x.size, x.size))
+    for j in range(x.size):
+        h = 1.4901161193847656e-08 * max(1.0, abs(x[j]))  # sqrt(eps) relativo a x_j
+        x_h = x.copy()
+        x_h[j] += h
+        jacobiano[:, j] = (f(x_h) - f_x) / h
+    return jacobiano
+
+
+def _generar_broyden(f, fj, x_old, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en broyden_iter.
+    if fj is not None:
+        f_x, jacobiano = _evaluar(fj, x_old, 0)
+    else:
+        f_x = _evaluar(f, x_old, 0)
+        jacobiano = _jacobiano_diferencias(f, x_old, f_x)
+    try:
+        inversa = np.linalg.inv(jacobiano)  # LAPACK (getrf + getri), una sola vez
+    except np.linalg.LinAlgError:
+        raise ZeroDivisionError("Jacobiano singular en la aproximación inicial: no se puede continuar.")
+
+    for i in range(max_iter):
+        s = -inversa @ f_x
+        # Búsqueda lineal: si el paso completo no reduce el residuo, se reduce a la mitad (hasta
+        # MAX_REDUCCIONES veces). Sin ella Broyden diverge cuando x0 está lejos de la solución.
+        norma = np.linalg.norm(f_x)
+        for reduccion in range(MAX_REDUCCIONES + 1):
+            x_new = x_old + s
+            f_new = _evaluar(f, x_new, i)
+            descenso = np.linalg.norm(f_new) < norma
+            if descenso or reduccion == MAX_REDUCCIONES:
+                break
+            s = s / 2
+        ea = _error(x_new, x_old) if i > 0 else None
+
+        yield {"x_old": x_old.tolist(), "x_new": x_new.tolist(), "norma_f": float(np.max(np.abs(f_new))), "ea": ea}
+
+        if (ea is not None and ea < tol) or not np.any(f_new):
+            break
+
+        if not descenso and fj is not None:
+            # La aproximación del jacobiano ya no da una dirección de descenso: se reinicia con el exacto
+            f_new, jacobiano = _evaluar(fj, x_new, i)
+            try:
+                inversa = np.linalg.inv(jacobiano)
+            except np.linalg.LinAlgError:
+                raise ZeroDivisionError("Jacobiano singular en la iteración {}: no se puede continuar.".format(i + 1))
+        else:
+            # Actualización de Broyden de la inversa del jacobiano (Sherman-Morrison), O(n²)
+            h_y = inversa @ (f_new - f_x)
+            denominador = s @ h_y
+            if denominador == 0:
+                raise ZeroDivisionError("Actualización de Broyden no definida en la iteración {}.".format(i + 1))
+            inversa += np.outer(s - h_y, s @ inversa) / denominador
+
+        x_old, f_x = x_new, f_new
+
+
+# Ejemplo de uso (modo standalone, para pruebas, no se ejecuta en la integración con el front-end):
+if __name__ == "__main__":
+    # Intersección de la circunferencia x² + y² = 4 con la hipérbola x·y = 1
+    def fj(v):
+        x, y = v
+        return np.array([x ** 2 + y ** 2 - 4, x * y - 1]), np.array([[2 * x, 2 * y], [y, x]])
+
+    def f(v):
+        return fj(v)[0]
+
+    for nombre, resultados in (("Newton", lambda: newton_sistemas(fj, [2, 0.5], 1e-10, f=f)),
+                               ("Broyden", lambda: broyden(f, [2, 0.5], 1e-10, fj=fj))):
+        try:
+            print(nombre)
+            for idx, iteracion in enumerate(resultados(), start=1):
+                print("Iteración {}: x_new = {}, |F| = {}, ea = {}".format(
+                    idx, iteracion["x_new"], iteracion["norma_f"], iteracion["ea"]))
+        except Exception as error:
+            print("Se produjo un error:", error)
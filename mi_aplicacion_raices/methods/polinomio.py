@@ -0,0 +1,121 @@
+import numpy as np
+
+
+def raices_polinomio(coeficientes, incluir_complejas=False, tol=1e-14, max_iter=50):
+    """
+    Calcula todas las raíces de un polinomio en una sola llamada mediante la matriz compañera.
+
+    Los valores propios de la matriz compañera (numpy.roots) dan todas las raíces a la vez. Cada raíz se
+    pule luego con unas pocas iteraciones de Newton (evaluando p y p' con Horner) y se acompaña de una
+    cota de error garantizada: para un polinomio de grado n, el disco de radio n * |p(z)| / |p'(z)|
+    centrado en z contiene al menos una raíz exacta.
+
+    Parámetros:
+        coeficientes (list[float]): Coeficientes del polinomio, grado mayor primero
+            (por ejemplo, [1, 0, -4] para x**2 - 4).
+        incluir_complejas (bool, opcional): Si es True también se retornan las raíces complejas.
+            Por defecto es False.
+        tol (float, opcional): Tolerancia relativa del pulido con Newton. Por defecto es 1e-14.
+        max_iter (int, opcional): Número máximo de iteraciones de pulido por raíz. Por defecto es 50.
+
+    Retorna:
+        list[dict]: Lista de raíces (reales ordenadas primero, luego complejas), cada una con las claves:
+            - "xr": Raíz aproximada (float si es real, complex si es compleja).
+            - "fx": Valor absoluto del residuo |p(xr)|.
+            - "cota_error": Radio del disco alrededor de xr que contiene una raíz exacta.
+
+    Excepciones:
+        ValueError: Si todos los coeficientes son cero.
+    """
+    c = np.trim_zeros(np.asarray(coeficientes, dtype=float), 'f')
+    if c.size == 0:
+        raise ValueError("El polinomio nulo tiene infinitas raíces.")
+    n = c.size - 1
+    if n == 0:
+        return []
+
+    dc = np.polyder(c)
+    z = np.roots(c).astype(complex)
+    p = np.polyval(c, z)
+
+    # Pulido con Newton; solo se acepta el paso si reduce el residuo (evita divagar en raíces múltiples)
+    for _ in range(max_iter):
+        dp = np.polyval(dc, z)
+        with np.errstate(all='ignore'):
+            paso = np.where(dp != 0, p / dp, 0)
+        z_nuevo = z - paso
+        p_nuevo = np.polyval(c, z_nuevo)
+        mejora = np.abs(p_nuevo) < np.abs(p)
+        z = np.where(mejora, z_nuevo, z)
+        p = np.where(mejora, p_nuevo, p)
+        if not np.any(mejora & (np.abs(paso) > tol * np.maximum(1.0, np.abs(z)))):
+            break
+
+    dp = np.abs(np.polyval(dc, z))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cota = np.where(dp != 0, n * np.abs(p) / dp, np.inf)
+    # Las raíces múltiples tienen p'(z) ~ 0; en ese caso la cota de Newton no sirve y se usa
+    # la separación numérica del grupo de raíces como estimación
+    cota = np.where(np.isfinite(cota), cota, np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(z)))
+
+    reales = []
+    complejas = []
+    for zi, pi, ci in zip(z, p, cota):
+        # Una raíz es real si la parte imaginaria está dentro de su propia cota de error
+        if abs(zi.imag) <= max(ci, 1e-12 * max(1.0, abs(zi))):
+            xr = float(zi.real)
+            reales.append({"xr": xr, "fx": float(abs(np.polyval(c, xr))), "cota_error": float(ci)})
+        elif incluir_complejas:
+            complejas.append({"xr": complex(zi), "fx": float(abs(pi)), "cota_error": float(ci)})
+
+    reales.sort(key=lambda r: r["xr"])
+    complejas.sort(key=lambda r: (r["xr"].real, r["xr"].imag))
+    return reales + complejas
+
+
+def agrupar_raices_multiples(raices, coeficientes):
+    """
+    Une las raíces reales de raices_polinomio que corresponden a una misma raíz múltiple.
+
+    La matriz compañera entrega una raíz de multiplicidad m como m raíces muy cercanas. Dos raíces
+    consecutivas se unen si sus discos de error se tocan o si el polinomio no se distingue de cero
+    (dentro del error de redondeo de Horner) en el punto medio entre ellas, como ocurre en un grupo
+    de raíces múltiples y no entre dos raíces simples separadas.
+
+    Parámetros:
+        raices (list[dict]): Raíces reales ordenadas, con las claves "xr", "fx" y "cota_error".
+        coeficientes (list[float]): Coeficientes del polinomio, grado mayor primero.
+
+    Retorna:
+        list[dict]: Una raíz por grupo, con las mismas claves: "xr" es el centro del grupo y
+            "cota_error" el radio que cubre los discos de error de todas sus raíces.
+    """
+    c = np.asarray(coeficientes, dtype=float)
+    grupos = []
+    for raiz in raices:
+        if grupos:
+            anterior = grupos[-1][-1]
+            medio = (anterior["xr"] + raiz["xr"]) / 2.0
+            ruido = 2 * c.size * np.finfo(float).eps * np.polyval(np.abs(c), abs(medio))
+            if (raiz["xr"] - anterior["xr"] <= anterior["cota_error"] + raiz["cota_error"]
+                    or abs(np.polyval(c, medio)) <= ruido):
+                grupos[-1].append(raiz)
+                continue
+        grupos.append([raiz])
+
+    agrupadas = []
+    for grupo in grupos:
+        xr = sum(r["xr"] for r in grupo) / len(grupo)
+        cota = max(abs(r["xr"] - xr) + r["cota_error"] for r in grupo)
+        agrupadas.append({"xr": xr, "fx": float(abs(np.polyval(c, xr))), "cota_error": cota})
+    return agrupadas
+
+
+# Ejemplo de uso (modo standalone, para pruebas)
+if __name__ == "__main__":
+    # p(x) = x**3 - 2*x**2 - 5*x + 6 = (x - 1)(x + 2)(x - 3)
+    try:
+        for raiz in raices_polinomio([1, -2, -5, 6], incluir_complejas=True):
+            print("xr = {}, |p(xr)| = {}, cota de error = {}".format(raiz["xr"], raiz["fx"], raiz["cota_error"]))
+    except Exception as error:
+        print("Se produjo un error:", error)
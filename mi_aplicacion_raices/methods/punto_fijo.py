@@ -23,13 +23,22 @@ def punto_fijo(g, x0, tol, max_iter=100):
         ValueError: Si tol o max_iter no son positivos.
         Exception: Para errores que surjan durante la evaluación de la función g en alguna iteración.
     """
+    return list(punto_fijo_iter(g, x0, tol, max_iter))
+
+
+def punto_fijo_iter(g, x0, tol, max_iter=100):
+    """Igual que punto_fijo, pero retorna un generador que produce las iteraciones una a una."""
     # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero.
     if tol <= 0:
         raise ValueError("La tolerancia debe ser un número positivo.")
     if max_iter <= 0:
         raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
 
-    iteraciones = []  # Lista para almacenar los resultados de cada iteración.
+    return _generar_punto_fijo(g, x0, tol, max_iter)
+
+
+def _generar_punto_fijo(g, x0, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en punto_fijo_iter.
     x_old = x0  # Se asigna el valor inicial.
 
     # Bucle para realizar las iteraciones del método de punto fijo.
@@ -54,11 +63,11 @@ def punto_fijo(g, x0, tol, max_iter=100):
                 ea = float('inf')
 
         # Registrar la iteración actual en la lista.
-        iteraciones.append({
+        yield {
             "x_old": x_old,
             "x_new": x_new,
             "ea": ea
-        })
+        }
 
         # Si ya se calculó un error y este es menor que la tolerancia, se detiene el proceso.
         if ea is not None and ea < tol:
@@ -67,8 +76,6 @@ def punto_fijo(g, x0, tol, max_iter=100):
         # Actualizar x_old para la siguiente iteración.
         x_old = x_new
 
-    return iteraciones
-
 
 # Ejemplo de uso (para pruebas en modo standalone, no se ejecuta en la integración con el frontend):
 if __name__ == "__main__":
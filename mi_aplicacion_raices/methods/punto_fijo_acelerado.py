@@ -0,0 +1,133 @@
+def punto_fijo_acelerado(g, x0, tol, max_iter=100, aceleracion="aitken"):
+    """
+    Implementa el método de punto fijo con aceleración de la convergencia.
+
+    La iteración de punto fijo x = g(x) converge linealmente (el error se reduce por |g'(x)| en cada paso).
+    Se ofrecen dos formas de acelerarla con el proceso Δ² de Aitken:
+        - "aitken": se itera x_{k+1} = g(x_k) como siempre (una evaluación de g por iteración) y a cada
+          terna de iterados consecutivos se le aplica
+              x̂ = x_k - (x_{k+1} - x_k)**2 / (x_{k+2} - 2*x_{k+1} + x_k),
+          que converge al punto fijo mucho más rápido que la sucesión original; el criterio de parada
+          se aplica a la sucesión acelerada.
+        - "steffensen": en cada iteración se calculan g(x) y g(g(x)) y se reinicia desde el valor
+          acelerado x̂ (dos evaluaciones de g por iteración). Converge cuadráticamente, como Newton,
+          sin necesitar la derivada.
+
+    Parámetros:
+        g (function): Función iterativa g(x) de la forma x = g(x).
+        x0 (float): Valor inicial para la iteración (ingresado por el usuario).
+        tol (float): Tolerancia para el error porcentual aproximado (ingresado por el usuario).
+        max_iter (int, opcional): Número máximo de iteraciones permitidas. Por defecto es 100.
+        aceleracion (str, opcional): "aitken" (por defecto) o "steffensen".
+
+    Retorna:
+        list[dict]: Lista de diccionarios, cada uno representando una iteración, con las siguientes claves:
+            - "x_old": Valor anterior de la aproximación.
+            - "x_g": Valor de g(x_old) (el paso de punto fijo sin acelerar).
+            - "x_new": Nueva aproximación acelerada.
+            - "ea": Error porcentual aproximado entre las dos últimas aproximaciones aceleradas
+              (None en la primera iteración).
+
+    Excepciones:
+        ValueError: Si tol o max_iter no son positivos, o si la aceleración no es reconocida.
+        Exception: Para otros errores que surjan durante la evaluación de g.
+    """
+    return list(punto_fijo_acelerado_iter(g, x0, tol, max_iter, aceleracion))
+
+
+def punto_fijo_acelerado_iter(g, x0, tol, max_iter=100, aceleracion="aitken"):
+    """
+    Versión por generador del método de punto fijo acelerado: valida los datos de inmediato (lanza las
+    mismas excepciones que punto_fijo_acelerado) y retorna un generador que produce las iteraciones una a una.
+    """
+    # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero.
+    if tol <= 0:
+        raise ValueError("La tolerancia debe ser un número positivo.")
+    if max_iter <= 0:
+        raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
+    if aceleracion == "aitken":
+        return _generar_aitken(g, x0, tol, max_iter)
+    if aceleracion == "steffensen":
+        return _generar_steffensen(g, x0, tol, max_iter)
+    raise ValueError("Aceleración no reconocida: {}.".format(aceleracion))
+
+
+def _delta2(x0, x1, x2):
+    """Proceso Δ² de Aitken sobre tres iterados consecutivos (retorna x2 si el denominador es cero)."""
+    denominador = x2 - 2 * x1 + x0
+    if denominador == 0:
+        return x2
+    return x0 - (x1 - x0) ** 2 / denominador
+
+
+def _error(x_new, x_old):
+    # Error porcentual aproximado; si x_new es 0 se usa la diferencia absoluta.
+    if x_new == 0:
+        return abs(x_new - x_old)
+    return abs((x_new - x_old) / x_new) * 100
+
+
+def _generar_aitken(g, x0, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en punto_fijo_acelerado_iter.
+    x_ant = None       # Iterado x_{k-1} de la sucesión original
+    x_old = x0         # Iterado x_k
+    acelerado = None   # Última aproximación acelerada
+
+    for i in range(max_iter):
+        try:
+            x_g = g(x_old)  # x_{k+1}
+        except Exception as e:
+            raise Exception("Error al evaluar la función g en la iteración {}: {}".format(i + 1, e))
+
+        # Con tres iterados consecutivos ya se puede acelerar
+        x_new = _delta2(x_ant, x_old, x_g) if x_ant is not None else x_g
+        ea = _error(x_new, acelerado) if acelerado is not None else None
+
+        yield {"x_old": x_old, "x_g": x_g, "x_new": x_new, "ea": ea}
+
+        if (ea is not None and ea < tol) or x_g == x_old:
+            break
+
+        acelerado = x_new
+        x_ant, x_old = x_old, x_g
+
+
+def _generar_steffensen(g, x0, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en punto_fijo_acelerado_iter.
+    x_old = x0
+
+    for i in range(max_iter):
+        try:
+            x_g = g(x_old)
+            x_gg = g(x_g)
+        except Exception as e:
+            raise Exception("Error al evaluar la función g en la iteración {}: {}".format(i + 1, e))
+
+        # Se reinicia la iteración desde el valor acelerado
+        x_new = _delta2(x_old, x_g, x_gg)
+        ea = _error(x_new, x_old) if i > 0 else None
+
+        yield {"x_old": x_old, "x_g": x_g, "x_new": x_new, "ea": ea}
+
+        if (ea is not None and ea < tol) or x_new == x_old:
+            break
+
+        x_old = x_new
+
+
+# Ejemplo de uso (para pruebas en modo standalone, no se ejecuta en la integración con el frontend):
+if __name__ == "__main__":
+    import math
+
+    # x = cos(x): el punto fijo sin acelerar necesita unas 30 iteraciones para tol = 1e-6
+    g = lambda x: math.cos(x)
+
+    for aceleracion in ("aitken", "steffensen"):
+        try:
+            resultados = punto_fijo_acelerado(g, 0.5, 1e-6, 100, aceleracion)
+            print(aceleracion)
+            for idx, iteracion in enumerate(resultados, start=1):
+                print("Iteración {}: x_old = {}, x_new = {}, ea = {}".format(
+                    idx, iteracion["x_old"], iteracion["x_new"], iteracion["ea"]))
+        except Exception as error:
+            print("Se produjo un error:", error)
@@ -0,0 +1,134 @@
+import math
+
+# Factor de contracción máximo para usar el paso de punto fijo. El error del punto fijo se reduce por
+# |g'(x)| en cada paso y el de la bisección a la mitad, así que por encima de 0.5 la bisección es más rápida.
+CONTRACCION_MAXIMA = 0.5
+
+
+def punto_fijo_seguro(g, a, b, tol, max_iter=100, x0=None):
+    """
+    Implementa el método de punto fijo con salvaguarda: la iteración x = g(x) protegida por bisección
+    sobre h(x) = g(x) - x dentro del intervalo [a, b].
+
+    En cada iteración se evalúa g una sola vez. Con ese valor se obtiene h(x) = g(x) - x, que indica en qué
+    lado del intervalo queda el punto fijo (el intervalo se reduce sin evaluaciones adicionales), y se estima
+    |g'(x)| con el cociente de diferencias de las dos últimas evaluaciones. Si |g'(x)| >= 1 (la iteración
+    no es contractiva y divergería u oscilaría), si |g'(x)| > CONTRACCION_MAXIMA (convergería más despacio
+    que la bisección) o si g(x) cae fuera del intervalo, el siguiente punto es el punto medio del intervalo
+    (bisección); en caso contrario es g(x), el paso de punto fijo.
+
+    Parámetros:
+        g (function): Función iterativa g(x) de la forma x = g(x).
+        a (float): Límite inferior del intervalo (ingresado por el usuario).
+        b (float): Límite superior del intervalo (ingresado por el usuario).
+        tol (float): Tolerancia para el error porcentual aproximado (ingresado por el usuario).
+        max_iter (int, opcional): Número máximo de iteraciones permitidas. Por defecto es 100.
+        x0 (float, opcional): Valor inicial dentro de [a, b]. Por defecto, el punto medio del intervalo.
+
+    Retorna:
+        list[dict]: Lista de diccionarios, cada uno representando una iteración, con las siguientes claves:
+            - "a": Límite inferior del intervalo después de la iteración.
+            - "b": Límite superior del intervalo después de la iteración.
+            - "x_old": Valor anterior de la aproximación.
+            - "x_new": Nueva aproximación calculada.
+            - "g_prima": Estimación de |g'(x_old)| (None mientras no hay dos evaluaciones).
+            - "ea": Error porcentual aproximado entre x_old y x_new (None en la primera iteración).
+            - "estrategia": Paso utilizado en la iteración: "punto_fijo" o "biseccion".
+
+    Excepciones:
+        ValueError: Si tol o max_iter no son positivos, si g(x) - x no cambia de signo en [a, b]
+            o si x0 está fuera del intervalo.
+        Exception: Para otros errores que surjan durante la evaluación de g.
+    """
+    return list(punto_fijo_seguro_iter(g, a, b, tol, max_iter, x0))
+
+
+def punto_fijo_seguro_iter(g, a, b, tol, max_iter=100, x0=None):
+    """
+    Versión por generador del método de punto fijo con salvaguarda: valida los datos de inmediato (lanza
+    las mismas excepciones que punto_fijo_seguro) y retorna un generador que produce las iteraciones una a una.
+    """
+    # Validar que la tolerancia y el número máximo de iteraciones sean mayores que cero.
+    if tol <= 0:
+        raise ValueError("La tolerancia debe ser un número positivo.")
+    if max_iter <= 0:
+        raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
+    if a > b:
+        a, b = b, a
+    if x0 is None:
+        x0 = (a + b) / 2.0
+    elif not a <= x0 <= b:
+        raise ValueError("El valor inicial x0 debe estar dentro del intervalo [a, b].")
+
+    # La salvaguarda necesita que h(x) = g(x) - x cambie de signo en el intervalo
+    try:
+        ha = g(a) - a
+        hb = g(b) - b
+    except Exception as e:
+        raise ValueError("Error al evaluar la función g en los extremos del intervalo: " + str(e))
+    if ha * hb >= 0:
+        raise ValueError("g(x) - x no cambia de signo en el intervalo [a, b]. Ingrese un intervalo válido.")
+
+    return _generar_punto_fijo_seguro(g, a, b, ha, x0, tol, max_iter)
+
+
+def _generar_punto_fijo_seguro(g, a, b, ha, x, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en punto_fijo_seguro_iter.
+    x_ant = gx_ant = None  # Evaluación anterior, para estimar |g'(x)|
+
+    for i in range(max_iter):
+        try:
+            gx = g(x)
+        except Exception as e:
+            raise Exception("Error al evaluar la función g en la iteración {}: {}".format(i + 1, e))
+        h = gx - x
+
+        # h(x) = g(x) - x indica en qué lado está el punto fijo: el intervalo se reduce sin evaluar de nuevo
+        if ha * h < 0:
+            b = x
+        elif h != 0:
+            a, ha = x, h
+
+        # Estimación de |g'(x)| con las dos últimas evaluaciones (válida sea cual sea el paso anterior)
+        g_prima = None
+        if x_ant is not None and x != x_ant:
+            g_prima = abs((gx - gx_ant) / (x - x_ant))
+
+        # Salvaguarda: bisección si la iteración diverge, avanza más lento que la bisección o se sale del intervalo
+        if h == 0:
+            estrategia, x_new = "punto_fijo", x
+        elif (g_prima is not None and g_prima > CONTRACCION_MAXIMA) or not math.isfinite(gx) or not a < gx < b:
+            estrategia, x_new = "biseccion", (a + b) / 2.0
+        else:
+            estrategia, x_new = "punto_fijo", gx
+
+        # Calcular el error porcentual aproximado (ea) si no es la primera iteración.
+        if i == 0:
+            ea = None
+        elif x_new == 0:
+            ea = abs(x_new - x)
+        else:
+            ea = abs((x_new - x) / x_new) * 100
+
+        yield {"a": a, "b": b, "x_old": x, "x_new": x_new, "g_prima": g_prima, "ea": ea, "estrategia": estrategia}
+
+        if (ea is not None and ea < tol) or h == 0:
+            break
+
+        x_ant, gx_ant = x, gx
+        x = x_new
+
+
+# Ejemplo de uso (modo standalone, para pruebas, no se ejecuta en la integración con el front-end):
+if __name__ == "__main__":
+    # g(x) = x**3 - 1 tiene |g'| > 1 cerca del punto fijo (x ≈ 1.3247): el punto fijo clásico diverge,
+    # mientras que la versión con salvaguarda cambia a bisección y converge.
+    g = lambda x: x ** 3 - 1
+
+    try:
+        resultados = punto_fijo_seguro(g, 1, 2, 1e-6, 100)
+        for idx, iteracion in enumerate(resultados, start=1):
+            print("Iteración {}: [{}] x_new = {}, |g'| = {}, ea = {}".format(
+                idx, iteracion["estrategia"], iteracion["x_new"], iteracion["g_prima"], iteracion["ea"]))
+    except Exception as error:
+        print("Se produjo un error:", error)
@@ -27,13 +27,22 @@ def secante(f, x0, x1, tol, max_iter=100):
         ZeroDivisionError: Si se produce una división por cero en la fórmula (cuando f(x1) - f(x0) es 0).
         Exception: Para otros errores que surjan durante la evaluación de la función f.
     """
+    return list(secante_iter(f, x0, x1, tol, max_iter))
+
+
+def secante_iter(f, x0, x1, tol, max_iter=100):
+    """Igual que secante, pero retorna un generador que produce las iteraciones una a una."""
     # Validar que la tolerancia y el número máximo de iteraciones sean positivos.
     if tol <= 0:
         raise ValueError("La tolerancia debe ser un número positivo.")
     if max_iter <= 0:
         raise ValueError("El número máximo de iteraciones debe ser mayor que cero.")
 
-    iteraciones = []  # Lista para almacenar los resultados de cada iteración
+    return _generar_secante(f, x0, x1, tol, max_iter)
+
+
+def _generar_secante(f, x0, x1, tol, max_iter):
+    # Bucle del método; la validación de los datos ya se hizo en secante_iter.
 
     # Iterar hasta alcanzar el máximo de iteraciones
     for i in range(max_iter):
@@ -69,13 +78,13 @@ def secante(f, x0, x1, tol, max_iter=100):
                 ea = float('inf')
 
         # Registrar la iteración actual.
-        iteraciones.append({
+        yield {
             "x0": x0,
             "x1": x1,
             "x_new": x_new,
             "f_x_new": f(x_new),
             "ea": ea
-        })
+        }
 
         # Si se puede calcular el error y es menor que la tolerancia, finalizar el proceso.
         if ea is not None and ea < tol:
@@ -85,8 +94,6 @@ def secante(f, x0, x1, tol, max_iter=100):
         # Se asigna a x0 el valor actual de x1 y a x1 el valor de x_new.
         x0, x1 = x1, x_new
 
-    return iteraciones
-
 
 # Ejemplo de uso (modo standalone, para pruebas)
 if __name__ == "__main__":
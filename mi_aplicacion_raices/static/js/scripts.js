@@ -0,0 +1,152 @@
+// static/js/scripts.js
+
+// Dibuja en un <canvas> la gráfica de la función a partir de los puntos (x, f(x)) que entrega /api/grafica.
+// Así el servidor no tiene que generar ni guardar una imagen por cada solicitud.
+function dibujarGrafica(canvas, datos) {
+  var escalaPixel = window.devicePixelRatio || 1;
+  var ancho = canvas.clientWidth || canvas.width;
+  var alto = canvas.clientHeight || canvas.height;
+  canvas.width = ancho * escalaPixel;
+  canvas.height = alto * escalaPixel;
+
+  var ctx = canvas.getContext("2d");
+  ctx.scale(escalaPixel, escalaPixel);
+  ctx.clearRect(0, 0, ancho, alto);
+
+  var margen = 40;
+  var xMin = datos.x[0];
+  var xMax = datos.x[datos.x.length - 1];
+  var yMin = datos.y_min;
+  var yMax = datos.y_max;
+
+  // Conversión de coordenadas de la función a píxeles del canvas
+  function px(x) { return margen + (x - xMin) / (xMax - xMin) * (ancho - 2 * margen); }
+  function py(y) { return alto - margen - (y - yMin) / (yMax - yMin) * (alto - 2 * margen); }
+
+  // Ejes
+  ctx.strokeStyle = "#000";
+  ctx.lineWidth = 1;
+  ctx.strokeRect(margen, margen, ancho - 2 * margen, alto - 2 * margen);
+  if (yMin < 0 && yMax > 0) {
+    ctx.beginPath();
+    ctx.moveTo(margen, py(0));
+    ctx.lineTo(ancho - margen, py(0));
+    ctx.stroke();
+  }
+  ctx.fillStyle = "#343a40";
+  ctx.font = "12px sans-serif";
+  ctx.fillText(xMin.toPrecision(3), margen, alto - margen + 15);
+  ctx.fillText(xMax.toPrecision(3), ancho - margen - 30, alto - margen + 15);
+  ctx.fillText(yMax.toPrecision(3), 2, margen + 4);
+  ctx.fillText(yMin.toPrecision(3), 2, alto - margen);
+
+  // Curva: se recorta al rango visible y se corta la línea donde y es null (polos o fuera del dominio)
+  ctx.save();
+  ctx.beginPath();
+  ctx.rect(margen, margen, ancho - 2 * margen, alto - 2 * margen);
+  ctx.clip();
+  ctx.strokeStyle = "#1f77b4";
+  ctx.lineWidth = 1.5;
+  ctx.beginPath();
+  var trazando = false;
+  for (var i = 0; i < datos.x.length; i++) {
+    if (datos.y[i] === null) {
+      trazando = false;
+      continue;
+    }
+    if (trazando) {
+      ctx.lineTo(px(datos.x[i]), py(datos.y[i]));
+    } else {
+      ctx.moveTo(px(datos.x[i]), py(datos.y[i]));
+      trazando = true;
+    }
+  }
+  ctx.stroke();
+
+  // Raíces aproximadas
+  ctx.fillStyle = "#d62728";
+  datos.raices.forEach(function (raiz) {
+    if (raiz.y === null) {
+      return;
+    }
+    ctx.beginPath();
+    ctx.arc(px(raiz.x), py(raiz.y), 4, 0, 2 * Math.PI);
+    ctx.fill();
+  });
+  ctx.restore();
+}
+
+// Pide los puntos de la gráfica a 'url' y la dibuja en el canvas
+function cargarGrafica(canvas, url) {
+  fetch(url)
+    .then(function (respuesta) { return respuesta.json(); })
+    .then(function (datos) {
+      if (datos.error) {
+        canvas.insertAdjacentText("afterend", "No se pudo graficar la función: " + datos.error);
+        return;
+      }
+      dibujarGrafica(canvas, datos);
+    });
+}
+
+// Recibe las iteraciones por Server-Sent Events y las agrega a la tabla a medida que llegan.
+// Las filas se acumulan y se insertan una vez por cuadro de animación, para no redibujar la
+// página con cada iteración cuando llegan miles.
+function transmitirIteraciones(tabla) {
+  var encabezado = tabla.querySelector("thead tr");
+  var cuerpo = tabla.querySelector("tbody");
+  var pendientes = document.createDocumentFragment();
+  var programado = false;
+  var fuente = new EventSource(tabla.dataset.streamUrl);
+
+  function volcar() {
+    cuerpo.appendChild(pendientes);
+    programado = false;
+  }
+
+  fuente.onmessage = function (evento) {
+    var fila = JSON.parse(evento.data);
+    if (!encabezado.children.length) {
+      Object.keys(fila).forEach(function (columna) {
+        var th = document.createElement("th");
+        th.textContent = columna;
+        encabezado.appendChild(th);
+      });
+    }
+    var tr = document.createElement("tr");
+    Object.keys(fila).forEach(function (columna) {
+      var td = document.createElement("td");
+      td.textContent = fila[columna] === null ? "None" : fila[columna];
+      tr.appendChild(td);
+    });
+    pendientes.appendChild(tr);
+    if (!programado) {
+      programado = true;
+      window.requestAnimationFrame(volcar);
+    }
+  };
+
+  // Se cierra la conexión al terminar; si no, EventSource volvería a conectarse y repetiría el cálculo
+  fuente.addEventListener("fin", function (evento) {
+    fuente.close();
+    var datos = JSON.parse(evento.data);
+    var canvas = document.getElementById("grafica-en-vivo");
+    if (canvas && datos.plot_url) {
+      cargarGrafica(canvas, datos.plot_url);
+    }
+  });
+  fuente.addEventListener("fallo", function (evento) {
+    fuente.close();
+    tabla.insertAdjacentText("afterend", "Se produjo un error: " + JSON.parse(evento.data).error);
+  });
+  fuente.onerror = function () {
+    fuente.close();
+  };
+}
+
+document.addEventListener("DOMContentLoaded", function () {
+  document.querySelectorAll("canvas[data-grafica-url]").forEach(function (canvas) {
+    cargarGrafica(canvas, canvas.dataset.graficaUrl);
+  });
+  document.querySelectorAll("table[data-stream-url]").forEach(transmitirIteraciones);
+});
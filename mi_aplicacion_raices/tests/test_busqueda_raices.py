@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+from methods.busqueda_raices import buscar_intervalos, buscar_raices
+from utils.resolver import ContadorEvaluaciones, resolver_problema
+
+
+def test_varios_cambios_de_signo():
+    raices = buscar_raices(np.sin, -10, 10, 1e-10)
+    assert [r["xr"] for r in raices] == pytest.approx([k * math.pi for k in range(-3, 4)], abs=1e-9)
+    for raiz in raices:
+        assert raiz["a"] <= raiz["xr"] <= raiz["b"]
+
+
+def test_muestreo_vectorizado():
+    # Todas las muestras se evalúan en una sola llamada con un arreglo de NumPy
+    llamadas = []
+
+    def f(x):
+        llamadas.append(np.shape(x))
+        return np.cos(3 * x)
+
+    ceros, cambios, minimos = buscar_intervalos(f, 0, 4, n_muestras=400)
+    assert llamadas == [(401,)]
+    assert len(cambios) == 4  # cos(3x) se anula en pi/6, pi/2, 5pi/6 y 7pi/6
+    assert np.all(np.sign(np.cos(3 * cambios[:, 0])) != np.sign(np.cos(3 * cambios[:, 1])))
+
+
+def test_polos_y_raiz_doble():
+    # Los polos de tan(x) cambian de signo pero no son raíces
+    assert [r["xr"] for r in buscar_raices(np.tan, -4, 4, 1e-10)] == pytest.approx([-math.pi, 0, math.pi], abs=1e-9)
+    # La raíz doble en 0.5 no cambia de signo: se encuentra como mínimo de |f|
+    raices = buscar_raices(lambda x: (x ** 2 - 4) * (x - 0.5) ** 2, -5.003, 5.001, 1e-10)
+    assert [r["xr"] for r in raices] == pytest.approx([-2, 0.5, 2], abs=1e-6)
+
+
+def test_intervalo_invalido():
+    with pytest.raises(ValueError):
+        buscar_raices(np.sin, 1, -1, 1e-6)
+
+
+def test_resolver_problema_cuenta_evaluaciones_por_elemento():
+    spec = {"metodo": "buscar_raices", "funcion": "sin(x)", "a": -10, "b": 10, "tolerancia": 1e-8}
+    resultado = resolver_problema(spec, False)
+    assert len(resultado["raiz"]) == 7
+    assert resultado["evaluaciones"] > 1001
+    contador = ContadorEvaluaciones(np.sin)
+    contador(np.zeros(5))
+    assert contador.evaluaciones == 5
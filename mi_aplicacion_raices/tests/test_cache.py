@@ -0,0 +1,86 @@
+import pickle
+
+import pytest
+
+from utils import cache
+from utils.cache import CacheMemoria, CacheSQLite, clave_problema
+
+BASE = {"metodo": "biseccion", "funcion": "x**2 - 4", "a": 1, "b": 3, "tolerancia": 1e-6}
+
+
+def test_claves_iguales_para_la_misma_especificacion():
+    claves = {
+        clave_problema(BASE),
+        clave_problema(dict(BASE, funcion="x**2-4", a="1.0", b=3.0)),
+        clave_problema(dict(BASE, funcion="  x ** 2 - 4 ", x0=7, max_iter=100)),  # x0 no lo usa la bisección
+    }
+    assert len(claves) == 1
+    assert clave_problema(BASE) != clave_problema(BASE, incluir_iteraciones=False)
+    assert clave_problema(BASE) != clave_problema(dict(BASE, b=4))
+
+
+def test_los_espacios_que_separan_tokens_cuentan():
+    assert clave_problema(dict(BASE, funcion="2 3")) != clave_problema(dict(BASE, funcion="23"))
+
+
+def test_bandera_complejas_como_al_resolver():
+    spec = {"metodo": "polinomio", "funcion": "x**2 + 1", "tolerancia": 1e-6}
+    assert clave_problema(dict(spec, complejas="false")) == clave_problema(spec)
+    assert clave_problema(dict(spec, complejas="on")) == clave_problema(dict(spec, complejas=True))
+    assert clave_problema(dict(spec, complejas="false")) != clave_problema(dict(spec, complejas="true"))
+
+
+class Reloj:
+    # Reemplaza a time en utils.cache: CacheMemoria usa monotonic y CacheSQLite usa time
+    def __init__(self):
+        self.ahora = 1000.0
+
+    def monotonic(self):
+        return self.ahora
+
+    def time(self):
+        return self.ahora
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(cache, "time", reloj)
+    return reloj
+
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def crear(request, tmp_path):
+    def crear(**opciones):
+        if request.param == "memoria":
+            return CacheMemoria(**opciones)
+        return CacheSQLite(str(tmp_path / "cache.sqlite3"), **opciones)
+    return crear
+
+
+def test_expulsa_los_menos_usados_al_superar_max_bytes(crear, reloj):
+    valor = "x" * 100
+    tamano = len(pickle.dumps(valor, pickle.HIGHEST_PROTOCOL))
+    c = crear(max_bytes=3 * tamano, ttl=None)
+    for clave in ("a", "b", "c"):
+        c.guardar(clave, valor)
+        reloj.ahora += 1
+    assert c.obtener("a") == valor  # "a" pasa a ser la más reciente
+    reloj.ahora += 1
+    c.guardar("d", valor)
+    assert c.obtener("b") is None
+    assert [c.obtener(clave) for clave in ("a", "c", "d")] == [valor] * 3
+    assert c.estadisticas()["bytes"] == 3 * tamano
+    # Un valor más grande que toda la caché no se guarda
+    c.guardar("enorme", "x" * (4 * tamano))
+    assert c.obtener("enorme") is None
+
+
+def test_vencimiento_por_ttl(crear, reloj):
+    c = crear(ttl=10)
+    c.guardar("clave", {"raiz": 2.0})
+    reloj.ahora += 9
+    assert c.obtener("clave") == {"raiz": 2.0}
+    reloj.ahora += 2
+    assert c.obtener("clave") is None
+    assert c.estadisticas()["aciertos"] == 1
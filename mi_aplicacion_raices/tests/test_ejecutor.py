@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from app import app
+import app as aplicacion
+from utils.ejecutor import PoolResolucion, PoolOcupado, ErrorPool
+
+DIVERGENTE = {"metodo": "punto_fijo", "funcion": "x + 1", "x0": 0, "tolerancia": 1e-300, "max_iter": 10 ** 9}
+SENCILLO = {"metodo": "biseccion", "funcion": "x**2 - 2", "a": 0, "b": 2, "tolerancia": 1e-6}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = PoolResolucion(procesos=1, timeout=5, limite_cpu=0.5)
+    yield pool
+    pool.cerrar()
+
+
+def test_limite_cpu_es_timeout(pool):
+    # El límite de CPU no debe llegar al cliente como un error de evaluación del método
+    with pytest.raises(TimeoutError):
+        pool.resolver(DIVERGENTE, False)
+    assert pool.resolver(SENCILLO, False)["raiz"] == pytest.approx(2 ** 0.5, rel=1e-6)
+
+
+def test_proceso_muerto_no_se_reutiliza(pool, monkeypatch):
+    proceso = pool._procesos[0].proceso
+    proceso.kill()
+    proceso.join()
+
+    def falla():
+        raise OSError("No se pudo crear el proceso.")
+
+    monkeypatch.setattr(pool, "_crear", falla)
+    with pytest.raises(RuntimeError):
+        pool.resolver(SENCILLO, False)
+    monkeypatch.undo()
+    # El lugar del proceso se conserva y se vuelve a intentar en la siguiente solicitud
+    assert pool.resolver(SENCILLO, False)["raiz"] == pytest.approx(2 ** 0.5, rel=1e-6)
+    assert pool._libres.qsize() == 1
+
+
+def ocupar(pool):
+    # Ocupa el único proceso del pool con un cálculo que termina al agotar el límite de CPU
+    hilo = threading.Thread(target=lambda: pytest.raises(TimeoutError, pool.resolver, DIVERGENTE, False))
+    hilo.start()
+    while pool._libres.qsize():
+        time.sleep(0.01)
+    return hilo
+
+
+def test_pool_ocupado(pool, monkeypatch):
+    monkeypatch.setattr(pool, "espera", 0.1)
+    hilo = ocupar(pool)
+    inicio = time.monotonic()
+    with pytest.raises(PoolOcupado):
+        pool.resolver(SENCILLO, False)
+    assert time.monotonic() - inicio < 0.5
+    hilo.join()
+
+
+def test_limite_de_tiempo_empieza_al_obtener_el_proceso(pool):
+    # La espera por el proceso ocupado (unos 0,5 s de CPU) no consume el límite de 0,2 s del cálculo
+    hilo = ocupar(pool)
+    assert pool.resolver(SENCILLO, False, timeout=0.2)["raiz"] == pytest.approx(2 ** 0.5, rel=1e-6)
+    hilo.join()
+
+
+def test_lote_deja_un_proceso_libre():
+    pool = PoolResolucion(procesos=3, timeout=5)
+    try:
+        en_curso = []
+        maximo = []
+        resolver = pool.resolver
+
+        def resolver_contando(*args, **kwargs):
+            en_curso.append(None)
+            maximo.append(len(en_curso))
+            time.sleep(0.05)
+            try:
+                return resolver(*args, **kwargs)
+            finally:
+                en_curso.pop()
+
+        pool.resolver = resolver_contando
+        resultados = pool.resolver_lote([SENCILLO] * 12)
+        assert len(resultados) == 12 and "error" not in resultados[0]
+        assert max(maximo) == 2
+    finally:
+        pool.cerrar()
+
+
+@pytest.mark.parametrize("error, estado", [
+    (TimeoutError("Lento."), 504), (ErrorPool("Murió."), 503), (PoolOcupado("Ocupado."), 503),
+])
+def test_errores_del_pool_no_son_del_cliente(monkeypatch, error, estado):
+    class PoolFallido:
+        def resolver(self, spec, incluir_iteraciones=True):
+            raise error
+
+    monkeypatch.setitem(app.config, "EJECUCION_AISLADA", True)
+    monkeypatch.setattr(aplicacion, "obtener_cache", lambda: None)
+    monkeypatch.setattr(aplicacion, "obtener_pool", PoolFallido)
+    cliente = app.test_client()
+    assert cliente.post("/api/solve", json=SENCILLO).status_code == estado
+    respuesta = cliente.post("/resultados", data=SENCILLO)
+    assert respuesta.status_code == estado
+    assert str(error).encode() in respuesta.data
+
+
+def test_error_de_validacion_en_el_formulario(monkeypatch):
+    monkeypatch.setitem(app.config, "EJECUCION_AISLADA", False)
+    respuesta = app.test_client().post("/resultados", data=dict(SENCILLO, funcion="x +"))
+    assert respuesta.status_code == 400
+    assert b"alert-danger" in respuesta.data
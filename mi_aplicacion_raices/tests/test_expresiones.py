@@ -0,0 +1,21 @@
+import time
+
+import pytest
+
+from utils import expresiones
+from utils.parser import parse_function
+
+
+@pytest.mark.parametrize("texto", ["x + 9**9**8", "x + 2**(10**9)", "x**(9**9**8)", "sqrt(2**(10**9)) + x"])
+def test_potencias_enormes_no_bloquean(texto):
+    # Las potencias de enteros demasiado grandes se calculan en punto flotante y fallan de inmediato
+    inicio = time.perf_counter()
+    f = expresiones.compilar(texto)
+    with pytest.raises(OverflowError):
+        f(1.0)
+    assert time.perf_counter() - inicio < 1
+
+
+def test_potencias_pequenas_siguen_exactas():
+    assert expresiones.coeficientes_polinomio("x*2**100 - 1") == ([2.0 ** 100, -1.0], True)
+    assert parse_function("x + 3**4")(1.0) == 82.0
@@ -0,0 +1,47 @@
+import os
+import time
+
+import pytest
+
+from app import app
+from utils import plot
+
+NOMBRE = "0123456789abcdef01234567.png"
+
+
+@pytest.mark.parametrize("error, estado", [(TimeoutError("Lenta."), 503), (ValueError("Falló el dibujo."), 404)])
+def test_grafica_pendiente_o_fallida(monkeypatch, error, estado):
+    def esperar_grafica(nombre, timeout=10):
+        raise error
+
+    monkeypatch.setattr(plot, "esperar_grafica", esperar_grafica)
+    respuesta = app.test_client().get("/graficas/" + NOMBRE)
+    assert respuesta.status_code == estado
+
+
+def test_poda_elimina_temporales_abandonados(monkeypatch, tmp_path):
+    monkeypatch.setattr(plot, "DIRECTORIO_GRAFICAS", str(tmp_path))
+    monkeypatch.setattr(plot, "MAX_GRAFICAS", 2)
+    ahora = time.time()
+    for i, nombre in enumerate(["a.png", "b.png", "c.png"]):
+        (tmp_path / nombre).write_bytes(b"png")
+        os.utime(tmp_path / nombre, (ahora - 30 + i, ahora - 30 + i))
+    viejo = tmp_path / "d.png.1.tmp"
+    viejo.write_bytes(b"")
+    os.utime(viejo, (ahora - plot.MAX_EDAD_TEMPORAL - 1,) * 2)
+    (tmp_path / "e.png.2.tmp").write_bytes(b"")  # Un dibujo en curso
+    plot._podar_cache()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.png", "c.png", "e.png.2.tmp"]
+
+
+def test_dibujo_fallido_no_deja_temporal(monkeypatch, tmp_path):
+    from matplotlib.figure import Figure
+
+    def savefig(self, ruta, **opciones):
+        open(ruta, "wb").close()
+        raise OSError("Disco lleno.")
+
+    monkeypatch.setattr(Figure, "savefig", savefig)
+    with pytest.raises(OSError):
+        plot._renderizar("x**2 - 4", -3, 3, [2], str(tmp_path / NOMBRE))
+    assert list(tmp_path.iterdir()) == []
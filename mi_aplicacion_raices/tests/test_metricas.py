@@ -0,0 +1,64 @@
+import pytest
+
+import app as aplicacion
+from app import app
+from utils.cache import CacheMemoria
+from utils.metricas import Metricas
+
+SPEC = {"metodo": "biseccion", "funcion": "x**3 - 2*x - 5", "a": 2, "b": 3, "tolerancia": 1e-8}
+
+
+@pytest.fixture
+def cliente(monkeypatch):
+    monkeypatch.setitem(app.config, "EJECUCION_AISLADA", False)
+    monkeypatch.setitem(app.config, "METRICAS", True)
+    monkeypatch.setattr(aplicacion, "_metricas", Metricas())
+    monkeypatch.setattr(aplicacion, "_cache", CacheMemoria())
+    return app.test_client()
+
+
+def etapas(cabecera):
+    # "parse;dur=0.120, cache;dur=0.010;desc="miss", total;dur=1.5" -> {"parse": "dur=0.120", ...}
+    return dict(parte.strip().split(";", 1) for parte in cabecera.split(","))
+
+
+def test_cabecera_server_timing(cliente):
+    respuesta = cliente.post("/api/solve", json=SPEC)
+    assert respuesta.status_code == 200
+    primera = etapas(respuesta.headers["Server-Timing"])
+    assert {"parse", "solve", "cache", "total"} <= set(primera)
+    assert primera["cache"].endswith('desc="miss"')
+    assert int(respuesta.headers["X-Evaluaciones"]) == respuesta.get_json()["evaluaciones"] > 0
+
+    # El mismo problema se responde desde la caché: no se analiza ni se resuelve
+    segunda = etapas(cliente.post("/api/solve", json=SPEC).headers["Server-Timing"])
+    assert segunda["cache"].endswith('desc="hit"')
+    assert "solve" not in segunda
+
+
+def test_metrics_acumula_por_vista(cliente):
+    for _ in range(2):
+        cliente.post("/api/solve", json=SPEC)
+    respuesta = cliente.get("/metrics")
+    assert "Server-Timing" not in respuesta.headers
+    datos = respuesta.get_json()
+    assert datos["solicitudes"] == {"api_solve": 2}
+    assert datos["problemas"] == 1
+    assert datos["etapas"]["solve"]["mediciones"] == 1
+    assert datos["etapas"]["total"]["mediciones"] == 2
+    assert datos["cache"]["tasa_aciertos"] == 0.5
+    assert datos["evaluaciones"]["por_problema"] == datos["evaluaciones"]["total"] > 0
+
+
+def test_sin_metricas(cliente, monkeypatch):
+    monkeypatch.setitem(app.config, "METRICAS", False)
+    assert "Server-Timing" not in cliente.post("/api/solve", json=SPEC).headers
+    assert cliente.get("/metrics").status_code == 404
+
+
+def test_perfil_muestreado(cliente, monkeypatch, tmp_path):
+    monkeypatch.setitem(app.config, "PERFILADO_MUESTREO", 1.0)
+    monkeypatch.setitem(app.config, "PERFILADO_DIRECTORIO", str(tmp_path))
+    cliente.post("/api/solve", json=SPEC)
+    [perfil] = tmp_path.iterdir()
+    assert perfil.name.endswith(".prof") and "-api_solve-" in perfil.name
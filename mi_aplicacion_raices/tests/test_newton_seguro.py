@@ -0,0 +1,36 @@
+import pytest
+
+from app import app
+from utils.resolver import resolver_problema
+
+# f'(0) = 0: Newton puro no puede dar el primer paso desde x0 = 0
+SPEC = {"metodo": "newton_seguro", "funcion": "x**2 - 4", "derivada": "2*x", "a": -1, "b": 3, "x0": 0,
+        "tolerancia": 1e-10}
+
+
+def test_derivada_nula_cambia_a_biseccion():
+    resultado = resolver_problema(SPEC)
+    datos = resultado["datos"]
+    assert datos[0]["estrategia"] == "biseccion"
+    assert datos[0]["x_new"] == 1.0  # Punto medio de [-1, 3]
+    assert {fila["estrategia"] for fila in datos[1:]} == {"newton"}
+    assert resultado["raiz"] == pytest.approx(2.0, abs=1e-12)
+    with pytest.raises(ZeroDivisionError):
+        resolver_problema(dict(SPEC, metodo="newton_raphson"))
+
+
+def test_sin_derivada_usa_secante():
+    spec = {"metodo": "newton_seguro", "funcion": "x**3 - 2*x - 5", "a": 2, "b": 3, "tolerancia": 1e-10}
+    datos = resolver_problema(spec)["datos"]
+    assert {fila["estrategia"] for fila in datos} == {"secante"}
+    assert datos[-1]["x_new"] == pytest.approx(2.0945514815423265, abs=1e-12)
+
+
+def test_formulario_con_derivada(monkeypatch):
+    monkeypatch.setitem(app.config, "EJECUCION_AISLADA", False)
+    cliente = app.test_client()
+    pagina = cliente.get("/").data
+    assert b'name="derivada"' in pagina and b'name="x1"' in pagina
+    respuesta = cliente.post("/resultados", data=dict(SPEC, x1=""))
+    assert respuesta.status_code == 200
+    assert b"biseccion" in respuesta.data
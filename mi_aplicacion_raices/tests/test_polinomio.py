@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from methods.polinomio import raices_polinomio
+from utils.resolver import resolver_problema
+
+
+@pytest.mark.parametrize("coeficientes", [[1, -2, -5, 6], [2, 0, -3, 1, 5, -1], [1, 0, 0, 0, -16]])
+def test_raices_coinciden_con_numpy(coeficientes):
+    raices = raices_polinomio(coeficientes, incluir_complejas=True)
+    esperadas = np.roots(coeficientes)
+    assert len(raices) == len(esperadas)
+    for raiz in raices:
+        # Cada raíz pulida está cerca de alguna de numpy y dentro de su propia cota de error
+        assert np.min(np.abs(esperadas - raiz["xr"])) < 1e-9
+        assert raiz["fx"] < 1e-9
+
+
+def test_raiz_multiple_se_reporta_una_vez():
+    spec = {"metodo": "buscar_raices", "funcion": "(x**2 - 4)*(x - 1)**4", "a": -5, "b": 5, "tolerancia": 1e-6}
+    raices = resolver_problema(spec)["raiz"]
+    assert raices == pytest.approx([-2, 1, 2], abs=1e-3)
+
+
+def test_intervalo_invertido_en_polinomio():
+    spec = {"metodo": "buscar_raices", "funcion": "x**2 - 4", "a": 5, "b": -5, "tolerancia": 1e-6}
+    with pytest.raises(ValueError, match="menor que el límite superior"):
+        resolver_problema(spec)
@@ -0,0 +1,36 @@
+import pytest
+
+from app import app
+from utils.resolver import resolver_problema
+
+# g(x) = cos(x) converge linealmente al punto fijo 0.7390851332... (|g'(r)| ≈ 0.67)
+G = {"funcion": "cos(x)", "x0": 1, "tolerancia": 1e-10}
+
+
+def resolver(metodo):
+    return resolver_problema(dict(G, metodo=metodo), False)
+
+
+def test_steffensen_converge_cuadraticamente():
+    simple = resolver("punto_fijo")
+    steffensen = resolver("punto_fijo_steffensen")
+    assert simple["orden_convergencia"] == pytest.approx(1, abs=0.05)
+    assert steffensen["orden_convergencia"] == pytest.approx(2, abs=0.1)
+    assert steffensen["raiz"] == pytest.approx(simple["raiz"], abs=1e-9)
+    assert steffensen["evaluaciones"] < simple["evaluaciones"] / 5
+
+
+def test_aitken_acelera_la_convergencia_lineal():
+    simple = resolver("punto_fijo")
+    aitken = resolver("punto_fijo_aitken")
+    assert aitken["raiz"] == pytest.approx(0.7390851332151607, abs=1e-9)
+    assert aitken["iteraciones"] < simple["iteraciones"] / 2
+
+
+def test_formulario_con_valor_inicial(monkeypatch):
+    monkeypatch.setitem(app.config, "EJECUCION_AISLADA", False)
+    cliente = app.test_client()
+    assert b'name="x0"' in cliente.get("/").data
+    respuesta = cliente.post("/resultados", data=dict(G, metodo="punto_fijo_steffensen", a="", b=""))
+    assert respuesta.status_code == 200
+    assert b"0.73908513" in respuesta.data
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from app import app
+from utils.parser import parse_sistema
+
+
+def test_jacobiano_de_abs():
+    # abs(x) se deriva como sign(x); antes quedaba una Derivative que lambdify no podía compilar
+    F, FJ, variables = parse_sistema("abs(x) - 1; y")
+    f_x, jacobiano = FJ(np.array([-0.5, 2.0]))
+    assert variables == ("x", "y")
+    assert f_x.tolist() == [-0.5, 2.0]
+    assert jacobiano.tolist() == [[-1.0, 0.0], [0.0, 1.0]]
+
+
+def test_api_resuelve_sistema_con_abs():
+    respuesta = app.test_client().post("/api/solve", json={
+        "metodo": "newton_sistemas", "funcion": "abs(x)-1; y", "x0": [0.5, 1], "tolerancia": 1e-8,
+    })
+    assert respuesta.status_code == 200
+    assert respuesta.get_json()["raiz"] == [1.0, 0.0]
+
+
+def test_clave_de_cache_de_x0_vectorial():
+    from utils.cache import clave_problema
+    spec = {"metodo": "newton_sistemas", "funcion": "x**2 + y**2 = 4; x*y = 1", "tolerancia": 1e-8}
+    claves = {clave_problema(dict(spec, x0=x0)) for x0 in ("2, 0.5", "2,0.5", [2, 0.5], "2 0.5")}
+    assert len(claves) == 1
+
+
+def test_newton_no_evalua_el_jacobiano_final():
+    from methods.newton_sistemas import newton_sistemas
+    F, FJ, _ = parse_sistema("x**2 + y**2 = 4; x*y = 1")
+    llamadas = {"f": 0, "fj": 0}
+
+    def f(x):
+        llamadas["f"] += 1
+        return F(x)
+
+    def fj(x):
+        llamadas["fj"] += 1
+        return FJ(x)
+
+    filas = newton_sistemas(fj, [2, 0.5], 1e-8, f=f)
+    # F y J juntos en x0 y en cada iteración salvo la última, que solo necesita F para el residuo
+    assert llamadas == {"f": 1, "fj": len(filas)}
+
+
+def test_iteraciones_de_un_sistema():
+    from utils.resolver import resolver_problema
+    spec = {"metodo": "newton_sistemas", "funcion": "x**2 + y**2 = 4; x*y = 1", "x0": [2, 0.5],
+            "tolerancia": 1e-8}
+    assert resolver_problema(spec)["iteraciones"] == resolver_problema(spec, False)["iteraciones"] == 4
+
+
+def test_formulario_resuelve_un_sistema(monkeypatch):
+    monkeypatch.setitem(app.config, "EJECUCION_AISLADA", False)
+    cliente = app.test_client()
+    pagina = cliente.get("/").data
+    assert b'value="newton_sistemas"' in pagina and b'value="broyden"' in pagina and b'name="variables"' in pagina
+    for metodo in ("newton_sistemas", "broyden"):
+        respuesta = cliente.post("/resultados", data={
+            "metodo": metodo, "funcion": "x**2 + y**2 = 4; x*y = 1", "x0": "2, 0.5", "variables": "x, y",
+            "tolerancia": "1e-8", "a": "", "b": "",
+        })
+        assert respuesta.status_code == 200
+        assert b"1.9318516" in respuesta.data
+
+
+@pytest.mark.parametrize("x0", ["1,,2", "1, 2,", "1, nan", "1; inf", "[1, 2]", [[1], 2], [True, 1], {"x": 1, "y": 2}])
+def test_vector_mal_formado(x0):
+    respuesta = app.test_client().post("/api/solve", json={
+        "metodo": "newton_sistemas", "funcion": "x**2 + y**2 = 4; x*y = 1", "x0": x0, "tolerancia": 1e-8,
+    })
+    assert respuesta.status_code == 400
+    assert "x0" in respuesta.get_json()["error"]
@@ -0,0 +1,32 @@
+import app as aplicacion
+from utils.ejecutor import PoolResolucion
+
+URL = "/resultados/stream?metodo=punto_fijo&funcion=x%2B1&x0=0&tolerancia=1e-300&max_iter=10000000"
+
+
+def test_desconexion_cancela_el_calculo(monkeypatch):
+    pool = PoolResolucion(procesos=1, timeout=30)
+    monkeypatch.setattr(aplicacion, "_pool", pool)
+    monkeypatch.setitem(aplicacion.app.config, "EJECUCION_AISLADA", True)
+    # Se retiene una referencia al generador del pool (como la que puede quedar en un traceback o en un
+    # ciclo de referencias): la cancelación no debe depender de que el recolector de basura lo cierre
+    generadores = []
+    transmitir = pool.transmitir
+
+    def transmitir_retenido(*args, **kwargs):
+        generadores.append(transmitir(*args, **kwargs))
+        return generadores[-1]
+
+    monkeypatch.setattr(pool, "transmitir", transmitir_retenido)
+    try:
+        original = pool._procesos[0]
+        respuesta = aplicacion.app.test_client().get(URL, buffered=False)
+        assert next(iter(respuesta.response)).startswith(b"data: ")
+        assert pool._libres.qsize() == 0
+
+        # El cliente se desconecta: el proceso ocupado se reemplaza y su lugar vuelve al pool de inmediato
+        respuesta.close()
+        assert pool._libres.qsize() == 1
+        assert pool._procesos[0] is not original
+    finally:
+        pool.cerrar()
@@ -0,0 +1,54 @@
+import pytest
+
+from methods.biseccion import biseccion, biseccion_iter
+from methods.newton_seguro import newton_seguro_iter
+from utils.resolver import resolver_problema, resolver_lote
+from utils.trazas import recolectar, ResumenTraza, TrazaCompacta
+
+
+def f(x):
+    return x ** 3 - 2 * x - 5
+
+
+def test_generador_produce_las_mismas_filas():
+    assert list(biseccion_iter(f, 2, 3, 1e-6)) == biseccion(f, 2, 3, 1e-6)
+    with pytest.raises(ValueError):
+        biseccion_iter(f, 3, 4, 1e-6)  # Sin cambio de signo: falla al crear el generador, no al iterar
+
+
+def test_traza_compacta_ida_y_vuelta():
+    # "ea" vale None en la primera fila y "estrategia" no es numérica; capacidad 2 obliga a crecer
+    filas = list(newton_seguro_iter(f, 2, 3, 1e-10, df=lambda x: 3 * x ** 2 - 2))
+    traza = recolectar(iter(filas), "compacto", capacidad=2)
+    assert isinstance(traza, TrazaCompacta)
+    assert len(traza) == len(filas) > 2
+    assert traza.a_lista() == filas
+    assert traza[-1] == filas[-1]
+    assert list(traza.columna("x_new")) == [fila["x_new"] for fila in filas]
+    assert traza.columna("estrategia") == [fila["estrategia"] for fila in filas]
+    with pytest.raises(IndexError):
+        traza.fila(len(filas))
+
+
+def test_resumen_conserva_la_ultima_iteracion():
+    filas = biseccion(f, 2, 3, 1e-6)
+    resumen = recolectar(biseccion_iter(f, 2, 3, 1e-6), "resumen")
+    assert isinstance(resumen, ResumenTraza)
+    assert resumen.iteraciones == len(filas)
+    assert resumen[-1] == resumen[0] == filas[-1]
+    assert resumen.a_lista() == [filas[-1]]
+    with pytest.raises(ValueError):
+        recolectar(iter(filas), "desconocido")
+
+
+def test_modos_dan_el_mismo_resultado():
+    spec = {"metodo": "newton_seguro", "funcion": "x**3 - 2*x - 5", "a": 2, "b": 3, "tolerancia": 1e-10}
+    completo = resolver_problema(spec)
+    compacto = resolver_problema(spec, traza="compacto")
+    resumen = resolver_problema(spec, incluir_iteraciones=False)
+    assert compacto["datos"].a_lista() == completo["datos"]
+    assert completo["iteraciones"] == compacto["iteraciones"] == resumen["iteraciones"] == len(completo["datos"])
+    assert completo["raiz"] == compacto["raiz"] == resumen["raiz"]
+    # Los lotes usan el modo compacto, pero su JSON es el mismo que el de la lista completa
+    [lote] = resolver_lote([dict(spec, incluir_iteraciones=True)])
+    assert lote["datos"] == completo["datos"]
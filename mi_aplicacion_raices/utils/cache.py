@@ -0,0 +1,265 @@
+# utils/cache.py
+
+import hashlib
+import io
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import tokenize
+from collections import OrderedDict
+
+from utils.resolver import METODOS_SISTEMAS, componentes_vector, bandera
+
+# Campos de la especificación que influyen en el resultado de cada método (el resto se ignora en la clave)
+CAMPOS_METODO = {
+    "biseccion": ("a", "b"),
+    "falsa_posicion": ("a", "b"),
+    "punto_fijo": ("x0",),
+    "punto_fijo_aitken": ("x0",),
+    "punto_fijo_steffensen": ("x0",),
+    "newton_raphson": ("x0", "derivada"),
+    "secante": ("x0", "x1"),
+    "newton_seguro": ("a", "b", "x0", "derivada"),
+    "punto_fijo_seguro": ("a", "b", "x0"),
+    "buscar_raices": ("a", "b", "refinamiento"),
+    "polinomio": ("a", "b", "complejas"),
+    "newton_sistemas": ("x0", "variables"),
+    "broyden": ("x0", "variables"),
+}
+CAMPOS_TEXTO = ("funcion", "derivada", "refinamiento", "variables")
+
+
+def _tokens(texto):
+    """
+    Forma canónica de una expresión: sus tokens separados por un espacio. Los espacios entre tokens no
+    cuentan ("x**2-4" y "x ** 2 - 4" son iguales), pero los que separan tokens sí ("2 3" no es "23").
+    Los saltos de línea (que separan las ecuaciones de un sistema) se conservan como token.
+    """
+    texto = texto.strip()
+    try:
+        return " ".join(
+            token.string for token in tokenize.generate_tokens(io.StringIO(texto).readline)
+            if token.string.strip() or (token.type in (tokenize.NEWLINE, tokenize.NL) and token.string)
+        )
+    except (tokenize.TokenError, SyntaxError):
+        # No se puede separar en tokens (por ejemplo, un paréntesis sin cerrar): se usa tal como está
+        return texto
+
+
+def _normalizar(campo, valor):
+    """Forma canónica de un campo: números como float, expresiones como secuencia de tokens."""
+    if isinstance(valor, (list, tuple)):
+        # Sistemas de ecuaciones: lista de ecuaciones o vector x0
+        return tuple(_normalizar(campo, v) for v in valor)
+    if campo == "complejas":
+        return bandera(valor)  # Las mismas reglas que al resolver ("false" es False)
+    if valor is None or valor == "":
+        return None
+    if campo in CAMPOS_TEXTO:
+        return _tokens(str(valor))
+    try:
+        return repr(float(valor))
+    except (TypeError, ValueError):
+        return str(valor)
+
+
+def clave_problema(spec, incluir_iteraciones=True):
+    """
+    Retorna la clave de caché de un problema: un resumen SHA-256 de la especificación normalizada
+    (método, función como secuencia de tokens, tolerancia, max_iter y solo los campos que usa el método), de modo que
+    "x**2 - 4" con a=1 y "x**2-4" con a=1.0 comparten resultado.
+    """
+    metodo = spec.get("metodo")
+    partes = [
+        ("metodo", metodo),
+        ("funcion", _normalizar("funcion", spec.get("funcion"))),
+        ("tolerancia", _normalizar("tolerancia", spec.get("tolerancia"))),
+        ("max_iter", _normalizar("max_iter", spec.get("max_iter") or 100)),
+        ("incluir_iteraciones", bool(incluir_iteraciones)),
+    ]
+    for campo in CAMPOS_METODO.get(metodo, ()):
+        valor = spec.get(campo)
+        if campo == "x0" and metodo in METODOS_SISTEMAS:
+            # "2, 0.5", "2,0.5" y [2, 0.5] son el mismo punto inicial (las mismas reglas que al resolver)
+            valor = componentes_vector(valor)
+        partes.append((campo, _normalizar(campo, valor)))
+    return hashlib.sha256(repr(partes).encode("utf-8")).hexdigest()
+
+
+class CacheMemoria:
+    """
+    Caché LRU en la memoria del proceso, limitada por tamaño total (bytes serializados) y por antigüedad.
+    Los valores se guardan serializados con pickle, así que cada lectura retorna una copia independiente.
+
+    Parámetros:
+        max_bytes (int, opcional): Tamaño máximo total de los valores guardados. Por defecto 64 MiB.
+        ttl (float, opcional): Segundos que un valor sigue siendo válido (None: sin vencimiento).
+    """
+
+    def __init__(self, max_bytes=64 * 1024 ** 2, ttl=3600):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._datos = OrderedDict()  # clave -> (bytes, vence)
+        self._bytes = 0
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave):
+        """Retorna el valor guardado para 'clave' o None si no existe o venció."""
+        with self._candado:
+            entrada = self._datos.get(clave)
+            if entrada is not None and entrada[1] is not None and entrada[1] < time.monotonic():
+                self._eliminar(clave)
+                entrada = None
+            if entrada is None:
+                self.fallos += 1
+                return None
+            self._datos.move_to_end(clave)  # Usado recientemente
+            self.aciertos += 1
+        return pickle.loads(entrada[0])
+
+    def guardar(self, clave, valor):
+        """Guarda 'valor' (debe poder serializarse con pickle) y expulsa los menos usados si hace falta."""
+        datos = pickle.dumps(valor, pickle.HIGHEST_PROTOCOL)
+        if len(datos) > self.max_bytes:
+            return
+        vence = time.monotonic() + self.ttl if self.ttl else None
+        with self._candado:
+            if clave in self._datos:
+                self._eliminar(clave)
+            self._datos[clave] = (datos, vence)
+            self._bytes += len(datos)
+            while self._bytes > self.max_bytes:
+                self._eliminar(next(iter(self._datos)))
+
+    def _eliminar(self, clave):
+        datos, _ = self._datos.pop(clave)
+        self._bytes -= len(datos)
+
+    def estadisticas(self):
+        """Retorna aciertos, fallos, número de entradas y bytes ocupados."""
+        with self._candado:
+            return {"aciertos": self.aciertos, "fallos": self.fallos, "entradas": len(self._datos), "bytes": self._bytes}
+
+
+class CacheSQLite:
+    """
+    Caché LRU guardada en un archivo SQLite local, compartida por todos los procesos del servidor
+    (por ejemplo, los workers de gunicorn de una misma máquina). Limitada por tamaño total y antigüedad.
+
+    Parámetros:
+        ruta (str): Archivo de la base de datos.
+        max_bytes (int, opcional): Tamaño máximo total de los valores guardados. Por defecto 256 MiB.
+        ttl (float, opcional): Segundos que un valor sigue siendo válido (None: sin vencimiento).
+    """
+
+    def __init__(self, ruta, max_bytes=256 * 1024 ** 2, ttl=3600):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._local = threading.local()  # Una conexión por hilo
+        self.aciertos = 0
+        self.fallos = 0
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        with self._conexion() as conexion:
+            conexion.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                "clave TEXT PRIMARY KEY, valor BLOB NOT NULL, tamano INTEGER NOT NULL, "
+                "vence REAL, usado REAL NOT NULL)"
+            )
+            conexion.execute("CREATE INDEX IF NOT EXISTS resultados_usado ON resultados (usado)")
+
+    def _conexion(self):
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None:
+            conexion = sqlite3.connect(self.ruta, timeout=5, isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")  # Lectores y escritores concurrentes
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexion = conexion
+        return conexion
+
+    def obtener(self, clave):
+        """Retorna el valor guardado para 'clave' o None si no existe o venció."""
+        ahora = time.time()
+        conexion = self._conexion()
+        fila = conexion.execute(
+            "SELECT valor FROM resultados WHERE clave = ? AND (vence IS NULL OR vence >= ?)", (clave, ahora)
+        ).fetchone()
+        if fila is None:
+            self.fallos += 1
+            return None
+        conexion.execute("UPDATE resultados SET usado = ? WHERE clave = ?", (ahora, clave))
+        self.aciertos += 1
+        return pickle.loads(fila[0])
+
+    def guardar(self, clave, valor):
+        """Guarda 'valor' y expulsa los vencidos y los menos usados hasta respetar max_bytes."""
+        datos = pickle.dumps(valor, pickle.HIGHEST_PROTOCOL)
+        if len(datos) > self.max_bytes:
+            return
+        ahora = time.time()
+        vence = ahora + self.ttl if self.ttl else None
+        conexion = self._conexion()
+        conexion.execute("BEGIN IMMEDIATE")
+        try:
+            conexion.execute(
+                "INSERT OR REPLACE INTO resultados (clave, valor, tamano, vence, usado) VALUES (?, ?, ?, ?, ?)",
+                (clave, sqlite3.Binary(datos), len(datos), vence, ahora),
+            )
+            conexion.execute("DELETE FROM resultados WHERE vence IS NOT NULL AND vence < ?", (ahora,))
+            total = conexion.execute("SELECT COALESCE(SUM(tamano), 0) FROM resultados").fetchone()[0]
+            if total > self.max_bytes:
+                # Se eliminan los menos usados recientemente hasta liberar el exceso
+                exceso = total - self.max_bytes
+                claves = []
+                for clave_vieja, tamano in conexion.execute("SELECT clave, tamano FROM resultados ORDER BY usado"):
+                    claves.append((clave_vieja,))
+                    exceso -= tamano
+                    if exceso <= 0:
+                        break
+                conexion.executemany("DELETE FROM resultados WHERE clave = ?", claves)
+            conexion.execute("COMMIT")
+        except Exception:
+            conexion.execute("ROLLBACK")
+            raise
+
+    def estadisticas(self):
+        """Retorna aciertos y fallos de este proceso, y entradas y bytes de la caché compartida."""
+        entradas, total = self._conexion().execute(
+            "SELECT COUNT(*), COALESCE(SUM(tamano), 0) FROM resultados"
+        ).fetchone()
+        return {"aciertos": self.aciertos, "fallos": self.fallos, "entradas": entradas, "bytes": total}
+
+
+def crear_cache(backend, max_bytes=None, ttl=3600, ruta=None):
+    """
+    Crea la caché de resultados indicada en la configuración.
+
+    Parámetros:
+        backend (str | None): "memoria" (por proceso), "sqlite" (compartida entre procesos) o None (sin caché).
+        max_bytes (int, opcional): Tamaño máximo; por defecto el de cada backend.
+        ttl (float, opcional): Segundos de validez de cada resultado. Por defecto 3600.
+        ruta (str, opcional): Archivo de la base de datos para "sqlite".
+
+    Retorna:
+        CacheMemoria | CacheSQLite | None
+
+    Excepciones:
+        ValueError: Si el backend no es reconocido o falta la ruta de "sqlite".
+    """
+    if not backend:
+        return None
+    opciones = {"ttl": ttl}
+    if max_bytes:
+        opciones["max_bytes"] = max_bytes
+    if backend == "memoria":
+        return CacheMemoria(**opciones)
+    if backend == "sqlite":
+        if not ruta:
+            raise ValueError("La caché 'sqlite' necesita la ruta del archivo.")
+        return CacheSQLite(ruta, **opciones)
+    raise ValueError("Backend de caché no reconocido: {}.".format(backend))
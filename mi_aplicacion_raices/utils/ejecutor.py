@@ -0,0 +1,358 @@
+# utils/ejecutor.py
+
+import builtins
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource  # Solo disponible en sistemas tipo Unix
+except ImportError:
+    resource = None
+
+
+def _error_remoto(nombre, mensaje):
+    """Reconstruye en el proceso principal la excepción producida en un proceso de cálculo."""
+    tipo = getattr(builtins, nombre, None)
+    if not (isinstance(tipo, type) and issubclass(tipo, Exception)):
+        tipo = Exception
+    return tipo(mensaje)
+
+
+class ErrorPool(RuntimeError):
+    """El pool de procesos no pudo completar el cálculo: un proceso murió, no se pudo iniciar o el pool está cerrado."""
+
+
+class PoolOcupado(ErrorPool):
+    """No se liberó ningún proceso de cálculo dentro del tiempo de espera del pool."""
+
+
+class _LimiteCPU(BaseException):
+    """
+    Uso interno: se superó el límite de tiempo de CPU. Hereda de BaseException para que los
+    'except Exception' de los métodos numéricos no la conviertan en un error de evaluación.
+    """
+
+
+def _limite_cpu_excedido(signum, frame):
+    raise _LimiteCPU("Se excedió el tiempo de CPU permitido para el cálculo.")
+
+
+def _enviar_fila(conexion, fila, usar_temporizador):
+    """
+    Envía una fila de la tabla con el temporizador de CPU detenido: si la señal llegara durante el
+    envío, dejaría un mensaje a medias en el canal.
+    """
+    if not usar_temporizador:
+        conexion.send(("fila", fila))
+        return
+    restante = signal.setitimer(signal.ITIMER_PROF, 0)[0]
+    try:
+        conexion.send(("fila", fila))
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, max(restante, 1e-6))
+
+
+def _trabajador(conexion, limite_cpu, limite_memoria):
+    """
+    Bucle de un proceso de cálculo: recibe especificaciones de problemas por 'conexion', las resuelve
+    y envía el resultado. Cada proceso conserva su propia caché de expresiones compiladas, por lo que
+    las funciones repetidas no se vuelven a analizar.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C lo gestiona el proceso principal
+    if resource is not None and limite_memoria:
+        resource.setrlimit(resource.RLIMIT_AS, (limite_memoria, limite_memoria))
+    usar_temporizador = limite_cpu and hasattr(signal, "setitimer")
+    if usar_temporizador:
+        signal.signal(signal.SIGPROF, _limite_cpu_excedido)
+
+    # Precalentamiento: se importan los módulos pesados y se compila una expresión de prueba
+    from utils.resolver import resolver_problema, iterar_problema, precargar
+    precargar()
+    conexion.send(("listo", None))
+
+    while True:
+        try:
+            mensaje = conexion.recv()
+        except (EOFError, OSError):
+            break
+        if mensaje is None:
+            break
+        # "resolver": se envía el resultado completo; "transmitir": se envía cada fila al calcularla
+        tipo, spec, incluir_iteraciones, traza, limite = mensaje
+        try:
+            if usar_temporizador:
+                signal.setitimer(signal.ITIMER_PROF, limite)
+            if tipo == "transmitir":
+                for fila in iterar_problema(spec):
+                    _enviar_fila(conexion, fila, usar_temporizador)
+                respuesta = ("fin", None)
+            else:
+                respuesta = ("ok", resolver_problema(spec, incluir_iteraciones, traza))
+        except _LimiteCPU as e:
+            respuesta = ("error", ("TimeoutError", str(e)))
+        except Exception as e:
+            respuesta = ("error", (type(e).__name__, str(e)))
+        finally:
+            if usar_temporizador:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+        try:
+            conexion.send(respuesta)
+        except Exception as e:
+            # El resultado no se pudo serializar (por ejemplo, un valor no soportado por pickle)
+            conexion.send(("error", (type(e).__name__, str(e))))
+
+
+class _Interrumpido(Exception):
+    """Uso interno: el proceso se bloqueó, se canceló o murió; 'motivo' es la excepción a reportar."""
+
+    def __init__(self, motivo):
+        super().__init__(str(motivo))
+        self.motivo = motivo
+
+
+class _Proceso:
+    """Proceso de cálculo y el extremo del canal con el que se comunica el proceso principal."""
+
+    def __init__(self, contexto, limite_cpu, limite_memoria):
+        self.conexion, extremo_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(
+            target=_trabajador, args=(extremo_hijo, limite_cpu, limite_memoria), daemon=True
+        )
+        self.proceso.start()
+        extremo_hijo.close()
+
+    def esperar_listo(self, timeout):
+        if not self.conexion.poll(timeout):
+            raise TimeoutError("El proceso de cálculo no terminó de iniciar a tiempo.")
+        self.conexion.recv()
+
+    def terminar(self):
+        if self.proceso.is_alive():
+            self.proceso.kill()
+        self.proceso.join(1)
+        self.conexion.close()
+
+
+class PoolResolucion:
+    """
+    Conjunto de procesos precalentados donde se resuelven los problemas ingresados por los usuarios.
+
+    Cada solicitud se ejecuta fuera del proceso del servidor web, con un límite de tiempo real
+    (el proceso se elimina y se reemplaza si lo supera), un límite de tiempo de CPU y un límite de
+    memoria por proceso. Así una función patológica solo afecta a su propia solicitud, y las
+    solicitudes simultáneas se reparten entre todos los núcleos.
+
+    Parámetros:
+        procesos (int, opcional): Número de procesos. Por defecto, el número de núcleos.
+        timeout (float, opcional): Tiempo real máximo por problema, en segundos. Por defecto es 10.
+        limite_cpu (float, opcional): Tiempo de CPU máximo por problema, en segundos. Por defecto es el 80 %
+            de timeout, para que el propio proceso interrumpa el cálculo (sin tener que reemplazarlo)
+            antes de que venza el límite de tiempo real.
+        limite_memoria (int, opcional): Memoria virtual máxima por proceso, en bytes (None para no limitar).
+            Por defecto es 1 GiB.
+        espera (float, opcional): Tiempo máximo que una solicitud espera a que se libere un proceso, en
+            segundos; al vencer se lanza PoolOcupado. Por defecto es timeout. El límite de tiempo del
+            cálculo empieza a contar cuando la solicitud obtiene su proceso.
+
+    Los lotes (resolver_lote) usan a la vez como máximo todos los procesos menos uno, para que un lote
+    grande no deje sin procesos a las solicitudes individuales.
+    """
+
+    def __init__(self, procesos=None, timeout=10.0, limite_cpu=None, limite_memoria=1024 ** 3, espera=None):
+        self.timeout = timeout
+        self.espera = espera if espera is not None else timeout
+        self._limite_cpu = limite_cpu if limite_cpu is not None else 0.8 * timeout
+        self._limite_memoria = limite_memoria
+        self._contexto = multiprocessing.get_context("spawn")
+        self._procesos = [self._crear() for _ in range(procesos or multiprocessing.cpu_count())]
+        for proceso in self._procesos:
+            proceso.esperar_listo(60)
+        self._libres = queue.Queue()
+        for proceso in self._procesos:
+            self._libres.put(proceso)
+        self._candado = threading.Lock()
+        self._max_lote = max(1, len(self._procesos) - 1)
+        self._cupo_lotes = threading.BoundedSemaphore(self._max_lote)  # Compartido por todos los lotes
+        self._cerrado = False
+
+    def _crear(self):
+        return _Proceso(self._contexto, self._limite_cpu, self._limite_memoria)
+
+    def _enviar(self, proceso, mensaje):
+        """Envía un mensaje al proceso; si el proceso ya no existe lanza _Interrumpido."""
+        try:
+            proceso.conexion.send(mensaje)
+        except (EOFError, OSError):
+            raise _Interrumpido(ErrorPool("El proceso de cálculo terminó inesperadamente."))
+
+    def _esperar(self, proceso, limite, cancelado):
+        """
+        Espera el siguiente mensaje del proceso hasta el instante 'limite' (time.monotonic).
+        Retorna (estado, carga) o lanza la excepción que corresponda; si el proceso queda bloqueado,
+        se cancela o muere, se lanza la excepción sin leer nada y el llamador debe reemplazarlo.
+        """
+        try:
+            # Se espera en intervalos cortos para poder atender la cancelación. Ambas condiciones se revisan
+            # también cuando ya hay un mensaje: al transmitir siempre hay filas pendientes.
+            while True:
+                if cancelado is not None and cancelado.is_set():
+                    raise _Interrumpido(ErrorPool("El cálculo fue cancelado."))
+                if time.monotonic() > limite:
+                    raise _Interrumpido(TimeoutError("El cálculo superó el tiempo máximo permitido."))
+                if proceso.conexion.poll(0.05):
+                    return proceso.conexion.recv()
+        except (EOFError, OSError):
+            # El proceso murió (por ejemplo, al superar el límite de memoria)
+            raise _Interrumpido(ErrorPool("El proceso de cálculo terminó inesperadamente."))
+
+    def _reemplazar(self, proceso):
+        """
+        Elimina un proceso (bloqueado o terminado) y arranca otro en su lugar. Si el nuevo no logra
+        iniciar, retorna el anterior ya terminado: _tomar vuelve a intentarlo antes de entregarlo.
+        """
+        proceso.terminar()
+        try:
+            nuevo = self._crear()
+        except Exception:
+            return proceso
+        try:
+            nuevo.esperar_listo(60)
+        except Exception:
+            nuevo.terminar()
+            return proceso
+        with self._candado:
+            self._procesos[self._procesos.index(proceso)] = nuevo
+        return nuevo
+
+    def _tomar(self):
+        """
+        Retorna un proceso libre y vivo, esperando como máximo self.espera (si no, lanza PoolOcupado).
+        Un proceso terminado (porque murió o porque no se pudo reemplazar) se reemplaza antes de usarlo;
+        si tampoco es posible, su lugar vuelve a la cola y se lanza ErrorPool.
+        """
+        try:
+            proceso = self._libres.get(timeout=self.espera)
+        except queue.Empty:
+            raise PoolOcupado("Todos los procesos de cálculo están ocupados; inténtalo más tarde.") from None
+        if not proceso.proceso.is_alive():
+            proceso = self._reemplazar(proceso)
+            if not proceso.proceso.is_alive():
+                self._libres.put(proceso)
+                raise ErrorPool("No se pudo iniciar un proceso de cálculo.")
+        return proceso
+
+    def resolver(self, spec, incluir_iteraciones=True, timeout=None, cancelado=None, traza="completo"):
+        """
+        Resuelve un problema en uno de los procesos del pool (ver utils.resolver.resolver_problema).
+
+        Parámetros:
+            spec (dict): Especificación del problema.
+            incluir_iteraciones (bool, opcional): Incluir la tabla de iteraciones en el resultado.
+            timeout (float, opcional): Tiempo real máximo; por defecto el del pool.
+            cancelado (threading.Event, opcional): Si se activa, el cálculo se cancela.
+            traza (str, opcional): Modo de la tabla de iteraciones (ver resolver_problema).
+
+        Retorna:
+            dict: El mismo resultado que resolver_problema.
+
+        Excepciones:
+            TimeoutError: Si el cálculo supera el límite de tiempo.
+            PoolOcupado: Si ningún proceso se libera dentro del tiempo de espera del pool.
+            ErrorPool: Si el cálculo se cancela o el proceso termina inesperadamente.
+            Exception: La excepción producida por el método numérico (ValueError, ZeroDivisionError, ...).
+        """
+        if self._cerrado:
+            raise ErrorPool("El pool de procesos está cerrado.")
+        proceso = self._tomar()
+        limite = time.monotonic() + (timeout if timeout is not None else self.timeout)
+        try:
+            self._enviar(proceso, ("resolver", dict(spec.items()), incluir_iteraciones, traza, self._limite_cpu))
+            estado, carga = self._esperar(proceso, limite, cancelado)
+        except _Interrumpido as e:
+            # El proceso quedó ocupado o inservible: se reemplaza por uno nuevo
+            proceso = self._reemplazar(proceso)
+            raise e.motivo
+        finally:
+            self._libres.put(proceso)
+
+        if estado == "error":
+            raise _error_remoto(*carga)
+        return carga
+
+    def transmitir(self, spec, timeout=None, cancelado=None):
+        """
+        Genera las filas de la tabla de resultados de un problema a medida que el proceso de cálculo las
+        produce (ver utils.resolver.iterar_problema). El proceso principal nunca guarda la tabla completa.
+        Si el generador se cierra antes de terminar (por ejemplo, porque el cliente se desconectó),
+        el cálculo se cancela.
+
+        Parámetros:
+            spec (dict): Especificación del problema.
+            timeout (float, opcional): Tiempo real máximo para todo el cálculo; por defecto el del pool.
+            cancelado (threading.Event, opcional): Si se activa, el cálculo se cancela.
+
+        Excepciones:
+            Las mismas que resolver.
+        """
+        if self._cerrado:
+            raise ErrorPool("El pool de procesos está cerrado.")
+        timeout = timeout if timeout is not None else self.timeout
+        proceso = self._tomar()
+        limite = time.monotonic() + timeout
+        terminado = False
+        try:
+            self._enviar(proceso, ("transmitir", dict(spec.items()), False, None, 0.8 * timeout))
+            while True:
+                estado, carga = self._esperar(proceso, limite, cancelado)
+                if estado == "fila":
+                    yield carga
+                    continue
+                terminado = True
+                if estado == "error":
+                    raise _error_remoto(*carga)
+                return
+        except _Interrumpido as e:
+            raise e.motivo
+        finally:
+            if not terminado:
+                # Interrumpido a mitad del cálculo: el proceso sigue ocupado y se reemplaza
+                proceso = self._reemplazar(proceso)
+            self._libres.put(proceso)
+
+    def resolver_lote(self, problemas, incluir_iteraciones=False):
+        """
+        Resuelve una lista de problemas repartiéndolos entre los procesos del pool (todos menos uno).
+
+        Retorna:
+            list[dict]: Un resultado por problema, en el mismo orden; si un problema falla, su posición
+                contiene {"error": mensaje} y el resto del lote se resuelve igualmente.
+        """
+        from utils.resolver import resultado_json
+
+        def resolver_uno(spec):
+            try:
+                if not isinstance(spec, dict):
+                    raise ValueError("Cada problema debe ser un objeto JSON.")
+                incluir = spec.get("incluir_iteraciones", incluir_iteraciones)
+                # La tabla viaja en forma compacta desde el proceso de cálculo y se convierte aquí a JSON
+                with self._cupo_lotes:
+                    return resultado_json(self.resolver(spec, incluir, traza="compacto"))
+            except Exception as e:
+                return {"error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=self._max_lote) as hilos:
+            return list(hilos.map(resolver_uno, problemas))
+
+    def cerrar(self):
+        """Detiene todos los procesos del pool."""
+        self._cerrado = True
+        for proceso in list(self._procesos):
+            try:
+                proceso.conexion.send(None)
+            except (OSError, ValueError):
+                pass
+            proceso.terminar()
@@ -0,0 +1,330 @@
+# utils/expresiones.py
+#
+# Compilador liviano de expresiones en x. Analiza el texto con el módulo ast de Python, verifica que
+# solo contenga operaciones, funciones y constantes permitidas, y lo compila directamente a bytecode
+# (una lambda de Python). No usa SymPy ni eval sobre texto arbitrario: cualquier construcción que no
+# esté en la lista blanca lanza ExpresionNoSoportada y el llamador puede recurrir a SymPy.
+
+import ast
+import math
+import operator
+
+# Funciones permitidas y su número de argumentos (los mismos nombres que acepta sympify)
+FUNCIONES = {
+    "sin": 1, "cos": 1, "tan": 1, "asin": 1, "acos": 1, "atan": 1, "atan2": 2,
+    "sinh": 1, "cosh": 1, "tanh": 1, "asinh": 1, "acosh": 1, "atanh": 1,
+    "exp": 1, "log": (1, 2), "ln": 1, "sqrt": 1, "abs": 1, "Abs": 1,
+}
+CONSTANTES = {"pi": math.pi, "E": math.e}
+# Grado máximo de un polinomio reconocido por coeficientes_polinomio
+MAX_GRADO = 1000
+# Tamaño máximo (en bits) de una potencia de enteros calculada en forma exacta. Las mayores se calculan en
+# punto flotante: 9**9**8 lanza OverflowError de inmediato en lugar de construir un entero de millones de
+# dígitos, que bloquearía el proceso.
+MAX_BITS_POTENCIA = 4096
+
+
+def _potencia_grande(base, exponente):
+    """Indica si base**exponente, con base y exponente enteros, tendría más de MAX_BITS_POTENCIA bits."""
+    return (isinstance(base, int) and isinstance(exponente, int) and exponente > 0 and abs(base) > 1
+            and exponente > MAX_BITS_POTENCIA / math.log2(abs(base)))
+
+
+def _potencia(base, exponente):
+    if _potencia_grande(base, exponente):
+        return float(base) ** exponente
+    return base ** exponente
+
+
+_OPERADORES = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Pow: _potencia, ast.Mod: operator.mod,
+}
+
+
+class ExpresionNoSoportada(ValueError):
+    """La expresión usa una construcción fuera de la lista blanca (o no es Python válido)."""
+
+
+def _espacio_math():
+    espacio = {nombre: getattr(math, nombre) for nombre in FUNCIONES if hasattr(math, nombre)}
+    espacio.update({"ln": math.log, "abs": abs, "Abs": abs})
+    return espacio
+
+
+def _espacio_numpy():
+    import numpy as np  # Solo se necesita para las funciones vectorizadas
+
+    def log(x, base=None):
+        return np.log(x) if base is None else np.log(x) / np.log(base)
+
+    espacio = {
+        "sin": np.sin, "cos": np.cos, "tan": np.tan, "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
+        "atan2": np.arctan2, "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh, "asinh": np.arcsinh,
+        "acosh": np.arccosh, "atanh": np.arctanh, "exp": np.exp, "log": log, "ln": np.log, "sqrt": np.sqrt,
+        "abs": np.abs, "Abs": np.abs,
+    }
+    return espacio
+
+
+_ESPACIOS = {"math": _espacio_math, "numpy": _espacio_numpy}
+_espacios_cargados = {}
+
+
+def _espacio(modulo):
+    if modulo not in _espacios_cargados:
+        if modulo not in _ESPACIOS:
+            raise ValueError("Módulo de evaluación no reconocido: {}.".format(modulo))
+        _espacios_cargados[modulo] = _ESPACIOS[modulo]()
+    return _espacios_cargados[modulo]
+
+
+def _constante(nodo):
+    """Retorna el valor numérico de un nodo formado solo por constantes, o None si depende de x."""
+    if isinstance(nodo, ast.Constant):
+        return nodo.value
+    if isinstance(nodo, ast.UnaryOp):
+        valor = _constante(nodo.operand)
+        return None if valor is None else (-valor if isinstance(nodo.op, ast.USub) else valor)
+    if isinstance(nodo, ast.BinOp):
+        izquierda, derecha = _constante(nodo.left), _constante(nodo.right)
+        if izquierda is None or derecha is None:
+            return None
+        try:
+            return _OPERADORES[type(nodo.op)](izquierda, derecha)
+        except (ArithmeticError, ValueError):
+            return None
+    return None
+
+
+class _Validador(ast.NodeTransformer):
+    """
+    Recorre el árbol y lanza ExpresionNoSoportada ante cualquier nodo fuera de la lista blanca.
+    Además reescribe b**(1/2) como sqrt(b), igual que SymPy, para que las raíces de números
+    negativos fallen con ValueError en lugar de producir un complejo, y convierte a float la base de
+    las potencias de enteros demasiado grandes (ver MAX_BITS_POTENCIA).
+    Las variables admitidas son las de 'variables' (por defecto solo x); con None se admite cualquier
+    nombre que no sea una función de la lista blanca (se usa en los sistemas de ecuaciones).
+    """
+
+    def __init__(self, variables=("x",)):
+        self.variables = variables
+
+    def generic_visit(self, nodo):
+        raise ExpresionNoSoportada("Construcción no soportada: {}.".format(type(nodo).__name__))
+
+    def visit_Expression(self, nodo):
+        nodo.body = self.visit(nodo.body)
+        return nodo
+
+    def visit_Constant(self, nodo):
+        if isinstance(nodo.value, bool) or not isinstance(nodo.value, (int, float)):
+            raise ExpresionNoSoportada("Constante no soportada: {!r}.".format(nodo.value))
+        return nodo
+
+    def visit_Name(self, nodo):
+        if nodo.id in CONSTANTES:
+            return nodo
+        if self.variables is None:
+            if nodo.id in FUNCIONES:
+                raise ExpresionNoSoportada("Nombre no soportado: {}.".format(nodo.id))
+        elif nodo.id not in self.variables:
+            raise ExpresionNoSoportada("Nombre no soportado: {}.".format(nodo.id))
+        return nodo
+
+    def visit_UnaryOp(self, nodo):
+        if not isinstance(nodo.op, (ast.UAdd, ast.USub)):
+            raise ExpresionNoSoportada("Operador no soportado.")
+        nodo.operand = self.visit(nodo.operand)
+        return nodo
+
+    def visit_BinOp(self, nodo):
+        if type(nodo.op) not in _OPERADORES:
+            raise ExpresionNoSoportada("Operador no soportado.")
+        nodo.left = self.visit(nodo.left)
+        nodo.right = self.visit(nodo.right)
+        if isinstance(nodo.op, ast.Pow) and _potencia_grande(_constante(nodo.left), _constante(nodo.right)):
+            nodo.left = ast.Constant(value=float(_constante(nodo.left)))
+        if isinstance(nodo.op, ast.Pow) and _constante(nodo.right) in (0.5, -0.5):
+            raiz = ast.Call(func=ast.Name(id="sqrt", ctx=ast.Load()), args=[nodo.left], keywords=[])
+            if _constante(nodo.right) == 0.5:
+                return raiz
+            return ast.BinOp(left=ast.Constant(value=1), op=ast.Div(), right=raiz)
+        return nodo
+
+    def visit_Call(self, nodo):
+        if not isinstance(nodo.func, ast.Name) or nodo.func.id not in FUNCIONES or nodo.keywords:
+            raise ExpresionNoSoportada("Función no soportada.")
+        aridad = FUNCIONES[nodo.func.id]
+        if len(nodo.args) not in (aridad if isinstance(aridad, tuple) else (aridad,)):
+            raise ExpresionNoSoportada("Número de argumentos no soportado en {}.".format(nodo.func.id))
+        nodo.args = [self.visit(argumento) for argumento in nodo.args]
+        return nodo
+
+
+def analizar(texto, variables=("x",)):
+    """
+    Analiza 'texto' (admite ^ como potencia, igual que SymPy) y retorna el árbol validado.
+    'variables' son los nombres de variable permitidos (None admite cualquier nombre, ver _Validador).
+
+    Excepciones:
+        ExpresionNoSoportada: Si el texto no es una expresión válida o usa algo fuera de la lista blanca.
+    """
+    if not isinstance(texto, str):
+        raise ExpresionNoSoportada("La expresión debe ser un texto.")
+    try:
+        arbol = ast.parse(texto.strip().replace("^", "**"), mode="eval")
+    except SyntaxError as e:
+        raise ExpresionNoSoportada("Expresión inválida: {}.".format(e.msg))
+    return _Validador(variables).visit(arbol)
+
+
+def variables(arbol):
+    """Retorna el conjunto de nombres de variable (sin funciones ni constantes) de un árbol validado."""
+    funciones = {id(nodo.func) for nodo in ast.walk(arbol) if isinstance(nodo, ast.Call)}
+    return {
+        nodo.id for nodo in ast.walk(arbol)
+        if isinstance(nodo, ast.Name) and id(nodo) not in funciones and nodo.id not in CONSTANTES
+    }
+
+
+def compilar(texto, modulo="math"):
+    """
+    Compila la expresión 'texto' en una función f(x).
+
+    Parámetros:
+        texto (str): Expresión en x, por ejemplo "x**3 - 2*x + exp(-x)".
+        modulo (str, opcional): "math" para evaluar números (por defecto) o "numpy" para evaluar
+            arreglos completos con ufuncs de NumPy.
+
+    Retorna:
+        function: La función compilada.
+
+    Excepciones:
+        ExpresionNoSoportada: Si la expresión no es válida o no está soportada.
+    """
+    arbol = analizar(texto)
+    argumentos = ast.arguments(posonlyargs=[], args=[ast.arg(arg="x")], vararg=None, kwonlyargs=[],
+                               kw_defaults=[], kwarg=None, defaults=[])
+    funcion = ast.Expression(body=ast.Lambda(args=argumentos, body=arbol.body))
+    codigo = compile(ast.fix_missing_locations(funcion), "<expresion>", "eval")
+    espacio = {"__builtins__": {}}
+    espacio.update(_espacio(modulo))
+    espacio.update(CONSTANTES)
+    return eval(codigo, espacio)
+
+
+def _polinomio(nodo):
+    """
+    Retorna los coeficientes (grado menor primero) del polinomio que representa 'nodo',
+    o None si no es un polinomio en x con coeficientes reales.
+    """
+    if isinstance(nodo, ast.Constant):
+        return [float(nodo.value)]
+    if isinstance(nodo, ast.Name):
+        return [0.0, 1.0] if nodo.id == "x" else [CONSTANTES[nodo.id]]
+    if isinstance(nodo, ast.UnaryOp):
+        p = _polinomio(nodo.operand)
+        return None if p is None else ([-c for c in p] if isinstance(nodo.op, ast.USub) else p)
+    if isinstance(nodo, ast.Call):
+        # Una función aplicada a constantes (por ejemplo sqrt(2)) es un coeficiente
+        valores = [_polinomio(argumento) for argumento in nodo.args]
+        if any(v is None or len(v) != 1 for v in valores):
+            return None
+        try:
+            valor = _espacio("math")[nodo.func.id](*(v[0] for v in valores))
+        except (ArithmeticError, ValueError):
+            return None
+        return [float(valor)] if isinstance(valor, (int, float)) else None
+    if not isinstance(nodo, ast.BinOp):
+        return None
+
+    p = _polinomio(nodo.left)
+    if p is None:
+        return None
+    if isinstance(nodo.op, ast.Pow):
+        exponente = _constante(nodo.right)
+        if isinstance(exponente, float) and exponente.is_integer():
+            exponente = int(exponente)
+        if not isinstance(exponente, int) or exponente < 0 or (len(p) - 1) * exponente > MAX_GRADO:
+            return None
+        if len(p) == 1:
+            # Potencia de una constante: se calcula de una vez (un exponente enorme no recorre el bucle)
+            try:
+                return [p[0] ** exponente]
+            except ArithmeticError:
+                return None
+        resultado = [1.0]
+        for _ in range(exponente):
+            resultado = _multiplicar(resultado, p)
+        return resultado
+    q = _polinomio(nodo.right)
+    if q is None:
+        return None
+    if isinstance(nodo.op, (ast.Add, ast.Sub)):
+        signo = 1.0 if isinstance(nodo.op, ast.Add) else -1.0
+        n = max(len(p), len(q))
+        p, q = p + [0.0] * (n - len(p)), q + [0.0] * (n - len(q))
+        return [a + signo * b for a, b in zip(p, q)]
+    if isinstance(nodo.op, ast.Mult):
+        if len(p) + len(q) - 2 > MAX_GRADO:
+            return None
+        return _multiplicar(p, q)
+    if isinstance(nodo.op, ast.Div) and len(q) == 1 and q[0] != 0:
+        return [c / q[0] for c in p]
+    return None
+
+
+def _multiplicar(p, q):
+    resultado = [0.0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a:
+            for j, b in enumerate(q):
+                resultado[i + j] += a * b
+    return resultado
+
+
+def _es_expandido(nodo):
+    """Indica si 'nodo' es una suma de monomios c*x**k (sin paréntesis que agrupen sumas)."""
+    if isinstance(nodo, ast.BinOp) and isinstance(nodo.op, (ast.Add, ast.Sub)):
+        return _es_expandido(nodo.left) and _es_monomio(nodo.right)
+    return _es_monomio(nodo)
+
+
+def _es_monomio(nodo):
+    if isinstance(nodo, ast.UnaryOp):
+        return _es_monomio(nodo.operand)
+    if isinstance(nodo, ast.BinOp):
+        if isinstance(nodo.op, ast.Mult):
+            return _es_monomio(nodo.left) and _es_monomio(nodo.right)
+        if isinstance(nodo.op, ast.Div):
+            return _es_monomio(nodo.left) and _constante(nodo.right) is not None
+        if isinstance(nodo.op, ast.Pow):
+            return (isinstance(nodo.left, ast.Name) or _constante(nodo.left) is not None) \
+                and _constante(nodo.right) is not None
+        return _constante(nodo) is not None
+    return isinstance(nodo, (ast.Constant, ast.Name)) or (isinstance(nodo, ast.Call) and _constante_call(nodo))
+
+
+def _constante_call(nodo):
+    return all(_polinomio(argumento) is not None and len(_polinomio(argumento)) == 1 for argumento in nodo.args)
+
+
+def coeficientes_polinomio(texto):
+    """
+    Detecta si 'texto' es un polinomio en x (en cualquier forma, por ejemplo "(x - 1)**3").
+
+    Retorna:
+        tuple(list[float] | None, bool): Los coeficientes (grado mayor primero, sin ceros iniciales) o
+            None si no es un polinomio, y si la expresión está escrita en forma expandida.
+
+    Excepciones:
+        ExpresionNoSoportada: Si la expresión no es válida o no está soportada.
+    """
+    cuerpo = analizar(texto).body
+    coeficientes = _polinomio(cuerpo)
+    if coeficientes is None or not all(math.isfinite(c) for c in coeficientes):
+        return None, False
+    while len(coeficientes) > 1 and coeficientes[-1] == 0:
+        coeficientes.pop()
+    return coeficientes[::-1], _es_expandido(cuerpo)
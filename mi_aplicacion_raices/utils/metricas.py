@@ -0,0 +1,145 @@
+# utils/metricas.py
+#
+# Instrumentación opcional de la aplicación: tiempos por etapa de cada solicitud (análisis de la función,
+# resolución, gráfica y plantilla), evaluaciones de la función y perfiles de cProfile de una muestra
+# de solicitudes. Los acumulados son por proceso: con varios workers, cada uno reporta los suyos.
+
+import cProfile
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_secuencia = itertools.count()  # Distingue los perfiles guardados en el mismo instante
+
+
+class Cronometro:
+    """
+    Tiempos de las etapas de una sola solicitud. Una etapa puede medirse varias veces; sus tiempos se suman.
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.tiempos = {}  # etapa -> segundos
+        self.evaluaciones = 0
+        self.cache = None  # "hit" o "miss" si la solicitud consultó la caché de resultados
+
+    @contextmanager
+    def etapa(self, nombre):
+        """Mide el bloque 'with' y lo suma al tiempo de la etapa 'nombre'."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sumar(nombre, time.perf_counter() - inicio)
+
+    def sumar(self, nombre, segundos):
+        self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + segundos
+
+    def total(self):
+        return time.perf_counter() - self.inicio
+
+    def server_timing(self):
+        """
+        Retorna el valor de la cabecera Server-Timing (milisegundos por etapa, más el total), que las
+        herramientas de desarrollo del navegador muestran junto a cada solicitud.
+        """
+        partes = []
+        for nombre, segundos in self.tiempos.items():
+            parte = "{};dur={:.3f}".format(nombre, segundos * 1e3)
+            if nombre == "cache" and self.cache is not None:
+                parte += ';desc="{}"'.format(self.cache)
+            partes.append(parte)
+        partes.append("total;dur={:.3f}".format(self.total() * 1e3))
+        return ", ".join(partes)
+
+
+class Metricas:
+    """
+    Acumula los cronómetros de todas las solicitudes del proceso: número de mediciones, tiempo total y
+    máximo por etapa, evaluaciones de la función y solicitudes por vista. Segura entre hilos.
+    """
+
+    def __init__(self):
+        self._candado = threading.Lock()
+        self._etapas = {}  # etapa -> [mediciones, segundos totales, segundos máximo]
+        self._vistas = {}  # vista -> número de solicitudes
+        self.evaluaciones = 0
+        self.problemas = 0  # Problemas resueltos (sin contar los aciertos de la caché)
+
+    def registrar(self, vista, cronometro):
+        """Suma al acumulado los tiempos de una solicitud terminada."""
+        with self._candado:
+            self._vistas[vista] = self._vistas.get(vista, 0) + 1
+            for nombre, segundos in itertools.chain(cronometro.tiempos.items(), [("total", cronometro.total())]):
+                acumulado = self._etapas.setdefault(nombre, [0, 0.0, 0.0])
+                acumulado[0] += 1
+                acumulado[1] += segundos
+                acumulado[2] = max(acumulado[2], segundos)
+
+    def contar_problema(self, evaluaciones):
+        with self._candado:
+            self.problemas += 1
+            self.evaluaciones += evaluaciones
+
+    def instantanea(self):
+        """
+        Retorna un diccionario apto para JSON con el estado actual:
+            - "solicitudes": Solicitudes atendidas por vista.
+            - "etapas": Por etapa, "mediciones", "total_ms", "media_ms" y "max_ms".
+            - "problemas": Problemas resueltos (sin contar los aciertos de la caché).
+            - "evaluaciones": Evaluaciones de la función en total y en promedio por problema.
+        """
+        with self._candado:
+            etapas = {
+                nombre: {
+                    "mediciones": n,
+                    "total_ms": total * 1e3,
+                    "media_ms": total * 1e3 / n,
+                    "max_ms": maximo * 1e3,
+                }
+                for nombre, (n, total, maximo) in self._etapas.items()
+            }
+            return {
+                "pid": os.getpid(),
+                "solicitudes": dict(self._vistas),
+                "etapas": etapas,
+                "problemas": self.problemas,
+                "evaluaciones": {
+                    "total": self.evaluaciones,
+                    "por_problema": self.evaluaciones / self.problemas if self.problemas else None,
+                },
+            }
+
+
+def tasa_aciertos(estadisticas):
+    """Agrega a las estadísticas de la caché la fracción de consultas que fueron aciertos (None sin consultas)."""
+    consultas = estadisticas["aciertos"] + estadisticas["fallos"]
+    return dict(estadisticas, tasa_aciertos=estadisticas["aciertos"] / consultas if consultas else None)
+
+
+def iniciar_perfil():
+    """
+    Activa cProfile en el hilo actual y retorna el perfilador, o None si ya hay otro perfilador activo
+    (por ejemplo, cuando la aplicación se ejecuta con "python -m cProfile").
+    """
+    perfil = cProfile.Profile()
+    try:
+        perfil.enable()
+    except ValueError:
+        return None
+    return perfil
+
+
+def guardar_perfil(perfil, directorio, vista):
+    """
+    Detiene el perfilador y guarda sus estadísticas en 'directorio' (formato de pstats, se puede abrir
+    con "python -m pstats archivo" o con snakeviz). Retorna la ruta del archivo.
+    """
+    perfil.disable()
+    os.makedirs(directorio, exist_ok=True)
+    nombre = "{}-{}-{}-{}.prof".format(time.strftime("%Y%m%d-%H%M%S"), vista, os.getpid(), next(_secuencia))
+    ruta = os.path.join(directorio, nombre)
+    perfil.dump_stats(ruta)
+    return ruta
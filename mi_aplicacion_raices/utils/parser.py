@@ -1,16 +1,79 @@
 # utils/parser.py
 
-import sympy
+import ast
+import operator
+import re
+from functools import lru_cache
+
+from utils import expresiones
+
+# SymPy solo se importa (en la primera expresión que lo necesite) cuando el compilador liviano de
+# utils.expresiones no soporta la expresión; así el arranque y el análisis habitual no pagan su costo.
+
+
+def _coeficientes(expr, x):
+    """
+    Retorna los coeficientes (grado mayor primero) de 'expr' si es un polinomio en x con
+    coeficientes reales, o None en caso contrario.
+    """
+    import sympy
+    if expr.free_symbols - {x} or not expr.is_polynomial(x):
+        return None
+    try:
+        return [float(c) for c in sympy.Poly(expr, x).all_coeffs()]
+    except (TypeError, sympy.PolynomialError):
+        return None
+
+
+def _horner(coeficientes):
+    """
+    Compila los coeficientes de un polinomio en una función evaluada con el esquema de Horner,
+    por ejemplo [1, 0, -4] -> lambda x: ((1.0)*x + 0.0)*x + -4.0.
+    La función resultante acepta tanto números como arreglos de NumPy.
+    """
+    cuerpo = repr(coeficientes[0])
+    for c in coeficientes[1:]:
+        cuerpo = "({})*x + {}".format(cuerpo, repr(c))
+    return eval("lambda x: " + cuerpo, {"__builtins__": {}})
+
+
+@lru_cache(maxsize=256)
+def _compilar(func_str, modulo):
+    """
+    Convierte 'func_str' en una función de x. Los polinomios escritos en forma expandida
+    (por ejemplo "x**3 - 2*x + 1") se evalúan con Horner, que es más rápido y estable que la
+    expresión original; el resto (incluidos los polinomios factorizados como "(x - 1)**5", cuya
+    expansión perdería precisión cerca de la raíz) se compila tal como está escrito.
+    Las expresiones habituales se compilan con utils.expresiones, sin SymPy; solo las que usan algo
+    fuera de su lista blanca se compilan con sympify + lambdify.
+    Las expresiones compiladas se guardan en caché: una misma función repetida en varias
+    solicitudes (o en un lote) solo se analiza una vez.
+    """
+    try:
+        coeficientes, expandido = expresiones.coeficientes_polinomio(func_str)
+        # Horner anida un paréntesis por grado; los grados muy altos se compilan tal como están escritos
+        if coeficientes is not None and expandido and len(coeficientes) <= 100:
+            return _horner(coeficientes)
+        return expresiones.compilar(func_str, modulo)
+    except expresiones.ExpresionNoSoportada:
+        pass
+
+    import sympy
+    x = sympy.Symbol('x')
+    expr = sympy.sympify(func_str)  # Convierte el string en una expresión simbólica
+    coeficientes = _coeficientes(expr, x)
+    if coeficientes is not None and expr == sympy.expand(expr):
+        return _horner(coeficientes)
+    return sympy.lambdify(x, expr, modulo)
+
 
 def parse_function(func_str):
     """
     Convierte la cadena de texto 'func_str' en una función evaluable f(x).
     Uso típico: f(x) = x**2 - 4
     """
-    x = sympy.Symbol('x')
-    expr = sympy.sympify(func_str)  # Convierte el string en una expresión simbólica
-    f = sympy.lambdify(x, expr, 'math')
-    return f
+    return _compilar(func_str, 'math')
+
 
 def parse_function_g(func_str):
     """
@@ -18,17 +81,171 @@ def parse_function_g(func_str):
     Uso típico: x = g(x).
     Ejemplo: g(x) = cos(x).
     """
-    x = sympy.Symbol('x')
-    expr = sympy.sympify(func_str)
-    g = sympy.lambdify(x, expr, 'math')
-    return g
+    return _compilar(func_str, 'math')
+
 
 def parse_derivative(deriv_str):
     """
     Convierte la cadena de texto 'deriv_str' en la derivada df(x).
     Uso típico: si f(x) = x**2 - 4, entonces deriv_str = "2*x".
     """
+    return _compilar(deriv_str, 'math')
+
+
+def parse_function_vectorizada(func_str):
+    """
+    Convierte la cadena de texto 'func_str' en una función f(x) que acepta arreglos de NumPy.
+    Se usa para muestrear la función sobre muchos puntos en una sola llamada
+    (por ejemplo, en la búsqueda automática de intervalos).
+    """
+    return _compilar(func_str, 'numpy')
+
+
+@lru_cache(maxsize=256)
+def parse_polinomio(func_str):
+    """
+    Detecta si la cadena de texto 'func_str' es un polinomio en x.
+    Retorna la tupla de coeficientes (grado mayor primero) o None si no es un polinomio.
+    Ejemplo: "x**2 - 4" -> (1.0, 0.0, -4.0).
+    """
+    try:
+        coeficientes, _ = expresiones.coeficientes_polinomio(func_str)
+        return tuple(coeficientes) if coeficientes is not None else None
+    except expresiones.ExpresionNoSoportada:
+        pass
+
+    import sympy
     x = sympy.Symbol('x')
-    expr = sympy.sympify(deriv_str)
-    df = sympy.lambdify(x, expr, 'math')
-    return df
+    coeficientes = _coeficientes(sympy.sympify(func_str), x)
+    # Se retorna una tupla para que el valor guardado en caché no pueda modificarse
+    return tuple(coeficientes) if coeficientes is not None else None
+
+
+def _ecuaciones(texto):
+    """
+    Separa un sistema escrito como texto en sus ecuaciones (separadas por ";" o por saltos de línea)
+    o valida una lista de ecuaciones. Cada ecuación "izquierda = derecha" se convierte en
+    "(izquierda) - (derecha)"; sin "=" se entiende igualada a cero.
+    """
+    partes = texto if isinstance(texto, (list, tuple)) else str(texto).replace("\n", ";").split(";")
+    ecuaciones = []
+    for parte in partes:
+        if not isinstance(parte, str):
+            raise ValueError("Cada ecuación del sistema debe ser un texto.")
+        if not parte.strip():
+            continue
+        lados = parte.split("=")
+        if len(lados) > 2:
+            raise ValueError("Ecuación inválida: {}.".format(parte.strip()))
+        ecuaciones.append(parte if len(lados) == 1 else "({}) - ({})".format(*lados))
+    if not ecuaciones:
+        raise ValueError("El sistema no tiene ecuaciones.")
+    return tuple(ecuaciones)
+
+
+def _orden_natural(nombre):
+    # x2 antes que x10
+    return [int(parte) if parte.isdigit() else parte for parte in re.split(r"(\d+)", nombre)]
+
+
+_OPERADORES_SYMPY = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Pow: operator.pow, ast.Mod: operator.mod,
+}
+
+
+def _a_sympy(nodo, simbolos):
+    """Convierte un árbol validado por utils.expresiones en una expresión de SymPy (sin usar eval)."""
+    import sympy
+    if isinstance(nodo, ast.Expression):
+        return _a_sympy(nodo.body, simbolos)
+    if isinstance(nodo, ast.Constant):
+        return sympy.Integer(nodo.value) if isinstance(nodo.value, int) else sympy.Float(nodo.value)
+    if isinstance(nodo, ast.Name):
+        return {"pi": sympy.pi, "E": sympy.E}.get(nodo.id) or simbolos[nodo.id]
+    if isinstance(nodo, ast.UnaryOp):
+        operando = _a_sympy(nodo.operand, simbolos)
+        return -operando if isinstance(nodo.op, ast.USub) else operando
+    if isinstance(nodo, ast.BinOp):
+        izquierda, derecha = _a_sympy(nodo.left, simbolos), _a_sympy(nodo.right, simbolos)
+        return _OPERADORES_SYMPY[type(nodo.op)](izquierda, derecha)
+    argumentos = [_a_sympy(argumento, simbolos) for argumento in nodo.args]
+    nombre = {"ln": "log", "abs": "Abs"}.get(nodo.func.id, nodo.func.id)
+    return getattr(sympy, nombre)(*argumentos)
+
+
+def parse_sistema(ecuaciones, variables=None):
+    """
+    Convierte un sistema de ecuaciones no lineales en funciones evaluables F(x) y (F(x), J(x)).
+
+    El jacobiano se deriva simbólicamente una sola vez (solo las entradas distintas de cero) y F y J se
+    compilan juntos en una sola función con eliminación de subexpresiones comunes (lambdify con cse),
+    de modo que los términos compartidos entre F y J se calculan una vez por iteración. Cada llamada
+    evalúa las entradas con math y las ensambla en arreglos de NumPy. Los sistemas compilados se guardan
+    en caché, igual que las funciones de una variable.
+
+    Parámetros:
+        ecuaciones (str | list[str]): Ecuaciones separadas por ";" o por saltos de línea, o una lista
+            de ecuaciones. Ejemplo: "x**2 + y**2 = 4; x*y = 1".
+        variables (str | list[str], opcional): Orden de las incógnitas, por ejemplo "x, y". Por defecto,
+            los nombres que aparecen en las ecuaciones en orden alfabético (x2 antes que x10).
+
+    Retorna:
+        tuple: (F, FJ, variables), donde F(x) retorna el arreglo de residuos (n,), FJ(x) retorna
+            (F(x), J(x)) con J de tamaño (n, n), y variables es la tupla con el nombre de cada incógnita.
+
+    Excepciones:
+        ValueError: Si alguna ecuación no es válida o el número de ecuaciones no coincide con el de incógnitas.
+    """
+    if isinstance(variables, str):
+        variables = [v for v in re.split(r"[\s,;]+", variables) if v]
+    return _compilar_sistema(_ecuaciones(ecuaciones), tuple(variables) if variables else None)
+
+
+@lru_cache(maxsize=32)
+def _compilar_sistema(ecuaciones, variables):
+    arboles = [expresiones.analizar(ecuacion, variables) for ecuacion in ecuaciones]
+    if variables is None:
+        variables = tuple(sorted(set().union(*map(expresiones.variables, arboles)), key=_orden_natural))
+    if len(variables) != len(ecuaciones) or len(set(variables)) != len(variables):
+        raise ValueError("El sistema debe tener tantas ecuaciones ({}) como incógnitas distintas ({}).".format(
+            len(ecuaciones), len(set(variables))))
+
+    import numpy as np
+    import sympy
+    # Símbolos internos (v0, v1, ...): los nombres del usuario nunca llegan al código que genera lambdify.
+    # Son reales para que SymPy derive abs(x) como sign(x) y no deje una Derivative que lambdify no imprime.
+    simbolos = {nombre: sympy.Symbol("v{}".format(j), real=True) for j, nombre in enumerate(variables)}
+    funciones = [_a_sympy(arbol, simbolos) for arbol in arboles]
+    # Solo se derivan (y se evalúan en cada iteración) las entradas del jacobiano que no son cero. Cada
+    # derivada parcial se calcula sobre los términos de la suma que contienen a la variable: en un sistema
+    # denso como n - Σ cos(x_j) + ... la derivada respecto de x_j no recorre los n términos de la suma.
+    filas, columnas, derivadas = [], [], []
+    for i, funcion in enumerate(funciones):
+        terminos = {}
+        for termino in sympy.Add.make_args(funcion):
+            for simbolo in termino.free_symbols:
+                terminos.setdefault(simbolo, []).append(termino)
+        for j, nombre in enumerate(variables):
+            if simbolos[nombre] in terminos:
+                derivada = sympy.diff(sympy.Add(*terminos[simbolos[nombre]]), simbolos[nombre])
+                if derivada != 0:
+                    filas.append(i)
+                    columnas.append(j)
+                    derivadas.append(derivada)
+
+    argumentos = [[simbolos[nombre] for nombre in variables]]
+    solo_f = sympy.lambdify(argumentos, funciones, "math", cse=True)
+    f_y_j = sympy.lambdify(argumentos, funciones + derivadas, "math", cse=True)
+    n = len(variables)
+
+    def F(x):
+        return np.array(solo_f(x), dtype=float)
+
+    def FJ(x):
+        valores = np.array(f_y_j(x), dtype=float)
+        jacobiano = np.zeros((n, n))
+        jacobiano[filas, columnas] = valores[n:]
+        return valores[:n], jacobiano
+
+    return F, FJ, variables
@@ -1,57 +1,270 @@
 # utils/plot.py
 
-import sympy
-import matplotlib
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-matplotlib.use('Agg')  # Para que se ejecute en entornos sin interfaz gráfica (e.g., servidores)
-import matplotlib.pyplot as plt
 import numpy as np
-import os
+
+from utils.parser import parse_function_vectorizada
+
+# Carpeta donde se guardan las imágenes generadas (static/img de la aplicación)
+DIRECTORIO_GRAFICAS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static', 'img')
+# Número máximo de imágenes en disco; al superarlo se eliminan las usadas hace más tiempo (LRU)
+MAX_GRAFICAS = 200
+# Segundos tras los cuales un archivo temporal (.tmp) se considera abandonado por un dibujo que falló
+# o por un proceso que terminó a mitad de la escritura, y se elimina
+MAX_EDAD_TEMPORAL = 300
+
+_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='graficas')
+_pendientes = {}  # nombre de archivo -> Future de la gráfica que se está generando
+_candado = threading.Lock()
+
+
+def nombre_grafica(func_str, a, b, root):
+    """
+    Retorna el nombre de archivo de la gráfica, derivado del contenido (función, intervalo y raíces).
+    La misma combinación siempre produce el mismo nombre, por lo que se reutiliza la imagen ya generada.
+    """
+    raices = [float(r) for r in np.atleast_1d(np.asarray(root, dtype=float))]
+    clave = repr((func_str.strip(), float(a), float(b), raices))
+    return hashlib.sha256(clave.encode('utf-8')).hexdigest()[:24] + '.png'
+
+
+def _renderizar(func_str, a, b, root, ruta):
+    """
+    Dibuja la función en [a, b] marcando las raíces y guarda la imagen en 'ruta'.
+    Se escribe primero en un archivo temporal para que nunca se sirva una imagen incompleta.
+    """
+    f = parse_function_vectorizada(func_str)  # Función que trabaja con arrays de NumPy
+
+    # Crear un rango de valores entre a y b
+    X = np.linspace(a, b, 300)
+    with np.errstate(all='ignore'):
+        Y = np.broadcast_to(f(X), X.shape)
+
+    # Se usa la API orientada a objetos (Figure + lienzo Agg) en lugar de pyplot: no hay estado global,
+    # así que varias gráficas se pueden generar a la vez desde distintos hilos. Matplotlib se importa
+    # aquí, en la primera imagen, porque por defecto las gráficas se dibujan en el navegador.
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.axhline(0, color='black', linewidth=1)  # Eje X
+    ax.plot(X, Y, label='f(x)')
+
+    # Marcar la raíz (o las raíces) en el gráfico
+    raices = np.atleast_1d(np.asarray(root, dtype=float))
+    ax.plot(raices, np.broadcast_to(f(raices), raices.shape), 'ro', label='Raíz aproximada')
+
+    ax.set_title('Gráfica de la función')
+    ax.set_xlabel('x')
+    ax.set_ylabel('f(x)')
+    ax.legend()
+
+    temporal = '{}.{}.tmp'.format(ruta, threading.get_ident())
+    try:
+        fig.savefig(temporal, format='png')
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def precargar():
+    """Importa Matplotlib de antemano (para generar las imágenes PNG sin demora en la primera solicitud)."""
+    import matplotlib.figure
+    import matplotlib.backends.backend_agg
+
+
+def _eliminar(ruta):
+    try:
+        os.remove(ruta)
+    except FileNotFoundError:
+        pass
+
+
+def _podar_cache():
+    """
+    Elimina las imágenes menos usadas recientemente cuando hay más de MAX_GRAFICAS en disco.
+    El uso se registra en la fecha de modificación, que se actualiza en cada acierto de la caché.
+    En el mismo recorrido se eliminan los archivos temporales con más de MAX_EDAD_TEMPORAL segundos.
+    """
+    try:
+        entradas = list(os.scandir(DIRECTORIO_GRAFICAS))
+    except FileNotFoundError:
+        return
+    limite_temporal = time.time() - MAX_EDAD_TEMPORAL
+    archivos = []
+    for entrada in entradas:
+        try:
+            if entrada.name.endswith('.png'):
+                archivos.append((entrada.stat().st_mtime, entrada.path))
+            elif entrada.name.endswith('.tmp') and entrada.stat().st_mtime < limite_temporal:
+                _eliminar(entrada.path)
+        except FileNotFoundError:
+            pass  # Se eliminó o se renombró durante el recorrido
+    if len(archivos) <= MAX_GRAFICAS:
+        return
+    archivos.sort()
+    for _, ruta in archivos[:len(archivos) - MAX_GRAFICAS]:
+        _eliminar(ruta)
+
+
+def _terminar(nombre, futuro):
+    with _candado:
+        _pendientes.pop(nombre, None)
+    _podar_cache()  # También tras un fallo, para retirar los temporales abandonados
 
 
-def generate_plot(func_str, a, b, root, filename='resultado.png'):
+def generate_plot(func_str, a, b, root):
     """
-    Genera un gráfico de la función en el intervalo [a, b] y marca la raíz aproximada 'root'.
-    Guarda la imagen en 'static/img/filename' y retorna la ruta relativa al archivo.
+    Programa la generación de la gráfica de la función en el intervalo [a, b] marcando la raíz aproximada
+    'root' (o todas las raíces, si 'root' es una lista) y retorna de inmediato el nombre de la imagen.
+
+    La imagen se dibuja en segundo plano en un pool de hilos y se guarda en 'static/img/<nombre>', donde
+    el nombre depende del contenido de la gráfica: solicitudes idénticas reutilizan la imagen existente y
+    usuarios distintos nunca sobrescriben la gráfica de otro. Use esperar_grafica antes de servirla.
 
     Parámetros:
         func_str (str): Cadena de texto que representa la función (ej. "x**2 - 4").
         a (float): Límite inferior del intervalo.
         b (float): Límite superior del intervalo.
-        root (float): Raíz aproximada donde se marcará un punto.
-        filename (str): Nombre de la imagen resultante.
+        root (float | list[float]): Raíz aproximada (o lista de raíces) donde se marcará un punto.
 
     Retorna:
-        str: Ruta relativa donde se guardó la imagen (por ejemplo, "static/img/resultado.png").
+        str: Nombre del archivo de la imagen dentro de 'static/img' (por ejemplo, "3f2a...c9.png").
     """
-    # Convertir la cadena en una expresión evaluable con sympy
-    x = sympy.Symbol('x')
-    expr = sympy.sympify(func_str)
-    f = sympy.lambdify(x, expr, 'numpy')  # Usamos 'numpy' para trabajar con arrays
+    nombre = nombre_grafica(func_str, a, b, root)
+    ruta = os.path.join(DIRECTORIO_GRAFICAS, nombre)
 
-    # Crear un rango de valores entre a y b
-    X = np.linspace(a, b, 300)
-    Y = f(X)
+    with _candado:
+        if nombre in _pendientes:
+            return nombre
+        if os.path.exists(ruta):
+            try:
+                os.utime(ruta)  # Acierto de la caché: marcar como usada recientemente
+                return nombre
+            except FileNotFoundError:
+                pass  # Se eliminó entre la comprobación y el acceso; se vuelve a generar
+        os.makedirs(DIRECTORIO_GRAFICAS, exist_ok=True)
+        futuro = _pool.submit(_renderizar, func_str, a, b, root, ruta)
+        _pendientes[nombre] = futuro
+    futuro.add_done_callback(lambda f: _terminar(nombre, f))
+    return nombre
+
+
+def esperar_grafica(nombre, timeout=10):
+    """
+    Espera a que termine de generarse la gráfica 'nombre' (si aún está en proceso).
+
+    Retorna:
+        str | None: Ruta de la imagen en disco, o None si el nombre no es válido o la imagen no existe.
+
+    Excepciones:
+        Exception: La misma excepción producida al dibujar la gráfica, si falló.
+        TimeoutError: Si la gráfica no termina de generarse en 'timeout' segundos.
+    """
+    if os.path.basename(nombre) != nombre or not nombre.endswith('.png'):
+        return None
+    with _candado:
+        futuro = _pendientes.get(nombre)
+    if futuro is not None:
+        futuro.result(timeout)
+    ruta = os.path.join(DIRECTORIO_GRAFICAS, nombre)
+    return ruta if os.path.exists(ruta) else None
+
+
+def muestrear_funcion(func_str, a, b, root=(), n_puntos=200, niveles=6, max_puntos=2000):
+    """
+    Calcula los puntos (x, f(x)) necesarios para que el navegador dibuje la función en [a, b].
+
+    Se parte de una malla uniforme de n_puntos y, en cada uno de los 'niveles' de refinamiento, se insertan
+    (de forma vectorizada) los puntos medios de los segmentos donde el trazo lineal no es fiel:
+    cambios de signo (cerca de las raíces), segmentos con curvatura apreciable y saltos bruscos o valores
+    no finitos (discontinuidades). Los saltos que persisten tras refinar se marcan con un valor nulo para
+    que el navegador corte la línea en lugar de unir los dos lados de un polo.
+
+    Parámetros:
+        func_str (str): Cadena de texto que representa la función (ej. "x**2 - 4").
+        a (float): Límite inferior del intervalo.
+        b (float): Límite superior del intervalo.
+        root (list[float], opcional): Raíces a marcar en la gráfica.
+        n_puntos (int, opcional): Número de puntos de la malla uniforme inicial. Por defecto es 200.
+        niveles (int, opcional): Número máximo de rondas de refinamiento. Por defecto es 6.
+        max_puntos (int, opcional): Número máximo de puntos retornados. Por defecto es 2000.
+
+    Retorna:
+        dict: Diccionario serializable a JSON con las claves:
+            - "x": Lista de abscisas ordenadas.
+            - "y": Lista de valores f(x) (None donde la función no es finita o hay una discontinuidad).
+            - "raices": Lista de puntos {"x", "y"} a marcar.
+            - "y_min", "y_max": Rango vertical sugerido (sin los valores extremos cercanos a los polos).
+
+    Excepciones:
+        ValueError: Si a >= b.
+    """
+    if a >= b:
+        raise ValueError("El límite inferior a debe ser menor que el límite superior b.")
+    f = parse_function_vectorizada(func_str)
 
-    # Crear la figura
-    plt.figure()
-    plt.axhline(0, color='black', linewidth=1)  # Eje X
-    plt.plot(X, Y, label='f(x)')
+    def evaluar(x):
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape).copy()
 
-    # Marcar la raíz en el gráfico
-    plt.plot(root, f(root), 'ro', label='Raíz aproximada')
+    X = np.linspace(a, b, n_puntos)
+    Y = evaluar(X)
 
-    plt.title('Gráfica de la función')
-    plt.xlabel('x')
-    plt.ylabel('f(x)')
-    plt.legend()
+    # Rango vertical "robusto" tomado de la malla uniforme: ignora los valores extremos de los polos
+    # (el refinamiento concentra puntos cerca de ellos y distorsionaría los percentiles)
+    finito = np.isfinite(Y)
+    y_min, y_max = (np.percentile(Y[finito], [2, 98]) if finito.any() else (-1.0, 1.0))
+    margen = (y_max - y_min) * 0.1 or 1.0
+    y_min, y_max = y_min - margen, y_max + margen
+    escala = y_max - y_min
 
-    # Ruta para guardar la imagen
-    plot_path = os.path.join('static', 'img', filename)
+    for _ in range(niveles):
+        finito = np.isfinite(Y)
+        medio = (X[:-1] + X[1:]) / 2.0
+        y_medio = evaluar(medio)
+        lineal = (Y[:-1] + Y[1:]) / 2.0
+        with np.errstate(invalid='ignore'):
+            refinar = (
+                (np.sign(Y[:-1]) * np.sign(Y[1:]) < 0)              # raíz o polo
+                | (finito[:-1] != finito[1:])                       # borde del dominio
+                | (np.abs(y_medio - lineal) > 0.002 * escala)      # curvatura
+                | (np.abs(Y[1:] - Y[:-1]) > 0.25 * escala)         # salto brusco
+            )
+        refinar &= np.isfinite(y_medio) | finito[:-1] | finito[1:]
+        nuevos = np.nonzero(refinar)[0]
+        if nuevos.size == 0 or X.size + nuevos.size > max_puntos:
+            break
+        X = np.insert(X, nuevos + 1, medio[nuevos])
+        Y = np.insert(Y, nuevos + 1, y_medio[nuevos])
 
-    # Guardar la imagen y cerrar la figura
-    plt.savefig(plot_path)
-    plt.close()
+    # Un cambio de signo que cruza todo el rango visible tras refinar es un polo: se corta la línea
+    with np.errstate(invalid='ignore'):
+        salto = (np.abs(np.diff(Y)) > escala) & (np.sign(Y[:-1]) * np.sign(Y[1:]) < 0)
+    puntos_y = [float(v) if np.isfinite(v) else None for v in Y]
+    puntos_x = [float(v) for v in X]
+    for i in np.nonzero(salto)[0][::-1]:
+        # Se inserta un punto nulo entre los dos lados de la discontinuidad
+        puntos_x.insert(i + 1, float((X[i] + X[i + 1]) / 2.0))
+        puntos_y.insert(i + 1, None)
 
-    # Retornar la ruta relativa para usarla en la plantilla
-    return plot_path
+    raices = np.atleast_1d(np.asarray(root, dtype=float))
+    y_raices = evaluar(raices) if raices.size else raices
+    return {
+        "x": puntos_x,
+        "y": puntos_y,
+        "raices": [{"x": float(r), "y": float(v) if np.isfinite(v) else None} for r, v in zip(raices, y_raices)],
+        "y_min": float(y_min),
+        "y_max": float(y_max)
+    }
@@ -0,0 +1,449 @@
+# utils/resolver.py
+
+import math
+import re
+import time
+from collections import deque
+
+from methods.biseccion import biseccion_iter
+from methods.falsa_posicion import falsa_posicion_iter
+from methods.punto_fijo import punto_fijo_iter
+from methods.newton_raphson import newton_raphson_iter
+from methods.secante import secante_iter
+from methods.newton_seguro import newton_seguro_iter
+from methods.punto_fijo_seguro import punto_fijo_seguro_iter
+from methods.punto_fijo_acelerado import punto_fijo_acelerado_iter
+from utils.parser import (parse_function, parse_function_g, parse_derivative, parse_function_vectorizada,
+                          parse_polinomio, parse_sistema)
+from utils.trazas import recolectar, ResumenTraza, TrazaCompacta
+
+# Métodos que acepta resolver_problema (campo "metodo" de la especificación)
+METODOS = ("biseccion", "falsa_posicion", "punto_fijo", "punto_fijo_aitken", "punto_fijo_steffensen",
+           "newton_raphson", "secante", "newton_seguro", "punto_fijo_seguro", "buscar_raices", "polinomio",
+           "newton_sistemas", "broyden")
+# Métodos que producen sus iteraciones una a una (ver iterar_problema)
+METODOS_ITERATIVOS = ("biseccion", "falsa_posicion", "punto_fijo", "punto_fijo_aitken", "punto_fijo_steffensen",
+                      "newton_raphson", "secante", "newton_seguro", "punto_fijo_seguro",
+                      "newton_sistemas", "broyden")
+# Métodos cuya función ingresada es g(x) de la forma x = g(x)
+METODOS_PUNTO_FIJO = ("punto_fijo", "punto_fijo_aitken", "punto_fijo_steffensen", "punto_fijo_seguro")
+# Métodos para sistemas de ecuaciones: "funcion" contiene varias ecuaciones y x0 es un vector
+METODOS_SISTEMAS = ("newton_sistemas", "broyden")
+# Los métodos vectorizados (buscar_raices y polinomio) y los de sistemas de ecuaciones usan NumPy; se importan
+# en su primer uso (o en precargar) para que el arranque de la aplicación no pague la importación de NumPy.
+
+
+class ContadorEvaluaciones:
+    """
+    Envuelve una función para contar cuántas veces se evalúa. Si la función recibe un arreglo de NumPy
+    se cuenta una evaluación por cada elemento, para que los métodos vectorizados sean comparables.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.evaluaciones = 0
+
+    def __call__(self, x):
+        self.evaluaciones += getattr(x, "size", 1)  # Número de elementos de un arreglo de NumPy
+        return self.f(x)
+
+
+def precargar():
+    """
+    Importa los módulos pesados (NumPy y los métodos vectorizados) y compila una expresión de prueba,
+    para que la primera solicitud no pague ese costo. Se usa al iniciar los procesos de cálculo y en el
+    gancho de precarga de la aplicación.
+    """
+    import methods.busqueda_raices
+    import methods.polinomio
+    parse_function("x**2 - 4")
+    parse_function_vectorizada("x**2 - 4")
+
+
+def _numero(spec, campo, tipo=float, defecto=None):
+    """Lee el campo numérico 'campo' de la especificación; lanza ValueError si falta o no es válido."""
+    valor = spec.get(campo)
+    if valor is None or valor == "":
+        if defecto is not None:
+            return defecto
+        raise ValueError("Falta el campo '{}'.".format(campo))
+    try:
+        return tipo(valor)
+    except (TypeError, ValueError):
+        raise ValueError("El campo '{}' debe ser numérico.".format(campo))
+
+
+def bandera(valor):
+    """
+    Interpreta un campo booleano: true/false en JSON, o texto desde un formulario o una URL
+    ("on", "true", "1", "sí" activan la opción; "false", "0", "off" o vacío la desactivan).
+    """
+    if isinstance(valor, str):
+        return valor.strip().lower() in ("1", "true", "on", "si", "sí", "yes")
+    return bool(valor)
+
+
+def componentes_vector(valor):
+    """
+    Separa un vector escrito como texto ("1, 2.5", "1; 2.5" o "1 2.5") en sus componentes. Un separador
+    sin número a uno de sus lados ("1,,2" o "1, 2,") deja un componente vacío, que _vector rechaza.
+    """
+    if isinstance(valor, str):
+        return re.split(r"\s*[,;]\s*|\s+", valor.strip())
+    return valor
+
+
+def _vector(spec, campo, n):
+    """
+    Lee el campo vectorial 'campo' (una lista o un texto como "1, 2.5") con n componentes;
+    lanza ValueError si falta o no es válido.
+    """
+    valor = spec.get(campo)
+    if valor is None or valor == "":
+        raise ValueError("Falta el campo '{}'.".format(campo))
+    valor = componentes_vector(valor)
+    try:
+        if isinstance(valor, dict) or any(isinstance(componente, (bool, list, dict)) for componente in valor):
+            raise TypeError
+        vector = [float(componente) for componente in valor]
+    except (TypeError, ValueError):
+        raise ValueError("El campo '{}' debe ser una lista de números.".format(campo))
+    if not all(map(math.isfinite, vector)):
+        raise ValueError("El campo '{}' solo admite números finitos.".format(campo))
+    if len(vector) != n:
+        raise ValueError("El campo '{}' debe tener {} componentes (una por incógnita).".format(campo, n))
+    return vector
+
+
+def _validar(spec):
+    """Valida los campos comunes de la especificación y retorna (metodo, funcion, tolerancia, max_iter)."""
+    metodo = spec.get("metodo")
+    funcion_input = spec.get("funcion")
+    if metodo not in METODOS:
+        raise ValueError("Método no reconocido: {}.".format(metodo))
+    if not funcion_input:
+        raise ValueError("Falta el campo 'funcion'.")
+    tol = _numero(spec, "tolerancia")
+    max_iter = _numero(spec, "max_iter", int, 100)
+    return metodo, funcion_input, tol, max_iter
+
+
+def _generador_iteraciones(metodo, spec, funcion_input, tol, max_iter):
+    """
+    Prepara un método iterativo y retorna (generador de iteraciones, contadores de evaluaciones).
+    El primer contador envuelve a f (o a g en punto fijo).
+    """
+    if metodo in ("biseccion", "falsa_posicion"):
+        a = _numero(spec, "a")
+        b = _numero(spec, "b")
+        f = ContadorEvaluaciones(parse_function(funcion_input))
+        metodo_cerrado = biseccion_iter if metodo == "biseccion" else falsa_posicion_iter
+        return metodo_cerrado(f, a, b, tol, max_iter), [f]
+
+    if metodo == "punto_fijo":
+        # La función ingresada es g(x) de la forma x = g(x)
+        x0 = _numero(spec, "x0")
+        g = ContadorEvaluaciones(parse_function_g(funcion_input))
+        return punto_fijo_iter(g, x0, tol, max_iter), [g]
+
+    if metodo in ("punto_fijo_aitken", "punto_fijo_steffensen"):
+        # Punto fijo acelerado con el proceso Δ² de Aitken (o su variante de Steffensen)
+        x0 = _numero(spec, "x0")
+        g = ContadorEvaluaciones(parse_function_g(funcion_input))
+        aceleracion = metodo[len("punto_fijo_"):]
+        return punto_fijo_acelerado_iter(g, x0, tol, max_iter, aceleracion), [g]
+
+    if metodo == "newton_raphson":
+        x0 = _numero(spec, "x0")
+        if not spec.get("derivada"):
+            raise ValueError("Falta el campo 'derivada'.")
+        f = ContadorEvaluaciones(parse_function(funcion_input))
+        df = ContadorEvaluaciones(parse_derivative(spec.get("derivada")))
+        return newton_raphson_iter(f, df, x0, tol, max_iter), [f, df]
+
+    if metodo == "newton_seguro":
+        # Newton (o secante, sin derivada) con bisección como salvaguarda dentro de [a, b]
+        a = _numero(spec, "a")
+        b = _numero(spec, "b")
+        x0 = _numero(spec, "x0") if spec.get("x0") not in (None, "") else None
+        f = ContadorEvaluaciones(parse_function(funcion_input))
+        contadores = [f]
+        df = None
+        if spec.get("derivada"):
+            df = ContadorEvaluaciones(parse_derivative(spec.get("derivada")))
+            contadores.append(df)
+        return newton_seguro_iter(f, a, b, tol, max_iter, df, x0), contadores
+
+    if metodo == "punto_fijo_seguro":
+        # La función ingresada es g(x); la salvaguarda hace bisección sobre g(x) - x en [a, b]
+        a = _numero(spec, "a")
+        b = _numero(spec, "b")
+        x0 = _numero(spec, "x0") if spec.get("x0") not in (None, "") else None
+        g = ContadorEvaluaciones(parse_function_g(funcion_input))
+        return punto_fijo_seguro_iter(g, a, b, tol, max_iter, x0), [g]
+
+    if metodo in METODOS_SISTEMAS:
+        # Sistema de ecuaciones: F y el jacobiano se compilan juntos a partir de las ecuaciones.
+        # Cada evaluación de F cuenta n evaluaciones (una por ecuación).
+        from methods.newton_sistemas import newton_sistemas_iter, broyden_iter
+        f, fj, variables = parse_sistema(funcion_input, spec.get("variables"))
+        x0 = _vector(spec, "x0", len(variables))
+        f = ContadorEvaluaciones(f)
+        fj = ContadorEvaluaciones(fj)
+        if metodo == "newton_sistemas":
+            return newton_sistemas_iter(fj, x0, tol, max_iter, f), [f, fj]
+        return broyden_iter(f, x0, tol, max_iter, fj), [f, fj]
+
+    # Secante
+    x0 = _numero(spec, "x0")
+    x1 = _numero(spec, "x1")
+    f = ContadorEvaluaciones(parse_function(funcion_input))
+    return secante_iter(f, x0, x1, tol, max_iter), [f]
+
+
+def _registrar_aproximaciones(iteraciones, clave, ventana):
+    """Deja pasar las iteraciones guardando en 'ventana' (deque acotada) las últimas aproximaciones."""
+    for fila in iteraciones:
+        ventana.append(fila[clave])
+        yield fila
+
+
+def _norma(valor):
+    # Valor absoluto de un número o norma infinito de una lista
+    return max(map(abs, valor)) if isinstance(valor, list) else abs(valor)
+
+
+def orden_convergencia(aproximaciones):
+    """
+    Estima el orden de convergencia observado a partir de las últimas aproximaciones x_k:
+        q ≈ log(d_{k+1} / d_k) / log(d_k / d_{k-1}),   con d_k = |x_k - x_{k-1}|
+    (en norma infinito si las aproximaciones son vectores, como en los sistemas de ecuaciones).
+    Se usa la terna de diferencias más reciente que sea decreciente y no esté dominada por el redondeo.
+    Retorna None si no hay suficientes aproximaciones (por ejemplo, si el método terminó en pocos pasos).
+    """
+    x = list(aproximaciones)
+    d = [_norma([a - b for a, b in zip(x2, x1)] if isinstance(x2, list) else x2 - x1) for x1, x2 in zip(x, x[1:])]
+    for k in range(len(d) - 1, 1, -1):
+        d1, d2, d3 = d[k - 2], d[k - 1], d[k]
+        if 64 * 2.2e-16 * max(1.0, _norma(x[k + 1])) < d3 < d2 < d1:
+            return math.log(d3 / d2) / math.log(d2 / d1)
+    return None
+
+
+def intervalo_grafica(spec, raiz):
+    """
+    Retorna (a, b, raíces reales) para graficar el resultado: el intervalo ingresado por el usuario
+    en los métodos que lo usan, o uno alrededor de la(s) raíz(ces) en el resto.
+    Retorna None en los sistemas de ecuaciones, que no tienen una gráfica de una variable.
+    """
+    metodo = spec.get("metodo")
+    if metodo in METODOS_SISTEMAS:
+        return None
+    reales = [r for r in (raiz if isinstance(raiz, list) else [raiz]) if not isinstance(r, complex)]
+    if metodo in ("biseccion", "falsa_posicion", "newton_seguro", "punto_fijo_seguro", "buscar_raices"):
+        return _numero(spec, "a"), _numero(spec, "b"), reales
+    if metodo == "polinomio":
+        a = _numero(spec, "a", defecto=min(reales) - 1 if reales else -5.0)
+        b = _numero(spec, "b", defecto=max(reales) + 1 if reales else 5.0)
+        return a, b, [xr for xr in reales if a <= xr <= b]
+    return raiz - 5, raiz + 5, reales
+
+
+def iterar_problema(spec):
+    """
+    Valida la especificación de inmediato y retorna un generador con las filas de la tabla de resultados.
+    En los métodos iterativos cada fila se produce en cuanto se calcula, sin guardar la tabla completa;
+    "buscar_raices" y "polinomio" calculan todas sus raíces de una vez y luego las producen una a una.
+
+    Excepciones:
+        ValueError: Si el método no es reconocido, falta algún campo o los datos no son válidos.
+    """
+    metodo, funcion_input, tol, max_iter = _validar(spec)
+    if metodo in METODOS_ITERATIVOS:
+        return _generador_iteraciones(metodo, spec, funcion_input, tol, max_iter)[0]
+    return iter(resolver_problema(spec)["datos"])
+
+
+def resolver_problema(spec, incluir_iteraciones=True, traza="completo"):
+    """
+    Resuelve un problema descrito por un diccionario con los mismos campos que el formulario de la aplicación.
+
+    Parámetros:
+        spec (dict): Especificación del problema con las claves:
+            - "metodo": Uno de METODOS.
+            - "funcion": f(x) (o g(x) para los métodos de punto fijo) como cadena de texto. En
+              "newton_sistemas" y "broyden", las ecuaciones del sistema separadas por ";" (o una lista).
+            - "tolerancia": Tolerancia para el error porcentual aproximado.
+            - "max_iter" (opcional): Número máximo de iteraciones. Por defecto es 100.
+            - "a", "b": Intervalo (bisección, falsa posición, búsqueda de raíces y, opcional, polinomio).
+            - "x0", "x1": Aproximaciones iniciales (punto fijo, Newton-Raphson y secante; x0 es opcional
+              en los métodos con salvaguarda y es una lista, o un texto "1, 2", en los sistemas).
+            - "variables" (opcional): Orden de las incógnitas de un sistema, por ejemplo "x, y".
+            - "derivada": Derivada de f (Newton-Raphson; opcional en "newton_seguro", que sin ella usa la secante).
+            - "refinamiento" (opcional): Método cerrado usado por "buscar_raices".
+            - "complejas" (opcional): Incluir raíces complejas en "polinomio".
+        incluir_iteraciones (bool, opcional): Si es False no se incluye la tabla de iteraciones en el resultado.
+        traza (str, opcional): Cómo se guarda la tabla de los métodos iterativos cuando se incluye: "completo"
+            (lista de diccionarios, por defecto) o "compacto" (TrazaCompacta, ver utils.trazas), que usan
+            los lotes.
+
+    Retorna:
+        dict: Resultado con las claves:
+            - "metodo": Método utilizado.
+            - "raiz": Raíz aproximada (lista de raíces para "buscar_raices" y "polinomio"; vector solución
+              en los sistemas).
+            - "iteraciones": Número de iteraciones realizadas.
+            - "residuo": |f(raiz)| (|g(raiz) - raiz| para punto fijo; el mayor residuo si hay varias raíces
+              o ecuaciones).
+            - "evaluaciones": Número de evaluaciones de la función (y de su derivada).
+            - "orden_convergencia": Orden de convergencia observado en las últimas iteraciones
+              (None si no hay suficientes iteraciones o el método no es iterativo).
+            - "datos": Tabla de iteraciones (solo si incluir_iteraciones es True).
+            - "grafica": Tupla (a, b, raíces) con el intervalo y las raíces a graficar (None en los sistemas).
+            - "tiempos": Segundos dedicados a analizar la función y validar los datos ("parse") y a
+              resolver el problema ("solve"). No se incluye en resultado_json.
+
+    Excepciones:
+        ValueError: Si el método no es reconocido, falta algún campo o los datos no son válidos.
+        Exception: Los errores propios de cada método numérico.
+    """
+    inicio = time.perf_counter()
+    metodo, funcion_input, tol, max_iter = _validar(spec)
+    # Sin tabla de iteraciones solo se conserva la última iteración de los métodos iterativos
+    modo = traza if incluir_iteraciones else "resumen"
+
+    if metodo in METODOS_ITERATIVOS:
+        generador, contadores = _generador_iteraciones(metodo, spec, funcion_input, tol, max_iter)
+        analizado = time.perf_counter()
+        # Se conservan las últimas aproximaciones (en cualquier modo) para estimar el orden de convergencia
+        ventana = deque(maxlen=8)
+        clave = "xr" if metodo in ("biseccion", "falsa_posicion") else "x_new"
+        datos = recolectar(_registrar_aproximaciones(generador, clave, ventana), modo)
+        orden = orden_convergencia(ventana)
+        final = datos[-1]
+        if metodo in ("biseccion", "falsa_posicion"):
+            raiz = final["xr"]
+            residuo = abs(final["fx"])
+        elif metodo in METODOS_PUNTO_FIJO:
+            raiz = final["x_new"]
+            residuo = abs(contadores[0].f(raiz) - raiz)  # |g(x) - x|, sin contarla como evaluación
+        elif metodo in ("newton_raphson", "newton_seguro"):
+            raiz = final["x_new"]
+            residuo = abs(final["f_x"])
+        elif metodo in METODOS_SISTEMAS:
+            raiz = final["x_new"]
+            residuo = final["norma_f"]
+        else:
+            raiz = final["x_new"]
+            residuo = abs(final["f_x_new"])
+        evaluaciones = sum(c.evaluaciones for c in contadores)
+
+    elif metodo == "buscar_raices":
+        # Búsqueda automática de todas las raíces en [a, b]; los intervalos se refinan
+        # con el método cerrado elegido en el campo 'refinamiento' (bisección por defecto)
+        a = _numero(spec, "a")
+        b = _numero(spec, "b")
+        refinamiento = spec.get("refinamiento") or "biseccion"
+        if a >= b:
+            raise ValueError("El límite inferior a debe ser menor que el límite superior b.")
+        coeficientes = parse_polinomio(funcion_input)
+        analizado = time.perf_counter()
+        if coeficientes is not None:
+            from methods.polinomio import raices_polinomio, agrupar_raices_multiples
+            # Los polinomios se resuelven directamente con la matriz compañera; cada raíz múltiple
+            # se reporta una sola vez, igual que en la búsqueda por muestreo
+            datos = [
+                {"a": r["xr"] - r["cota_error"], "b": r["xr"] + r["cota_error"], "xr": r["xr"],
+                 "fx": r["fx"], "ea": None, "iteraciones": 0}
+                for r in agrupar_raices_multiples(raices_polinomio(coeficientes), coeficientes)
+                if a <= r["xr"] <= b
+            ]
+            evaluaciones = 0
+        else:
+            from methods.busqueda_raices import buscar_raices
+            f = ContadorEvaluaciones(parse_function_vectorizada(funcion_input))
+            analizado = time.perf_counter()
+            datos = buscar_raices(f, a, b, tol, max_iter, refinamiento)
+            evaluaciones = f.evaluaciones
+        raiz = [fila["xr"] for fila in datos]
+        residuo = max((abs(fila["fx"]) for fila in datos), default=None)
+        orden = None
+
+    else:
+        # "polinomio": todas las raíces (reales y, opcionalmente, complejas) en una sola llamada
+        coeficientes = parse_polinomio(funcion_input)
+        if coeficientes is None:
+            raise ValueError("La función ingresada no es un polinomio en x.")
+        analizado = time.perf_counter()
+        from methods.polinomio import raices_polinomio
+        datos = raices_polinomio(coeficientes, bandera(spec.get("complejas")))
+        raiz = [fila["xr"] for fila in datos]
+        residuo = max((fila["fx"] for fila in datos), default=None)
+        evaluaciones = 0
+        orden = None
+
+    grafica = intervalo_grafica(spec, raiz)
+
+    if isinstance(datos, ResumenTraza):
+        n_iteraciones = datos.iteraciones
+    elif metodo in ("buscar_raices", "polinomio"):
+        n_iteraciones = sum(fila.get("iteraciones", 0) for fila in datos)
+    else:
+        n_iteraciones = len(datos)
+
+    resultado = {
+        "metodo": metodo,
+        "raiz": raiz,
+        "iteraciones": n_iteraciones,
+        "residuo": residuo,
+        "evaluaciones": evaluaciones,
+        "orden_convergencia": orden,
+        "grafica": grafica,
+        "tiempos": {"parse": analizado - inicio, "solve": time.perf_counter() - analizado},
+    }
+    if incluir_iteraciones:
+        resultado["datos"] = datos
+    return resultado
+
+
+def a_json(valor):
+    """Convierte números complejos y valores no finitos a tipos que admite JSON."""
+    if isinstance(valor, complex):
+        return {"real": valor.real, "imag": valor.imag}
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    if isinstance(valor, dict):
+        return {clave: a_json(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple, TrazaCompacta)):
+        return [a_json(v) for v in valor]
+    return valor
+
+
+def resultado_json(resultado):
+    """
+    Retorna una copia compacta del resultado apta para JSON: sin la información de la gráfica ni los
+    tiempos, con las raíces complejas como {"real", "imag"} y los valores infinitos o NaN como null.
+    """
+    return a_json({clave: valor for clave, valor in resultado.items() if clave not in ("grafica", "tiempos")})
+
+
+def resolver_lote(problemas, incluir_iteraciones=False):
+    """
+    Resuelve una lista de problemas. Las funciones repetidas en el lote se compilan una sola vez
+    (el parser guarda en caché las expresiones ya compiladas) y las tablas de iteraciones se guardan en
+    forma compacta hasta convertirlas a JSON.
+
+    Retorna:
+        list[dict]: Un resultado en formato JSON por problema, en el mismo orden; si un problema falla,
+            su posición contiene {"error": mensaje} y el resto del lote se resuelve igualmente.
+    """
+    resultados = []
+    for spec in problemas:
+        try:
+            if not isinstance(spec, dict):
+                raise ValueError("Cada problema debe ser un objeto JSON.")
+            incluir = spec.get("incluir_iteraciones", incluir_iteraciones)
+            resultados.append(resultado_json(resolver_problema(spec, incluir, "compacto")))
+        except Exception as e:
+            resultados.append({"error": str(e)})
+    return resultados
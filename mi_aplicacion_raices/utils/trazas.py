@@ -0,0 +1,148 @@
+# utils/trazas.py
+#
+# Almacenamiento de las tablas de iteraciones. Cada método iterativo tiene una versión por generador
+# (<método>_iter, por ejemplo biseccion_iter) que valida los datos de inmediato y produce las iteraciones,
+# con los mismos diccionarios que el método, a medida que se calculan, sin guardar la tabla completa.
+# recolectar consume ese generador y guarda las iteraciones en uno de los MODOS: la lista completa, columnas
+# compactas (los lotes de la API) o solo la última iteración (cuando no se pide la tabla).
+
+import math
+from array import array
+
+# Modos de recolectar: la lista de diccionarios de siempre, columnas compactas o solo la última iteración
+MODOS = ("completo", "compacto", "resumen")
+
+
+class TrazaCompacta:
+    """
+    Tabla de iteraciones almacenada por columnas en arreglos array('d') preasignados (8 bytes por valor),
+    en lugar de un diccionario por iteración. Los valores None (por ejemplo, "ea" en la primera iteración)
+    se guardan como NaN y se devuelven como None al leer las filas. Las columnas no numéricas (por ejemplo,
+    "estrategia" en los métodos con salvaguarda) se guardan como listas.
+
+    Parámetros:
+        columnas (list[str]): Nombres de las columnas (las claves de las iteraciones del método).
+        capacidad (int, opcional): Número de filas a reservar de antemano (por ejemplo, max_iter).
+            Si se supera, la capacidad se duplica.
+    """
+
+    __slots__ = ("columnas", "_datos", "_n")
+
+    def __init__(self, columnas, capacidad=64):
+        self.columnas = tuple(columnas)
+        capacidad = max(int(capacidad), 1)
+        self._datos = {c: array('d', bytes(8 * capacidad)) for c in self.columnas}
+        self._n = 0
+
+    def agregar(self, fila):
+        """Agrega una iteración (diccionario con las columnas de la traza)."""
+        if self._n == len(self._datos[self.columnas[0]]):
+            for columna in self._datos.values():
+                columna.extend(columna)  # Duplicar la capacidad reservada
+        for c in self.columnas:
+            valor = fila[c]
+            columna = self._datos[c]
+            if valor is None:
+                valor = math.nan
+            elif isinstance(columna, array) and not isinstance(valor, (int, float)):
+                # Primer valor no numérico de la columna: se pasa a una lista de valores
+                columna = self._datos[c] = [None if math.isnan(v) else v for v in columna]
+            columna[self._n] = valor
+        self._n += 1
+
+    def __len__(self):
+        return self._n
+
+    def columna(self, nombre):
+        """Retorna los valores de una columna como memoryview de floats (sin copiarlos), o una lista si no es numérica."""
+        columna = self._datos[nombre]
+        if isinstance(columna, array):
+            return memoryview(columna)[:self._n]
+        return columna[:self._n]
+
+    def fila(self, i):
+        """Retorna la iteración i como diccionario (admite índices negativos)."""
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("Índice de iteración fuera de rango.")
+        fila = {}
+        for c in self.columnas:
+            valor = self._datos[c][i]
+            fila[c] = None if isinstance(valor, float) and math.isnan(valor) else valor
+        return fila
+
+    def __getitem__(self, i):
+        return self.fila(i)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self.fila(i)
+
+    def a_lista(self):
+        """Convierte la traza en la lista de diccionarios que retornan los métodos."""
+        return list(self)
+
+
+class ResumenTraza:
+    """
+    Conserva solo la última iteración y el número de iteraciones realizadas.
+    Se comporta como una secuencia de una sola fila: resumen[-1] es la iteración final.
+    """
+
+    __slots__ = ("ultima", "iteraciones")
+
+    def __init__(self, ultima, iteraciones):
+        self.ultima = ultima
+        self.iteraciones = iteraciones
+
+    def __len__(self):
+        return 1 if self.ultima is not None else 0
+
+    def __getitem__(self, i):
+        if self.ultima is None or i not in (0, -1):
+            raise IndexError("El resumen solo contiene la última iteración.")
+        return self.ultima
+
+    def __iter__(self):
+        if self.ultima is not None:
+            yield self.ultima
+
+    def a_lista(self):
+        return list(self)
+
+
+def recolectar(iteraciones, modo="completo", capacidad=64):
+    """
+    Consume el generador de un método (por ejemplo, biseccion_iter) y guarda sus iteraciones en el modo indicado.
+
+    Parámetros:
+        iteraciones (iterable[dict]): Iteraciones producidas por el método.
+        modo (str, opcional): Uno de MODOS:
+            - "completo": Lista de diccionarios (lo mismo que retorna el método). Es el modo por defecto.
+            - "compacto": TrazaCompacta con una columna array('d') por clave.
+            - "resumen": ResumenTraza con solo la última iteración y el número de iteraciones.
+        capacidad (int, opcional): Filas a reservar en el modo "compacto" (por ejemplo, max_iter).
+
+    Retorna:
+        list[dict] | TrazaCompacta | ResumenTraza: Las iteraciones en el formato pedido.
+
+    Excepciones:
+        ValueError: Si el modo no es reconocido.
+    """
+    if modo == "completo":
+        return list(iteraciones)
+    if modo == "resumen":
+        ultima = None
+        n = 0
+        for ultima in iteraciones:
+            n += 1
+        return ResumenTraza(ultima, n)
+    if modo == "compacto":
+        traza = None
+        for fila in iteraciones:
+            if traza is None:
+                traza = TrazaCompacta(fila.keys(), capacidad)
+            traza.agregar(fila)
+        return traza if traza is not None else TrazaCompacta((), 1)
+    raise ValueError("Modo de traza no reconocido: {}.".format(modo))